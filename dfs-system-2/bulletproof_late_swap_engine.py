@@ -5,12 +5,16 @@ Production-grade late swap that NEVER uses locked or inactive players
 """
 
 import csv
-import json
 from datetime import datetime, timezone
 import pytz
-from typing import Dict, Set, List, Optional, Tuple, Any
+from typing import Dict, Set, List, Optional
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
+
+from src.io.dk_entries import DKEntriesFile, DKEntriesParser
+from src.optimize.late_swap import parse_game_start
+from src.optimize.lock_schedule import GameLockIndex
 
 class PlayerStatus(Enum):
     ACTIVE = "ACTIVE"
@@ -40,82 +44,71 @@ class PlayerStatusInfo:
     updated: str
 
 class BulletproofLateSwapEngine:
-    def __init__(self, data_mode: str = "online"):
+    def __init__(self, data_mode: str = "online", entries_path: str = 'DKEntries (4).csv'):
         self.data_mode = data_mode
+        self.entries_path = entries_path
+        self.dk_entries: Optional[DKEntriesFile] = None
+        self.pool_index: Dict[int, int] = {}
         self.timezone = pytz.timezone('America/Chicago')
         self.games: Dict[str, Game] = {}
         self.status_map: Dict[str, PlayerStatusInfo] = {}
         self.lock_map: Dict[str, Set[int]] = {}
+        self.player_games: Dict[str, str] = {}
+        self.lock_index: Optional[GameLockIndex] = None
         self.validation_errors: List[str] = []
         
+    def load_dk_entries(self) -> DKEntriesFile:
+        """Parse DKEntries (4).csv once; every step below reads from the parsed tables"""
+        if self.dk_entries is None:
+            self.dk_entries = DKEntriesParser().parse(self.entries_path)
+            self.pool_index = self.dk_entries.pool.index_by_id()
+        return self.dk_entries
+
     def initialize_game_index(self):
         """Build authoritative game index from slate data"""
         print("🕒 BUILDING GAME INDEX...")
+        pool = self.load_dk_entries().pool
         
-        # NFL games for Sep 14, 2025 (from DKEntries data)
-        nfl_games = [
-            Game("PHI@KC", "KC", "PHI", "2025-09-14T21:25:00", "DK"),  # 4:25 PM ET = 9:25 PM UTC
-            Game("DEN@IND", "IND", "DEN", "2025-09-14T21:05:00", "DK"),  # 4:05 PM ET = 9:05 PM UTC  
-            Game("CAR@ARI", "ARI", "CAR", "2025-09-14T21:05:00", "DK"),  # 4:05 PM ET = 9:05 PM UTC
-            Game("InProgress1", "BAL", "CIN", "2025-09-14T17:00:00", "DK"),  # Already started
-            Game("InProgress2", "BUF", "NYJ", "2025-09-14T17:00:00", "DK"),  # Already started
-        ]
+        # Kickoff times come from the player pool's Game Info column
+        for player_id, game_id, game_info in zip(pool.ids, pool.game_ids, pool.game_info):
+            self.player_games[str(player_id)] = game_id
+            start = parse_game_start(game_info)
+            
+            if start and game_id not in self.games and '@' in game_id:
+                away, home = game_id.split('@', 1)
+                self.games[game_id] = Game(game_id, home, away, start.isoformat(), "DK")
         
-        for game in nfl_games:
-            self.games[game.gameId] = game
+        self.lock_index = GameLockIndex(
+            {game_id: datetime.fromisoformat(game.startISO) for game_id, game in self.games.items()},
+            pool.game_ids
+        )
+        self.lock_index.advance(datetime.now(self.timezone))
         
-        print(f"✅ Loaded {len(self.games)} games into index")
+        print(f"✅ Loaded {len(self.games)} games into index ({len(self.lock_index.locked_games)} started)")
 
     def build_status_map(self):
         """Build player status map from DKEntries (4).csv data"""
         print("🚫 BUILDING PLAYER STATUS MAP...")
+        pool = self.load_dk_entries().pool
         
         inactive_count = 0
+        updated = datetime.now(self.timezone).isoformat()
         
-        with open('DKEntries (4).csv', 'r') as f:
-            reader = csv.reader(f)
-            header = next(reader)
+        for player_id, name, avg_points in zip(pool.ids, pool.names, pool.avg_points):
+            player_id = str(player_id)
             
-            for row in reader:
-                if len(row) >= 24 and row[15] and row[17] and row[23]:  # Has position, name, projection
-                    name = row[17].strip()
-                    player_id = row[18].strip() if len(row) > 18 else ''
-                    
-                    try:
-                        avg_points = float(row[23])
-                        
-                        # HARD EXCLUSIONS - Zero or near-zero projections
-                        if avg_points == 0.0:
-                            self.status_map[player_id] = PlayerStatusInfo(
-                                PlayerStatus.INACTIVE, 
-                                "DK Projection Data", 
-                                datetime.now(self.timezone).isoformat()
-                            )
-                            inactive_count += 1
-                            
-                        # Suspiciously low for known players
-                        elif avg_points < 2.0 and name in ['A.J. Brown', 'Cooper Kupp', 'Mark Andrews', 'Xavier Worthy']:
-                            self.status_map[player_id] = PlayerStatusInfo(
-                                PlayerStatus.OUT,
-                                "Low Projection Analysis",
-                                datetime.now(self.timezone).isoformat()
-                            )
-                            inactive_count += 1
-                            
-                        else:
-                            self.status_map[player_id] = PlayerStatusInfo(
-                                PlayerStatus.ACTIVE,
-                                "DK Projection Data", 
-                                datetime.now(self.timezone).isoformat()
-                            )
-                            
-                    except (ValueError, TypeError):
-                        self.status_map[player_id] = PlayerStatusInfo(
-                            PlayerStatus.INACTIVE,
-                            "Invalid Data",
-                            datetime.now(self.timezone).isoformat()
-                        )
-                        inactive_count += 1
+            # HARD EXCLUSIONS - Zero or near-zero projections
+            if avg_points == 0.0:
+                self.status_map[player_id] = PlayerStatusInfo(PlayerStatus.INACTIVE, "DK Projection Data", updated)
+                inactive_count += 1
+                
+            # Suspiciously low for known players
+            elif avg_points < 2.0 and name in ['A.J. Brown', 'Cooper Kupp', 'Mark Andrews', 'Xavier Worthy']:
+                self.status_map[player_id] = PlayerStatusInfo(PlayerStatus.OUT, "Low Projection Analysis", updated)
+                inactive_count += 1
+                
+            else:
+                self.status_map[player_id] = PlayerStatusInfo(PlayerStatus.ACTIVE, "DK Projection Data", updated)
         
         print(f"🚫 Identified {inactive_count} INACTIVE/OUT players")
         print(f"✅ Built status map for {len(self.status_map)} players")
@@ -123,37 +116,20 @@ class BulletproofLateSwapEngine:
     def compute_lock_states(self):
         """Compute which players/slots are locked based on game start times"""
         print("🔒 COMPUTING LOCK STATES...")
+        entries = self.load_dk_entries().entries
         
         now = datetime.now(self.timezone)
-        locked_players = set()
+        self.lock_index.advance(now)
         
-        with open('DKEntries (4).csv', 'r') as f:
-            reader = csv.reader(f)
-            header = next(reader)
-            
-            for row in reader:
-                if len(row) >= 13 and row[0] and row[1]:
-                    entry_id = row[0].strip()
-                    
-                    if entry_id and not entry_id.lower().startswith('position'):
-                        locked_slots = set()
-                        
-                        # Check each position for lock status
-                        lineup_data = row[4:13]  # QB through DST
-                        for i, pos_data in enumerate(lineup_data):
-                            if pos_data and pos_data.strip():
-                                # Check if marked as (LOCKED) or if game started
-                                is_manually_locked = '(LOCKED)' in pos_data
-                                
-                                if is_manually_locked:
-                                    locked_slots.add(i)
-                                    # Extract player for game time check
-                                    clean_data = pos_data.replace(' (LOCKED)', '').strip()
-                                    if '(' in clean_data:
-                                        player_name = clean_data.split('(')[0].strip()
-                                        locked_players.add(player_name)
-                        
-                        self.lock_map[entry_id] = locked_slots
+        # Locked if marked (LOCKED) or the player's game has started
+        started = np.zeros(entries.slot_ids.shape, dtype=bool)
+        for k, row in enumerate(entries.slot_ids):
+            started[k] = [self.player_games.get(str(pid)) in self.lock_index.locked_games for pid in row]
+        locked = entries.locked | (started & (entries.slot_ids > 0))
+        
+        for entry_id, locked_row in zip(entries.entry_ids, locked):
+            self.lock_map[entry_id] = set(np.flatnonzero(locked_row).tolist())
+        locked_players = set(entries.slot_ids[locked].tolist())
         
         print(f"🔒 {len(locked_players)} players in locked slots")
         print(f"📊 Lock states computed for {len(self.lock_map)} entries")
@@ -205,63 +181,52 @@ class BulletproofLateSwapEngine:
 
     def load_entries_with_validation(self):
         """Load entries with full validation"""
+        table = self.load_dk_entries().entries
         entries = []
         
-        with open('DKEntries (4).csv', 'r') as f:
-            reader = csv.reader(f)
-            header = next(reader)
+        for k, entry_id in enumerate(table.entry_ids):
+            if not table.contest_names[k]:
+                continue
+            lineup = self.parse_and_validate_lineup(table.slot_ids[k], table.locked[k], entry_id)
             
-            for row in reader:
-                if len(row) >= 13 and row[0] and row[1] and not row[0].lower().startswith('position'):
-                    entry_id = row[0].strip()
-                    contest_name = row[1].strip()
-                    
-                    if entry_id and contest_name:
-                        lineup = self.parse_and_validate_lineup(row[4:13], entry_id)
-                        
-                        if lineup:
-                            entries.append({
-                                'entry_id': entry_id,
-                                'contest_name': contest_name,
-                                'contest_id': row[2].strip(),
-                                'entry_fee': row[3].strip(),
-                                'lineup': lineup
-                            })
+            if lineup:
+                entries.append({
+                    'entry_id': entry_id,
+                    'contest_name': table.contest_names[k],
+                    'contest_id': table.contest_ids[k],
+                    'entry_fee': table.entry_fees[k],
+                    'lineup': lineup
+                })
         
         print(f"📊 Loaded {len(entries)} valid entries")
         return entries
 
-    def parse_and_validate_lineup(self, lineup_data, entry_id):
+    def parse_and_validate_lineup(self, slot_ids, locked_flags, entry_id):
         """Parse lineup with strict validation"""
         positions = ['QB', 'RB1', 'RB2', 'WR1', 'WR2', 'WR3', 'TE', 'FLEX', 'DST']
+        pool = self.dk_entries.pool
         lineup = {}
         
-        for i, pos_data in enumerate(lineup_data):
-            pos_name = positions[i]
+        for pos_name, slot_id, is_locked in zip(positions, slot_ids, locked_flags):
+            i = self.pool_index.get(int(slot_id))
             
-            if pos_data and pos_data.strip():
-                is_locked = '(LOCKED)' in pos_data
-                clean_data = pos_data.replace(' (LOCKED)', '').strip()
+            if slot_id and i is not None:
+                name = pool.names[i]
+                player_id = str(slot_id)
                 
-                if '(' in clean_data and ')' in clean_data:
-                    name = clean_data.split('(')[0].strip()
-                    player_id = clean_data.split('(')[1].split(')')[0].strip()
-                    
-                    # Validate player status
-                    if player_id in self.status_map:
-                        status = self.status_map[player_id].status
-                        if status in [PlayerStatus.OUT, PlayerStatus.INACTIVE] and not is_locked:
-                            self.validation_errors.append(f"Entry {entry_id}: {name} is {status.value} in {pos_name}")
-                    
-                    lineup[pos_name] = {
-                        'name': name,
-                        'id': player_id,
-                        'locked': is_locked,
-                        'salary': self.get_player_salary(name),
-                        'projection': self.get_player_projection(name)
-                    }
-                else:
-                    lineup[pos_name] = {'name': '', 'id': '', 'locked': False, 'salary': 4000, 'projection': 0}
+                # Validate player status
+                if player_id in self.status_map:
+                    status = self.status_map[player_id].status
+                    if status in [PlayerStatus.OUT, PlayerStatus.INACTIVE] and not is_locked:
+                        self.validation_errors.append(f"Entry {entry_id}: {name} is {status.value} in {pos_name}")
+                
+                lineup[pos_name] = {
+                    'name': name,
+                    'id': player_id,
+                    'locked': bool(is_locked),
+                    'salary': self.get_player_salary(name),
+                    'projection': self.get_player_projection(name)
+                }
             else:
                 lineup[pos_name] = {'name': '', 'id': '', 'locked': False, 'salary': 4000, 'projection': 0}
         
@@ -6,15 +6,17 @@ FastAPI application providing all endpoints for the web interface
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from ...packages.shared.types import Player, Game, Slate, Contest, Lineup, Ruleset, Site, Sport
 from ...services.ingest.data_merger import merge_slate_data
-from ...services.sim.optimizer import optimize_lineups, OptimizationResult
+from ...services.sim.optimizer import optimize_lineups, stream_lineups, OptimizationResult, _hit_time_limit
 from ...services.sim.model import simulate_lineups, MonteCarloSimulator, calculate_overall_score
 
 logger = logging.getLogger(__name__)
@@ -52,6 +54,8 @@ class OptimizationRequest(BaseModel):
     objective: str = "projection"
     randomness: float = 0.1
     contest: Optional[Dict[str, Any]] = None
+    time_limit: Optional[float] = None  # seconds; returns a partial portfolio when hit
+    gap_target: Optional[float] = None  # relative MIP gap for the ILP engine
 
 class SimulationRequest(BaseModel):
     lineup_ids: List[str]
@@ -77,6 +81,7 @@ async def root():
             "/slates/{slate_id}/players",
             "/contests/{contest_id}/payouts",
             "/optimize",
+            "/optimize/stream",
             "/simulate",
             "/health"
         ]
@@ -168,7 +173,9 @@ async def optimize(request: OptimizationRequest, background_tasks: BackgroundTas
             engine=request.engine,
             objective=request.objective,
             randomness=request.randomness,
-            contest=contest
+            contest=contest,
+            time_limit=request.time_limit,
+            gap_target=request.gap_target
         )
 
         # Cache lineups
@@ -180,13 +187,56 @@ async def optimize(request: OptimizationRequest, background_tasks: BackgroundTas
             "total_lineups": result.total_lineups,
             "generation_time": result.generation_time,
             "engine_used": result.engine_used,
-            "constraints_satisfied": result.constraints_satisfied
+            "constraints_satisfied": result.constraints_satisfied,
+            "timed_out": result.timed_out
         }
 
     except Exception as e:
         logger.error(f"Optimization failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/optimize/stream")
+async def optimize_stream(request: OptimizationRequest) -> StreamingResponse:
+    """Stream lineups as newline-delimited JSON as soon as each one is found"""
+    players_data = await get_slate_players(request.slate_id)
+    players = [Player(**p) for p in players_data]
+
+    if not players:
+        raise HTTPException(status_code=404, detail="No players found for slate")
+
+    ruleset = Ruleset(**request.ruleset)
+
+    async def lineup_events():
+        lineups = []
+        start_time = time.time()
+        try:
+            async for lineup in stream_lineups(
+                players=players,
+                ruleset=ruleset,
+                num_lineups=request.num_lineups,
+                engine=request.engine,
+                objective=request.objective,
+                randomness=request.randomness,
+                time_limit=request.time_limit,
+                gap_target=request.gap_target
+            ):
+                lineups.append(lineup)
+                yield json.dumps({"type": "lineup", "lineup": lineup.__dict__}) + "\n"
+        except Exception as e:
+            logger.error(f"Streaming optimization failed: {e}")
+            yield json.dumps({"type": "error", "error": str(e)}) + "\n"
+
+        # Cache whatever we found, even a partial portfolio
+        lineups_cache[request.slate_id] = lineups
+        yield json.dumps({
+            "type": "done",
+            "total_lineups": len(lineups),
+            "timed_out": _hit_time_limit(len(lineups), request.num_lineups, time.time() - start_time,
+                                         request.time_limit)
+        }) + "\n"
+
+    return StreamingResponse(lineup_events(), media_type="application/x-ndjson")
+
 @app.post("/simulate")
 async def simulate(request: SimulationRequest) -> Dict:
     """Run Monte Carlo simulation on lineups"""
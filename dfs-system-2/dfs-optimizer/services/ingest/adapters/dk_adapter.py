@@ -6,15 +6,13 @@ Handles unofficial DraftKings API endpoints for slate and player data
 import asyncio
 import json
 import logging
-import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import aiohttp
-import requests
 from dataclasses import dataclass
 from urllib.parse import urljoin
 
 from ...packages.shared.types import Player, Game, Slate, Site, Sport
+from ..http_client import get_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +23,7 @@ class DKAdapterConfig:
     timeout: int = 30
     retries: int = 3
     rate_limit_delay: float = 1.0
+    cache_ttl: int = 300  # Seconds a response stays fresh without its own Cache-Control
     user_agent: str = "Mozilla/5.0 (compatible; DFS-Optimizer/1.0)"
 
 class DKAdapter:
@@ -32,58 +31,19 @@ class DKAdapter:
 
     def __init__(self, config: Optional[DKAdapterConfig] = None):
         self.config = config or DKAdapterConfig()
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = 0
+        self.http = get_http_pool()
+        self.http.register_adapter("draftkings", self.config, headers={"User-Agent": self.config.user_agent})
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            headers={"User-Agent": self.config.user_agent},
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
-
-    def _rate_limit(self):
-        """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.config.rate_limit_delay:
-            time.sleep(self.config.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        # Connections belong to the shared pool
+        pass
 
     async def _make_request(self, url: str, method: str = "GET", **kwargs) -> Optional[Dict]:
-        """Make HTTP request with retry logic"""
-        for attempt in range(self.config.retries):
-            try:
-                self._rate_limit()
-
-                if not self.session:
-                    self.session = aiohttp.ClientSession(
-                        headers={"User-Agent": self.config.user_agent},
-                        timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                    )
-
-                async with self.session.request(method, url, **kwargs) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 429:  # Rate limited
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        logger.warning(f"Rate limited, waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"HTTP {response.status} for {url}")
-                        return None
-
-            except Exception as e:
-                logger.error(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < self.config.retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                continue
-
-        return None
+        """Make HTTP request through the shared pool (rate limit, retries and response cache per config)"""
+        return await self.http.fetch_json("draftkings", url, method, cache_ttl=self.config.cache_ttl, **kwargs)
 
     async def get_available_slates(self, sport: str = "NFL") -> List[Dict]:
         """Get available slates for a sport"""
@@ -9,10 +9,10 @@ import logging
 import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import aiohttp
 from dataclasses import dataclass
 
 from ...packages.shared.types import Player, Game, Slate, Site, Sport
+from ..http_client import get_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,7 @@ class FantasyNerdsConfig:
     timeout: int = 30
     retries: int = 3
     rate_limit_delay: float = 1.0
+    cache_ttl: int = 300  # Seconds a response stays fresh without its own Cache-Control
 
 class FantasyNerdsAdapter:
     """Adapter for FantasyNerds DFS data"""
@@ -32,19 +33,16 @@ class FantasyNerdsAdapter:
         self.config = config or FantasyNerdsConfig()
         if not self.config.api_key:
             self.config.api_key = os.getenv("FANTASYNERDS_API_KEY")
-        self.session: Optional[aiohttp.ClientSession] = None
+        headers = {"Authorization": f"Bearer {self.config.api_key}"} if self.config.api_key else {}
+        self.http = get_http_pool()
+        self.http.register_adapter("fantasynerds", self.config, headers=headers)
 
     async def __aenter__(self):
-        headers = {"Authorization": f"Bearer {self.config.api_key}"} if self.config.api_key else {}
-        self.session = aiohttp.ClientSession(
-            headers=headers,
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # Connections belong to the shared pool
+        pass
 
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """Make authenticated API request"""
@@ -53,38 +51,7 @@ class FantasyNerdsAdapter:
             return None
 
         url = f"{self.config.base_url}{endpoint}"
-
-        for attempt in range(self.config.retries):
-            try:
-                if not self.session:
-                    headers = {"Authorization": f"Bearer {self.config.api_key}"}
-                    self.session = aiohttp.ClientSession(
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                    )
-
-                async with self.session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 401:
-                        logger.error("Invalid FantasyNerds API key")
-                        return None
-                    elif response.status == 429:
-                        wait_time = 2 ** attempt
-                        logger.warning(f"Rate limited, waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(f"FantasyNerds API error: HTTP {response.status}")
-                        return None
-
-            except Exception as e:
-                logger.error(f"Request failed (attempt {attempt + 1}): {e}")
-                if attempt < self.config.retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                continue
-
-        return None
+        return await self.http.fetch_json("fantasynerds", url, cache_ttl=self.config.cache_ttl, params=params)
 
     async def get_nfl_slates(self) -> List[Dict]:
         """Get available NFL slates"""
@@ -7,11 +7,11 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-import aiohttp
 import json
 from dataclasses import dataclass
 
 from ...packages.shared.types import Player
+from ..http_client import get_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -43,30 +43,21 @@ class WeatherAdapter:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or "demo_key"  # OpenWeatherMap API key
         self.base_url = "https://api.openweathermap.org/data/2.5"
-        self.session = None
-        self.cache = {}
-        self.cache_expiry = 1800  # 30 minutes
+        self.http = get_http_pool()
+        self.http.register_source("openweather", rate_per_second=1.0, burst=5, timeout=30)
+        self.cache_expiry = 1800  # 30 minutes, applied by the shared response cache
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # Connections belong to the shared pool
+        pass
 
     async def get_game_weather(self, location: str, game_time: datetime) -> Optional[WeatherData]:
         """Get weather forecast for game location and time"""
-        cache_key = f"weather_{location}_{game_time.strftime('%Y%m%d_%H')}"
-
-        if self._is_cache_valid(cache_key):
-            return self.cache[cache_key]
-
         try:
-            weather_data = await self._fetch_weather_data(location, game_time)
-            if weather_data:
-                self.cache[cache_key] = weather_data
-            return weather_data
+            return await self._fetch_weather_data(location, game_time)
 
         except Exception as e:
             logger.error(f"Failed to fetch weather for {location}: {e}")
@@ -105,13 +96,12 @@ class WeatherAdapter:
                     'units': 'imperial'
                 }
 
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return self._parse_weather_response(data, location, game_time, hours_ahead)
-                else:
-                    logger.error(f"Weather API error: {response.status}")
-                    return None
+            response = await self.http.get_cached("openweather", url, ttl=self.cache_expiry, params=params)
+            if response.status == 200:
+                return self._parse_weather_response(response.json(), location, game_time, hours_ahead)
+            else:
+                logger.error(f"Weather API error: {response.status}")
+                return None
 
         except Exception as e:
             logger.error(f"Weather fetch error: {e}")
@@ -202,18 +192,6 @@ class WeatherAdapter:
             last_updated=datetime.now()
         )
 
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """Check if cached weather data is still valid"""
-        if cache_key not in self.cache:
-            return False
-
-        # Weather data expires after 30 minutes
-        if isinstance(self.cache[cache_key], WeatherData):
-            last_updated = self.cache[cache_key].last_updated
-            return (datetime.now() - last_updated).seconds < self.cache_expiry
-
-        return False
-
     async def analyze_weather_impact(self, players: List[Player], weather: WeatherData) -> List[WeatherImpact]:
         """Analyze how weather affects player performance"""
         impacts = []
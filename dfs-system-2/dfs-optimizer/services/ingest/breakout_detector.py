@@ -48,8 +48,7 @@ class BreakoutDetector:
         self.breakout_threshold = 1.15  # 15% above consensus
         self.min_sources = 2
         self.max_sources = 8
-        self.cache = {}
-        self.cache_expiry = 1800  # 30 minutes
+        # Weather lookups are cached by the shared HTTP response cache
 
     async def detect_breakouts(self, players: List[Player], sport: str = 'nfl') -> List[BreakoutCandidate]:
         """Main breakout detection function"""
@@ -8,12 +8,16 @@ import asyncio
 import json
 import logging
 import os
+import sys
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import aiohttp
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+# Importable as a package module or from the ingest directory (live_data_server does the latter)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from src.utils.http_client import get_http_pool
+
 # Load environment variables
 load_dotenv()
 
@@ -36,9 +40,10 @@ class DataIntegrationService:
 
     def __init__(self):
         self.sources = self._initialize_sources()
-        self.cache = {}
-        self.cache_duration = 300  # 5 minutes
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.cache_duration = 300  # 5 minutes, unless the source sends its own Cache-Control
+        self.http = get_http_pool()
+        for source_name, config in self.sources.items():
+            self.http.register_source(source_name, rate_per_second=config.rate_limit / 60.0, burst=5)
 
     def _initialize_sources(self) -> Dict[str, DataSourceConfig]:
         """Initialize all configured data sources"""
@@ -80,12 +85,11 @@ class DataIntegrationService:
         }
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # Connections belong to the shared pool and stay open for the next caller
+        pass
 
     async def get_comprehensive_nfl_data(self) -> Dict:
         """Get comprehensive NFL DFS data from all available sources"""
@@ -106,16 +110,14 @@ class DataIntegrationService:
         }
 
         # Fetch data from each enabled source
-        tasks = []
-        for source_name, config in self.sources.items():
-            if config.enabled:
-                tasks.append(self._fetch_source_data(source_name, config))
+        enabled = [name for name, config in self.sources.items() if config.enabled]
+        tasks = [self._fetch_source_data(name, self.sources[name]) for name in enabled]
 
         # Execute all fetches concurrently
         source_results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results
-        for source_name, result_data in zip(self.sources.keys(), source_results):
+        for source_name, result_data in zip(enabled, source_results):
             if isinstance(result_data, Exception):
                 logger.error(f"Failed to fetch from {source_name}: {result_data}")
                 result['data_sources'][source_name] = {'status': 'error', 'error': str(result_data)}
@@ -160,25 +162,26 @@ class DataIntegrationService:
             slates_url = f"{config.base_url}/nfl/dfs-slates"
             params = {'api_key': config.api_key}
 
-            async with self.session.get(slates_url, params=params) as response:
-                if response.status == 200:
-                    slates_data = await response.json()
+            response = await self.http.get_cached('fantasynerds', slates_url, ttl=self.cache_duration, params=params)
+            if response.status == 200:
+                slates_data = response.json()
 
-                    # Get players for main slate
-                    if 'slates' in slates_data and slates_data['slates']:
-                        main_slate = slates_data['slates'][0]
-                        players_url = f"{config.base_url}/nfl/dfs-slates/{main_slate['id']}/players"
+                # Get players for main slate
+                if 'slates' in slates_data and slates_data['slates']:
+                    main_slate = slates_data['slates'][0]
+                    players_url = f"{config.base_url}/nfl/dfs-slates/{main_slate['id']}/players"
 
-                        async with self.session.get(players_url, params=params) as players_response:
-                            if players_response.status == 200:
-                                players_data = await players_response.json()
+                    players_response = await self.http.get_cached('fantasynerds', players_url,
+                                                                  ttl=self.cache_duration, params=params)
+                    if players_response.status == 200:
+                        players_data = players_response.json()
 
-                                return {
-                                    'status': 'success',
-                                    'slates': slates_data.get('slates', []),
-                                    'players': players_data.get('players', []),
-                                    'source_quality': 0.95
-                                }
+                        return {
+                            'status': 'success',
+                            'slates': slates_data.get('slates', []),
+                            'players': players_data.get('players', []),
+                            'source_quality': 0.95
+                        }
 
             return {'status': 'api_error', 'http_status': response.status}
 
@@ -195,23 +198,24 @@ class DataIntegrationService:
 
             # Get NFL games for current season
             games_url = f"{config.base_url}/GamesBySeason/2025"
-            async with self.session.get(games_url, headers=headers) as response:
-                if response.status == 200:
-                    games_data = await response.json()
-
-                    # Get player projections
-                    projections_url = f"{config.base_url}/PlayerSeasonProjectionStatsBySeason/2025"
-                    async with self.session.get(projections_url, headers=headers) as proj_response:
-                        projections = []
-                        if proj_response.status == 200:
-                            projections = await proj_response.json()
-
-                        return {
-                            'status': 'success',
-                            'games': games_data,
-                            'projections': projections,
-                            'source_quality': 0.90
-                        }
+            response = await self.http.get_cached('sportsdataio', games_url, ttl=self.cache_duration, headers=headers)
+            if response.status == 200:
+                games_data = response.json()
+
+                # Get player projections
+                projections_url = f"{config.base_url}/PlayerSeasonProjectionStatsBySeason/2025"
+                proj_response = await self.http.get_cached('sportsdataio', projections_url,
+                                                           ttl=self.cache_duration, headers=headers)
+                projections = []
+                if proj_response.status == 200:
+                    projections = proj_response.json()
+
+                return {
+                    'status': 'success',
+                    'games': games_data,
+                    'projections': projections,
+                    'source_quality': 0.90
+                }
 
             return {'status': 'api_error', 'http_status': response.status}
 
@@ -232,15 +236,13 @@ class DataIntegrationService:
                 'markets': 'spreads,totals'
             }
 
-            async with self.session.get(odds_url, params=params) as response:
-                if response.status == 200:
-                    odds_data = await response.json()
-
-                    return {
-                        'status': 'success',
-                        'odds': odds_data,
-                        'source_quality': 0.85
-                    }
+            response = await self.http.get_cached('odds_api', odds_url, ttl=self.cache_duration, params=params)
+            if response.status == 200:
+                return {
+                    'status': 'success',
+                    'odds': response.json(),
+                    'source_quality': 0.85
+                }
 
             return {'status': 'api_error', 'http_status': response.status}
 
@@ -261,8 +263,7 @@ class DataIntegrationService:
                 {'city': 'San Francisco', 'lat': 37.7749, 'lon': -122.4194}
             ]
 
-            weather_data = []
-            for city_info in nfl_cities:
+            async def fetch_city(city_info: Dict) -> Optional[Dict]:
                 weather_url = f"{config.base_url}/weather"
                 params = {
                     'lat': city_info['lat'],
@@ -271,11 +272,14 @@ class DataIntegrationService:
                     'units': 'imperial'
                 }
 
-                async with self.session.get(weather_url, params=params) as response:
-                    if response.status == 200:
-                        city_weather = await response.json()
-                        city_weather['city_name'] = city_info['city']
-                        weather_data.append(city_weather)
+                response = await self.http.get_cached('openweather', weather_url, ttl=self.cache_duration, params=params)
+                if response.status == 200:
+                    # Cached bodies are shared, so annotate a copy
+                    return {**response.json(), 'city_name': city_info['city']}
+                return None
+
+            results = await asyncio.gather(*(fetch_city(city_info) for city_info in nfl_cities))
+            weather_data = [city_weather for city_weather in results if city_weather is not None]
 
             return {
                 'status': 'success',
@@ -292,32 +296,32 @@ class DataIntegrationService:
             # Try the main draftables endpoint
             draftables_url = f"{config.base_url}/draftgroups/v1/draftgroups"
 
-            async with self.session.get(draftables_url) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    # Look for NFL draft groups
-                    nfl_groups = []
-                    if 'draftGroups' in data:
-                        for group in data['draftGroups']:
-                            if group.get('sport', '').upper() == 'NFL':
-                                nfl_groups.append(group)
-
-                    if nfl_groups:
-                        # Get players for first NFL group
-                        group_id = nfl_groups[0]['draftGroupId']
-                        players_url = f"{config.base_url}/draftgroups/v1/draftgroups/{group_id}/draftables"
-
-                        async with self.session.get(players_url) as players_response:
-                            if players_response.status == 200:
-                                players_data = await players_response.json()
-
-                                return {
-                                    'status': 'success',
-                                    'draft_groups': nfl_groups,
-                                    'players': players_data.get('draftables', []),
-                                    'source_quality': 0.70  # Lower quality due to unofficial nature
-                                }
+            response = await self.http.get_cached('draftkings', draftables_url, ttl=self.cache_duration)
+            if response.status == 200:
+                data = response.json()
+
+                # Look for NFL draft groups
+                nfl_groups = []
+                if 'draftGroups' in data:
+                    for group in data['draftGroups']:
+                        if group.get('sport', '').upper() == 'NFL':
+                            nfl_groups.append(group)
+
+                if nfl_groups:
+                    # Get players for first NFL group
+                    group_id = nfl_groups[0]['draftGroupId']
+                    players_url = f"{config.base_url}/draftgroups/v1/draftgroups/{group_id}/draftables"
+
+                    players_response = await self.http.get_cached('draftkings', players_url, ttl=self.cache_duration)
+                    if players_response.status == 200:
+                        players_data = players_response.json()
+
+                        return {
+                            'status': 'success',
+                            'draft_groups': nfl_groups,
+                            'players': players_data.get('draftables', []),
+                            'source_quality': 0.70  # Lower quality due to unofficial nature
+                        }
 
             return {'status': 'no_nfl_data'}
 
@@ -353,8 +357,8 @@ class DataIntegrationService:
         for source_name, source_data in result['data_sources'].items():
             if 'slates' in source_data:
                 for slate in source_data['slates']:
-                    slate['data_source'] = source_name
-                    all_slates.append(slate)
+                    # Slates may be shared with the response cache; tag a copy
+                    all_slates.append({**slate, 'data_source': source_name})
 
         result['players'] = all_players
         result['slates'] = all_slates
@@ -439,15 +443,18 @@ class DataIntegrationService:
                 'status': 'unknown'
             }
 
-        # Test each enabled source
-        for source_name, config in self.sources.items():
-            if config.enabled:
-                try:
-                    test_result = await self._test_source_connectivity(source_name, config)
-                    health['sources'][source_name]['status'] = test_result
-                except Exception as e:
-                    health['sources'][source_name]['status'] = 'error'
-                    health['sources'][source_name]['error'] = str(e)
+        # Test each enabled source concurrently
+        enabled = [name for name, config in self.sources.items() if config.enabled]
+        test_results = await asyncio.gather(
+            *(self._test_source_connectivity(name, self.sources[name]) for name in enabled),
+            return_exceptions=True
+        )
+        for source_name, test_result in zip(enabled, test_results):
+            if isinstance(test_result, Exception):
+                health['sources'][source_name]['status'] = 'error'
+                health['sources'][source_name]['error'] = str(test_result)
+            else:
+                health['sources'][source_name]['status'] = test_result
 
         # Determine overall status
         error_count = sum(1 for s in health['sources'].values() if s['status'] == 'error')
@@ -466,34 +473,34 @@ class DataIntegrationService:
                 test_url = f"{config.base_url}/nfl/dfs-slates"
                 params = {'api_key': config.api_key}
 
-                async with self.session.get(test_url, params=params) as response:
+                async with self.http.request(source_name, test_url, params=params) as response:
                     return 'healthy' if response.status == 200 else 'unhealthy'
 
             elif source_name == 'sportsdataio' and config.api_key:
                 test_url = f"{config.base_url}/GamesBySeason/2025"
                 headers = {'Ocp-Apim-Subscription-Key': config.api_key}
 
-                async with self.session.get(test_url, headers=headers) as response:
+                async with self.http.request(source_name, test_url, headers=headers) as response:
                     return 'healthy' if response.status == 200 else 'unhealthy'
 
             elif source_name == 'odds_api' and config.api_key:
                 test_url = f"{config.base_url}/sports"
                 params = {'apiKey': config.api_key}
 
-                async with self.session.get(test_url, params=params) as response:
+                async with self.http.request(source_name, test_url, params=params) as response:
                     return 'healthy' if response.status == 200 else 'unhealthy'
 
             elif source_name == 'openweather' and config.api_key:
                 test_url = f"{config.base_url}/weather"
                 params = {'q': 'London', 'appid': config.api_key}
 
-                async with self.session.get(test_url, params=params) as response:
+                async with self.http.request(source_name, test_url, params=params) as response:
                     return 'healthy' if response.status == 200 else 'unhealthy'
 
             elif source_name == 'draftkings':
                 test_url = f"{config.base_url}/draftgroups/v1/draftgroups"
 
-                async with self.session.get(test_url) as response:
+                async with self.http.request(source_name, test_url) as response:
                     return 'healthy' if response.status == 200 else 'unhealthy'
 
             return 'no_credentials'
@@ -13,6 +13,7 @@ from ...packages.shared.types import Player, Game, Slate, Site, Sport
 from .adapters.dk_adapter import get_dk_slate
 from .adapters.fantasynerds_adapter import get_fn_nfl_players, get_fn_nba_players
 from .adapters.sportsdataio_adapter import get_sdi_nfl_dfs_projections, get_sdi_nba_dfs_projections
+from .player_index import PlayerIdentityIndex
 
 logger = logging.getLogger(__name__)
 
@@ -166,15 +167,11 @@ class DataMerger:
             logger.error(f"SportsDataIO NBA data fetch failed: {e}")
             return [], []
 
-    def _merge_players(self, players: List[Player]) -> List[Player]:
+    def _merge_players(self, players: List[Player], season: Optional[str] = None) -> List[Player]:
         """Merge and deduplicate players from multiple sources"""
-        # Group players by name and team (fuzzy matching)
-        player_groups = defaultdict(list)
-
-        for player in players:
-            # Create a key for grouping (name + team + position)
-            key = f"{player.name.lower()}_{player.team}_{player.pos[0] if player.pos else 'UNK'}"
-            player_groups[key].append(player)
+        # Group players by resolved identity (canonical name, source ids, fuzzy fallback)
+        index = PlayerIdentityIndex(season=season or str(datetime.now().year))
+        player_groups = index.group(players)
 
         merged_players = []
 
@@ -0,0 +1,16 @@
+"""
+Shared HTTP client pool
+Shared with the Python pipeline: the implementation lives in src/utils/http_client.py,
+so the services and the ingestors draw from one pool and one response cache
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from src.utils.http_client import (  # noqa: E402
+    HttpClientPool, RetryPolicy, SourceSettings, TokenBucket, close_http_pool, get_http_pool,
+)
+
+__all__ = ['HttpClientPool', 'RetryPolicy', 'SourceSettings', 'TokenBucket', 'close_http_pool', 'get_http_pool']
@@ -0,0 +1,212 @@
+"""
+Player Identity Index
+Resolves the same player across DK, FantasyNerds, SportsDataIO and RotoWire pools:
+exact hash lookups on source ids and canonical names, then a trigram-blocked fuzzy
+matcher for whatever is left over
+"""
+
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Sources disagree on a handful of team abbreviations
+TEAM_ALIASES = {
+    'JAC': 'JAX', 'WSH': 'WAS', 'ARZ': 'ARI', 'BLT': 'BAL', 'CLV': 'CLE', 'HST': 'HOU',
+    'SD': 'LAC', 'OAK': 'LV', 'KAN': 'KC', 'NOR': 'NO', 'SFO': 'SF', 'TAM': 'TB',
+    'NWE': 'NE', 'GS': 'GSW', 'PHO': 'PHX', 'SA': 'SAS', 'UTAH': 'UTA',
+}
+
+# Defense/special teams come through as "Broncos", "Denver Broncos", "DEN DST", ...
+DST_POSITIONS = {'DST', 'DEF', 'D', 'D/ST'}
+
+# Season-level cache of fuzzy resolutions: season -> (name, team, pos) -> identity key
+_SEASON_MATCH_CACHE: Dict[str, Dict[Tuple[str, str, str], str]] = defaultdict(dict)
+
+
+def _name_tokens(name: str) -> List[str]:
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii')
+    text = re.sub(r"[.'`’]", '', text.lower())
+    return re.sub(r'[^a-z0-9 ]+', ' ', text).split()
+
+
+def normalize_name(name: str) -> str:
+    """Canonical player name: ascii, lowercase, no punctuation or generational suffix"""
+    tokens = _name_tokens(name)
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def name_generation(name: str) -> str:
+    """Generational suffix a source gave with the name ('jr', 'sr', 'ii', ...), or ''"""
+    tokens = _name_tokens(name)
+    return tokens[-1] if len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES else ''
+
+
+def normalize_team(team: str) -> str:
+    team = (team or '').upper().strip()
+    return TEAM_ALIASES.get(team, team)
+
+
+def normalize_position(pos: str) -> str:
+    pos = (pos or '').upper().strip()
+    return 'DST' if pos in DST_POSITIONS else pos
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIdentityIndex:
+    """Maps source players to one identity key per real player"""
+
+    def __init__(self, season: str = '', min_similarity: float = 0.85, min_margin: float = 0.05):
+        self.season = season
+        self.min_similarity = min_similarity
+        # A fuzzy match must beat the runner-up by this much: 'j williams' is nobody
+        # when both Jamaal and Javonte are in the block
+        self.min_margin = min_margin
+        # Keyed with team and position too: some sources derive ids from the name alone
+        # ('dk_mike_williams'), so the id by itself does not identify a player
+        self.by_source_id: Dict[Tuple[str, str, str], str] = {}
+        self.by_canonical: Dict[Tuple[str, str, str], str] = {}
+        self.names: Dict[str, str] = {}  # identity key -> canonical name
+        # Jr./Sr. share a canonical name: a known suffix keeps them apart
+        self.generations: Dict[str, str] = {}  # identity key -> generational suffix
+        self.by_generation: Dict[Tuple[Tuple[str, str, str], str], str] = {}
+        self._blocks: Dict[Tuple[str, str], Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._match_cache = _SEASON_MATCH_CACHE[season]
+
+    def resolve(self, name: str, team: str = '', pos: str = '', player_id: Optional[str] = None) -> str:
+        """Identity key for a player, registering a new identity when nothing matches"""
+        canonical = self.canonical_key(name, team, pos)
+        generation = name_generation(name) if canonical[2] != 'DST' else ''
+        source_key = (player_id, canonical[1], canonical[2]) if player_id else None
+
+        # Exact source id
+        if source_key in self.by_source_id:
+            return self.by_source_id[source_key]
+
+        identity = self._match(canonical, generation)
+        if identity is None:
+            identity = self._register(*canonical, generation=generation)
+        elif generation and not self.generations.get(identity):
+            self.generations[identity] = generation
+            self.by_generation[(canonical, generation)] = identity
+        if source_key:
+            self.by_source_id[source_key] = identity
+        return identity
+
+    def lookup(self, name: str, team: str = '', pos: str = '') -> Optional[str]:
+        """Identity key for a player if already known (no registration)"""
+        canonical = self.canonical_key(name, team, pos)
+        return self._match(canonical, name_generation(name) if canonical[2] != 'DST' else '')
+
+    def _match(self, canonical: Tuple[str, str, str], generation: str) -> Optional[str]:
+        """Exact canonical match, then the season cache, then the fuzzy matcher"""
+        identity = self.by_generation.get((canonical, generation)) if generation else None
+        if identity is None:
+            identity = self.by_canonical.get(canonical)
+            if identity is not None and not self._same_generation(identity, generation):
+                identity = None
+        if identity is not None:
+            return identity
+
+        # Fuzzy fallback, cached for the season
+        cached = self._match_cache.get(canonical)
+        if cached in self.names and self._same_generation(cached, generation):
+            identity = cached
+        else:
+            identity = self._fuzzy_match(*canonical, generation=generation)
+        if identity is not None:
+            self._match_cache[canonical] = identity
+            self.by_canonical.setdefault(canonical, identity)
+        return identity
+
+    def _same_generation(self, identity: str, generation: str) -> bool:
+        known = self.generations.get(identity, '')
+        return not generation or not known or known == generation
+
+    @staticmethod
+    def canonical_key(name: str, team: str = '', pos: str = '') -> Tuple[str, str, str]:
+        team, pos = normalize_team(team), normalize_position(pos)
+        # A defense is identified by its team whatever the source calls it
+        return (team.lower() if pos == 'DST' and team else normalize_name(name)), team, pos
+
+    def _register(self, name: str, team: str, pos: str, generation: str = '') -> str:
+        identity = f"{name.replace(' ', '_')}_{team}_{pos}" if name else f"unknown_{len(self.names)}"
+        if identity in self.names:
+            identity = f"{name.replace(' ', '_')}_{generation or len(self.names)}_{team}_{pos}"
+        self.names[identity] = name
+        self.by_canonical.setdefault((name, team, pos), identity)
+        if generation:
+            self.generations[identity] = generation
+            self.by_generation[((name, team, pos), generation)] = identity
+        block = self._blocks[(team, pos)]
+        for gram in trigrams(name):
+            block[gram].add(identity)
+        return identity
+
+    def _fuzzy_match(self, name: str, team: str, pos: str, generation: str = '') -> Optional[str]:
+        """Best same-team, same-position identity sharing trigrams with the name, if unambiguous"""
+        if not name:
+            return None
+        block = self._blocks.get((team, pos))
+        if not block:
+            return None
+
+        grams = trigrams(name)
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in grams:
+            for identity in block.get(gram, ()):
+                shared[identity] += 1
+
+        best, best_score, runner_up = None, 0.0, 0.0
+        for identity, count in shared.items():
+            candidate = self.names[identity]
+            if not self._same_generation(identity, generation):
+                continue
+            score = self._initial_match(name, candidate)
+            # Cheap trigram Jaccard bound before the exact ratio
+            if count / (len(grams) + len(trigrams(candidate)) - count) >= 0.5:
+                score = max(score, SequenceMatcher(None, name, candidate).ratio())
+            if score > best_score:
+                best, best_score, runner_up = identity, score, best_score
+            elif score > runner_up:
+                runner_up = score
+        if best_score < self.min_similarity or best_score - runner_up < self.min_margin:
+            return None
+        return best
+
+    @staticmethod
+    def _initial_match(name: str, candidate: str) -> float:
+        """Same last name with an initial or shortened first name ('aj' / 'a j', 'ken' / 'kenneth')"""
+        tokens, cand_tokens = name.split(), candidate.split()
+        if len(tokens) < 2 or len(cand_tokens) < 2 or tokens[-1] != cand_tokens[-1]:
+            return 0.0
+        first, cand_first = ''.join(tokens[:-1]), ''.join(cand_tokens[:-1])
+        if first == cand_first:
+            return 1.0
+        if first[0] == cand_first[0] and min(len(first), len(cand_first)) <= 2:
+            return 0.9
+        # Short forms: 'ken' / 'kenneth', 'cam' / 'cameron'
+        short, long = sorted((first, cand_first), key=len)
+        if len(short) >= 3 and long.startswith(short):
+            return 0.88
+        return 0.0
+
+    def group(self, players: List) -> Dict[str, List]:
+        """Group source players (shared Player type) by identity"""
+        groups: Dict[str, List] = defaultdict(list)
+        for player in players:
+            pos = player.pos[0] if player.pos else ''
+            groups[self.resolve(player.name, player.team, pos, player.playerId)].append(player)
+        return groups
@@ -7,9 +7,11 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from collections import defaultdict
 
+import numpy as np
+
 from ...packages.shared.types import Player
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,7 @@ class ProjectionSource:
 class BlendConfig:
     """Configuration for projection blending"""
     global_weights: Dict[str, float]  # source_name -> weight
-    player_overrides: Dict[str, Dict[str, float]]  # player_id -> {source_name: weight}
+    player_overrides: Dict[str, Dict[str, float]] = field(default_factory=dict)  # player_id -> {source_name: weight}
     min_sources: int = 1
     max_deviation: float = 0.5  # Max deviation from consensus (as fraction)
     recency_bonus: float = 0.1  # Bonus for recent projections
@@ -45,7 +47,12 @@ class BlendedProjection:
     last_updated: datetime
 
 class ProjectionBlender:
-    """Blends projections from multiple sources"""
+    """Blends projections from multiple sources.
+
+    Projections live in a player x source matrix alongside a matching weight matrix
+    (source weight, or the player's override). Blending is a pair of matrix-vector
+    products with the per-source recency/reliability multipliers, so updating one
+    source only rewrites its column."""
 
     def __init__(self, config: Optional[BlendConfig] = None):
         self.config = config or BlendConfig(
@@ -57,6 +64,14 @@ class ProjectionBlender:
         )
         self.sources: Dict[str, ProjectionSource] = {}
 
+        # Row per player, column per source (in insertion order)
+        self._rows: Dict[str, int] = {}
+        self._player_ids: List[str] = []
+        self._columns: Dict[str, int] = {}
+        self._values = np.empty((0, 0))   # Projections, NaN where a source has none
+        self._weights = np.empty((0, 0))  # Base weights, 0 where a source has none
+        self._contrib = np.empty((0, 0))  # values * weights, 0 where a source has none
+
     def add_source(self, name: str, projections: Dict[str, float],
                    reliability_score: float = 80.0) -> None:
         """Add a projection source"""
@@ -68,118 +83,127 @@ class ProjectionBlender:
             projections=projections
         )
         self.sources[name] = source
+        self._set_column(name)
         logger.info(f"Added projection source: {name} with {len(projections)} projections")
 
     def update_source(self, name: str, projections: Dict[str, float]) -> None:
-        """Update projections for an existing source"""
+        """Update projections for an existing source (rewrites only its column)"""
         if name in self.sources:
             self.sources[name].projections = projections
             self.sources[name].last_updated = datetime.now()
+            self._set_column(name)
             logger.info(f"Updated projections for source: {name}")
         else:
             logger.warning(f"Source {name} not found, use add_source instead")
 
+    def _add_rows(self, player_ids: Any) -> None:
+        new_ids = [player_id for player_id in player_ids if player_id not in self._rows]
+        if not new_ids:
+            return
+        for player_id in new_ids:
+            self._rows[player_id] = len(self._player_ids)
+            self._player_ids.append(player_id)
+        extra = (len(new_ids), self._values.shape[1])
+        self._values = np.vstack([self._values, np.full(extra, np.nan)])
+        self._weights = np.vstack([self._weights, np.zeros(extra)])
+        self._contrib = np.vstack([self._contrib, np.zeros(extra)])
+
+    def _set_column(self, name: str) -> None:
+        """Load a source's projections into its column and recompute its weights"""
+        projections = self.sources[name].projections
+        self._add_rows(projections)
+        if name not in self._columns:
+            self._columns[name] = len(self._columns)
+            extra = (len(self._player_ids), 1)
+            self._values = np.hstack([self._values, np.full(extra, np.nan)])
+            self._weights = np.hstack([self._weights, np.zeros(extra)])
+            self._contrib = np.hstack([self._contrib, np.zeros(extra)])
+
+        column = self._columns[name]
+        rows = np.fromiter((self._rows[player_id] for player_id in projections), dtype=np.intp,
+                           count=len(projections))
+        self._values[:, column] = np.nan
+        self._values[rows, column] = np.fromiter(projections.values(), dtype=float, count=len(projections))
+        self._set_weights(name)
+
+    def _set_weights(self, name: str) -> None:
+        """Base weight for every player with a projection from this source, overrides applied"""
+        column = self._columns[name]
+        present = ~np.isnan(self._values[:, column])
+        weights = np.where(present, self.sources[name].weight, 0.0)
+        for player_id, overrides in self.config.player_overrides.items():
+            row = self._rows.get(player_id)
+            if row is not None and present[row] and overrides.get(name) is not None:
+                weights[row] = overrides[name]
+        self._weights[:, column] = weights
+        self._contrib[:, column] = np.where(present, self._values[:, column], 0.0) * weights
+
+    def _source_multipliers(self, now: datetime) -> np.ndarray:
+        """Recency bonus times reliability (80 = 1.0) for each source column"""
+        multipliers = np.empty(len(self._columns))
+        for name, column in self._columns.items():
+            source = self.sources[name]
+            hours_old = (now - source.last_updated).total_seconds() / 3600
+            recency_multiplier = 1.0 + (self.config.recency_bonus * max(0, 1 - hours_old / 24))
+            multipliers[column] = recency_multiplier * source.reliability_score / 80.0
+        return multipliers
+
     def blend_projections(self, player_ids: Optional[List[str]] = None) -> Dict[str, BlendedProjection]:
         """Blend projections for specified players (or all if None)"""
         if not self.sources:
             logger.warning("No projection sources available")
             return {}
 
-        # Get all player IDs if not specified
         if player_ids is None:
-            all_player_ids = set()
-            for source in self.sources.values():
-                all_player_ids.update(source.projections.keys())
-            player_ids = list(all_player_ids)
+            rows = np.arange(len(self._player_ids))
+        else:
+            rows = np.array([self._rows[player_id] for player_id in player_ids if player_id in self._rows],
+                            dtype=np.intp)
+
+        now = datetime.now()
+        multipliers = self._source_multipliers(now)
+        values = self._values[rows]
+        present = ~np.isnan(values)
+        counts = present.sum(axis=1)
+
+        total_weight = self._weights[rows] @ multipliers
+        keep = (counts >= self.config.min_sources) & (counts > 0) & (total_weight != 0)
+        rows, values, present, counts, total_weight = \
+            rows[keep], values[keep], present[keep], counts[keep], total_weight[keep]
+        blended = (self._contrib[rows] @ multipliers) / total_weight
+
+        # Confidence from source count, reduced when the sources disagree
+        std_dev = np.nanstd(values, axis=1)
+        mean_proj = np.nanmean(values, axis=1)
+        confidence = np.minimum(100, counts * 20).astype(float)
+        disagree = (counts > 1) & (mean_proj > 0)
+        confidence[disagree] *= np.maximum(0.5, 1 - std_dev[disagree] / mean_proj[disagree])
+        low, high = np.nanmin(values, axis=1), np.nanmax(values, axis=1)
+
+        # Percentage contribution of each source
+        shares = self._weights[rows] * multipliers / total_weight[:, None] * 100
+        source_names = list(self._columns)
 
         blended_projections = {}
-
-        for player_id in player_ids:
-            blended = self._blend_single_player(player_id)
-            if blended:
-                blended_projections[player_id] = blended
+        for row, projection, score, used, row_shares, row_present, std, lo, hi in zip(
+                rows.tolist(), blended.tolist(), confidence.tolist(), counts.tolist(), shares.tolist(),
+                present.tolist(), std_dev.tolist(), low.tolist(), high.tolist()):
+            player_id = self._player_ids[row]
+            blended_projections[player_id] = BlendedProjection(
+                player_id=player_id,
+                blended_projection=round(projection, 1),
+                confidence_score=round(score, 1),
+                sources_used=used,
+                source_breakdown={name: share for name, share, has in zip(source_names, row_shares, row_present)
+                                  if has},
+                standard_deviation=round(std, 2),
+                range=(lo, hi),
+                last_updated=now
+            )
 
         logger.info(f"Blended projections for {len(blended_projections)} players")
         return blended_projections
 
-    def _blend_single_player(self, player_id: str) -> Optional[BlendedProjection]:
-        """Blend projections for a single player"""
-        # Collect all projections for this player
-        player_projections = {}
-        weights = {}
-
-        for source_name, source in self.sources.items():
-            if player_id in source.projections:
-                projection = source.projections[player_id]
-
-                # Get weight (check for player-specific override first)
-                weight = self.config.player_overrides.get(player_id, {}).get(source_name)
-                if weight is None:
-                    weight = source.weight
-
-                # Apply recency bonus
-                hours_old = (datetime.now() - source.last_updated).total_seconds() / 3600
-                recency_multiplier = 1.0 + (self.config.recency_bonus * max(0, 1 - hours_old/24))
-
-                # Apply reliability bonus
-                reliability_multiplier = source.reliability_score / 80.0  # Normalize to 1.0 baseline
-
-                final_weight = weight * recency_multiplier * reliability_multiplier
-
-                player_projections[source_name] = projection
-                weights[source_name] = final_weight
-
-        if len(player_projections) < self.config.min_sources:
-            return None
-
-        # Calculate blended projection
-        total_weight = sum(weights.values())
-        if total_weight == 0:
-            return None
-
-        blended_projection = sum(
-            proj * (weights[source] / total_weight)
-            for source, proj in player_projections.items()
-        )
-
-        # Calculate confidence score
-        confidence_score = min(100, len(player_projections) * 20)  # Base confidence on source count
-
-        # Adjust for consistency (lower std dev = higher confidence)
-        projections_list = list(player_projections.values())
-        if len(projections_list) > 1:
-            import numpy as np
-            std_dev = np.std(projections_list)
-            mean_proj = np.mean(projections_list)
-
-            # Reduce confidence if high variance
-            if mean_proj > 0:
-                variance_ratio = std_dev / mean_proj
-                confidence_score *= max(0.5, 1 - variance_ratio)
-        else:
-            std_dev = 0
-
-        # Source breakdown
-        source_breakdown = {
-            source: (weights[source] / total_weight) * 100
-            for source in player_projections.keys()
-        }
-
-        # Range
-        proj_values = list(player_projections.values())
-        proj_range = (min(proj_values), max(proj_values))
-
-        return BlendedProjection(
-            player_id=player_id,
-            blended_projection=round(blended_projection, 1),
-            confidence_score=round(confidence_score, 1),
-            sources_used=len(player_projections),
-            source_breakdown=source_breakdown,
-            standard_deviation=round(std_dev, 2),
-            range=proj_range,
-            last_updated=datetime.now()
-        )
-
     def get_consensus_rankings(self, sport: str = 'NFL') -> List[Tuple[str, float, float]]:
         """Get consensus rankings based on blended projections"""
         blended = self.blend_projections()
@@ -194,31 +218,23 @@ class ProjectionBlender:
 
     def detect_outliers(self, threshold: float = 2.0) -> Dict[str, List[str]]:
         """Detect projection outliers (sources that deviate significantly)"""
-        outliers = defaultdict(list)
-
-        for player_id in self._get_all_player_ids():
-            player_projections = {}
-            for source_name, source in self.sources.items():
-                if player_id in source.projections:
-                    player_projections[source_name] = source.projections[player_id]
-
-            if len(player_projections) < 2:
-                continue
+        counts = (~np.isnan(self._values)).sum(axis=1)
+        rows = np.flatnonzero(counts >= 2)
+        values = self._values[rows]
+        mean_proj = np.nanmean(values, axis=1, keepdims=True)
+        std_proj = np.nanstd(values, axis=1, keepdims=True)
 
-            # Calculate mean and std
-            import numpy as np
-            projections = list(player_projections.values())
-            mean_proj = np.mean(projections)
-            std_proj = np.std(projections)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.abs(values - mean_proj) / std_proj
+        # NaN (missing projection) and inf (no spread) never count
+        flagged = np.isfinite(z_scores) & (z_scores > threshold)
 
-            if std_proj == 0:
-                continue
-
-            # Find outliers
-            for source_name, projection in player_projections.items():
-                z_score = abs(projection - mean_proj) / std_proj
-                if z_score > threshold:
-                    outliers[player_id].append(f"{source_name} ({projection:.1f}, z={z_score:.1f})")
+        outliers = defaultdict(list)
+        source_names = list(self._columns)
+        for i, column in zip(*np.nonzero(flagged)):
+            player_id = self._player_ids[rows[i]]
+            outliers[player_id].append(
+                f"{source_names[column]} ({values[i, column]:.1f}, z={z_scores[i, column]:.1f})")
 
         return dict(outliers)
 
@@ -249,6 +265,13 @@ class ProjectionBlender:
             self.config.player_overrides[player_id] = {}
 
         self.config.player_overrides[player_id].update(source_weights)
+        row = self._rows.get(player_id)
+        if row is not None:
+            for name, weight in source_weights.items():
+                column = self._columns.get(name)
+                if column is not None and not np.isnan(self._values[row, column]):
+                    self._weights[row, column] = weight
+                    self._contrib[row, column] = self._values[row, column] * weight
         logger.info(f"Set custom weights for player {player_id}: {source_weights}")
 
     def get_blend_stats(self) -> Dict[str, Any]:
@@ -272,10 +295,8 @@ class ProjectionBlender:
 
     def _get_all_player_ids(self) -> List[str]:
         """Get all unique player IDs across sources"""
-        player_ids = set()
-        for source in self.sources.values():
-            player_ids.update(source.projections.keys())
-        return list(player_ids)
+        has_projection = (~np.isnan(self._values)).any(axis=1)
+        return [self._player_ids[row] for row in np.flatnonzero(has_projection)]
 
     def save_blend_config(self, filepath: str) -> None:
         """Save current blend configuration"""
@@ -307,6 +328,10 @@ class ProjectionBlender:
         self.config.max_deviation = config_data.get('max_deviation', 0.5)
         self.config.recency_bonus = config_data.get('recency_bonus', 0.1)
 
+        # Overrides changed wholesale
+        for name in self._columns:
+            self._set_weights(name)
+
         logger.info(f"Loaded blend configuration from {filepath}")
 
 # Convenience functions
@@ -0,0 +1,15 @@
+"""
+HTTP Response Cache
+Shared with the Python pipeline: the implementation lives in src/utils/response_cache.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from src.utils.response_cache import (  # noqa: E402
+    DEFAULT_CACHE_DIR, CachedResponse, ResponseCache, parse_cache_control,
+)
+
+__all__ = ['DEFAULT_CACHE_DIR', 'CachedResponse', 'ResponseCache', 'parse_cache_control']
@@ -0,0 +1,13 @@
+"""
+Lineup index for fast overlap and duplicate checks
+Shared with the Python optimizer: the implementation lives in src/optimize/lineup_index.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from src.optimize.lineup_index import LineupIndex, MinHashLineupIndex, popcount  # noqa: E402
+
+__all__ = ['LineupIndex', 'MinHashLineupIndex', 'popcount']
@@ -0,0 +1,393 @@
+"""
+Live Contest Simulation
+Contest simulation conditioned on points already scored in an in-progress slate, and
+late-swap scoring against the cached outcomes. Players and contests are duck-typed
+(the shared Player and Contest types or anything with the same fields), so this module
+has no dependency on the shared types package.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from scipy import sparse
+
+
+@dataclass
+class LiveEntryResults:
+    """Finish and payout distribution for one entry in a live contest"""
+    entry_id: str
+    mean_score: float
+    mean_finish: float
+    finish_percentiles: Dict[int, float]
+    win_rate: float
+    cash_rate: float
+    expected_payout: float
+    roi: float
+
+class LiveContestSimulator:
+    """Contest simulation conditioned on points already scored in an in-progress slate
+
+    Outcomes are held as a (simulations x players) matrix split into per-game column
+    blocks. Finished games are fixed at their actual points, in-progress games keep
+    the points scored so far and only sample the remaining fraction, and every lineup
+    score is updated by swapping out a single game block's contribution.
+
+    correlation(players) gives the within-game correlation matrix for a game's players;
+    without it players are sampled independently.
+    """
+
+    INJURY_FACTORS = {'Q': 0.7, 'D': 0.4, 'OUT': 0.1}
+
+    def __init__(self, players: List[Any], contest: Any,
+                 entries: Dict[str, List[str]],
+                 field_lineups: Optional[List[List[str]]] = None,
+                 player_games: Optional[Dict[str, str]] = None,
+                 n_simulations: int = 2000, seed: Optional[int] = None,
+                 correlation: Optional[Callable[[List[Any]], np.ndarray]] = None):
+        self.players = players
+        self.contest = contest
+        self.n_simulations = n_simulations
+        self.correlation = correlation
+        self.rng = np.random.default_rng(seed)
+        self.player_index = {p.playerId: i for i, p in enumerate(players)}
+
+        # Pre-slate distribution per player
+        projections = np.array([p.projection or 0.0 for p in players])
+        injury = np.array([self.INJURY_FACTORS.get(p.status, 1.0) for p in players])
+        self.means = projections * injury
+        self.stds = np.array([p.stdev or (p.projection or 0.0) * 0.2 for p in players]) * injury
+        self.floors = np.array([p.floor if p.floor is not None else (p.projection or 0.0) * 0.5
+                                for p in players]) * injury
+        self.ceilings = np.array([p.ceiling if p.ceiling is not None else (p.projection or 0.0) * 1.8
+                                  for p in players]) * injury
+
+        # Column blocks by game
+        player_games = player_games or {}
+        games: Dict[str, List[int]] = {}
+        for i, player in enumerate(players):
+            games.setdefault(player_games.get(player.playerId) or self._game_key(player), []).append(i)
+        self.game_columns = {game_id: np.array(cols) for game_id, cols in games.items()}
+        self.game_cholesky = {game_id: self._block_cholesky(cols) for game_id, cols in self.game_columns.items()}
+        self.fraction_remaining = {game_id: 1.0 for game_id in self.game_columns}
+        self.actual_points = np.zeros(len(players))
+        self.remaining_factors = np.ones(len(players))
+
+        # Lineup x player incidence: our entries first, then the field sample
+        self.entry_ids = list(entries)
+        field_lineups = field_lineups or []
+        self.n_entries = len(self.entry_ids)
+        self.lineups = self._incidence(list(entries.values()) + list(field_lineups))
+        # Each field row stands in for this many other contestants
+        other_entries = max(contest.entries - self.n_entries, 0)
+        self.field_scale = other_entries / len(field_lineups) if field_lineups else 0.0
+        self.payouts = self._payout_table()
+
+        self.outcomes = np.zeros((n_simulations, len(players)), dtype=np.float32)
+        self.scores = np.zeros((self.lineups.shape[0], n_simulations), dtype=np.float32)
+        for game_id in self.game_columns:
+            self._resample_game(game_id)
+
+    @staticmethod
+    def _game_key(player: Any) -> str:
+        return '@'.join(sorted(t for t in (player.team, player.opp) if t))
+
+    def _block_cholesky(self, cols: np.ndarray) -> np.ndarray:
+        """Cholesky factor of the within-game correlation matrix"""
+        if len(cols) == 1 or self.correlation is None:
+            return np.eye(len(cols))
+        corr = np.array(self.correlation([self.players[i] for i in cols]), dtype=float)
+        np.fill_diagonal(corr, 1.0)
+        # Clip to the nearest positive definite matrix
+        eigvals, eigvecs = np.linalg.eigh((corr + corr.T) / 2)
+        corr = eigvecs @ np.diag(np.maximum(eigvals, 1e-6)) @ eigvecs.T
+        d = np.sqrt(np.diag(corr))
+        return np.linalg.cholesky(corr / np.outer(d, d))
+
+    def _incidence(self, lineups: List[List[str]]) -> sparse.csr_matrix:
+        rows, cols = [], []
+        for row, player_ids in enumerate(lineups):
+            for player_id in player_ids:
+                col = self.player_index.get(player_id)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        return sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)),
+                                 shape=(len(lineups), len(self.players)))
+
+    def _payout_table(self) -> np.ndarray:
+        """Prize per finishing place (index 0 = 1st) over the contest's prize pool"""
+        tiers = sorted(self.contest.payoutCurve, key=lambda tier: tier.place)
+        if not tiers:
+            return np.zeros(1)
+        prize_pool = self.contest.entryFee * self.contest.entries
+        table = np.zeros(tiers[-1].place + 1)
+        previous = 0
+        for tier in tiers:
+            table[previous:tier.place] = tier.pct * prize_pool
+            previous = tier.place
+        return table
+
+    def _resample_game(self, game_id: str):
+        """Redraw one game's outcome block and patch every lineup score with the change"""
+        cols = self.game_columns[game_id]
+        fraction = self.fraction_remaining[game_id]
+        actual = self.actual_points[cols]
+
+        if fraction <= 0:
+            block = np.broadcast_to(actual, (self.n_simulations, len(cols)))
+        else:
+            # Remaining production: mean scales with time left, spread with its square root
+            z = self.rng.standard_normal((self.n_simulations, len(cols))) @ self.game_cholesky[game_id].T
+            means = self.means[cols] * self.remaining_factors[cols]
+            remaining = means * fraction + z * self.stds[cols] * np.sqrt(fraction)
+            remaining = np.clip(remaining, self.floors[cols] * fraction, self.ceilings[cols] * fraction)
+            block = actual + np.maximum(remaining, 0.0)
+
+        block = block.astype(np.float32)
+        lineup_block = self.lineups[:, cols]
+        delta = block - self.outcomes[:, cols]
+        self.scores += np.asarray(lineup_block @ delta.T, dtype=np.float32)
+        self.outcomes[:, cols] = block
+
+    def update_game(self, game_id: str, actual_points: Dict[str, float],
+                    fraction_remaining: float = 0.0, team_factors: Optional[Dict[str, float]] = None):
+        """Condition one game on its box score so far; fraction_remaining=0 marks it final
+
+        team_factors scales remaining production per team for game state (e.g. a trailing
+        team throwing more).
+        """
+        if game_id not in self.game_columns:
+            raise KeyError(f"Unknown game {game_id}")
+
+        for player_id, points in actual_points.items():
+            col = self.player_index.get(player_id)
+            if col is not None:
+                self.actual_points[col] = points
+        self.fraction_remaining[game_id] = min(max(fraction_remaining, 0.0), 1.0)
+
+        if team_factors:
+            for col in self.game_columns[game_id]:
+                factor = team_factors.get(self.players[col].team)
+                if factor is not None:
+                    self.remaining_factors[col] = factor
+
+        self._resample_game(game_id)
+
+    def update_games(self, game_states: Dict[str, Tuple[Dict[str, float], float]]):
+        """Apply several game updates: game_id -> (actual points, fraction remaining)"""
+        for game_id, (actual_points, fraction_remaining) in game_states.items():
+            self.update_game(game_id, actual_points, fraction_remaining)
+
+    @property
+    def remaining_games(self) -> List[str]:
+        return [game_id for game_id, fraction in self.fraction_remaining.items() if fraction > 0]
+
+    def finish_distribution(self) -> np.ndarray:
+        """(entries x simulations) finishing place of each of our entries"""
+        entry_scores = self.scores[:self.n_entries]
+        field_scores = np.sort(self.scores[self.n_entries:], axis=0)
+        own_sorted = np.sort(entry_scores, axis=0)
+        n_field = field_scores.shape[0]
+
+        places = np.empty(entry_scores.shape, dtype=np.float64)
+        for sim in range(self.n_simulations):
+            column = entry_scores[:, sim]
+            field_above = n_field - np.searchsorted(field_scores[:, sim], column, side='right')
+            own_above = self.n_entries - np.searchsorted(own_sorted[:, sim], column, side='right')
+            places[:, sim] = 1 + own_above + field_above * self.field_scale
+        return places
+
+    def payout_distribution(self, places: Optional[np.ndarray] = None) -> np.ndarray:
+        """(entries x simulations) prize won by each of our entries"""
+        if places is None:
+            places = self.finish_distribution()
+        index = np.minimum(places.astype(np.int64) - 1, len(self.payouts) - 1)
+        return self.payouts[index]
+
+    def results(self) -> Dict[str, LiveEntryResults]:
+        """Per-entry summary under the current game states"""
+        places = self.finish_distribution()
+        payouts = self.payout_distribution(places)
+        entry_scores = self.scores[:self.n_entries]
+        n_paid = int(np.count_nonzero(self.payouts))
+        fee = self.contest.entryFee
+
+        results = {}
+        for row, entry_id in enumerate(self.entry_ids):
+            expected = float(payouts[row].mean())
+            results[entry_id] = LiveEntryResults(
+                entry_id=entry_id,
+                mean_score=round(float(entry_scores[row].mean()), 1),
+                mean_finish=round(float(places[row].mean()), 1),
+                finish_percentiles={q: float(np.percentile(places[row], q)) for q in (10, 25, 50, 75, 90)},
+                win_rate=round(float(np.mean(places[row] < 2)), 4),
+                cash_rate=round(float(np.mean(places[row] <= n_paid)), 4),
+                expected_payout=round(expected, 2),
+                roi=round((expected - fee) / fee, 4) if fee else 0.0
+            )
+        return results
+
+@dataclass
+class SwapEvaluation:
+    """Simulated value of replacing one player in one entry"""
+    entry_id: str
+    out_player_id: str
+    in_player_id: str
+    salary_diff: int
+    mean_score_diff: float
+    expected_payout_diff: float
+    roi_diff: float
+
+class LateSwapEvaluator:
+    """Scores late-swap ideas against a LiveContestSimulator's cached outcomes
+
+    A swap changes one entry's trial vector by a single column substitution
+    (score - outcome[out] + outcome[in]), which is placed against the cached sorted
+    field scores, so thousands of candidates need no re-simulation.
+
+    With a slot_assigner (e.g. src/optimize/slot_assignment.SlotAssigner) a candidate swap
+    only has to leave a roster the site would accept, so the RB playing FLEX can be swapped
+    for a WR; without one, swaps are same-position only. Started and locked players keep
+    their current slot and only the unlocked players are re-seated around them.
+    entry_slots gives each entry's submitted slots (entry_id -> {player_id: slot}); entries
+    without it take the assigner's matching as their current one.
+    """
+
+    def __init__(self, simulator: LiveContestSimulator, salary_cap: int = 50000,
+                 slot_assigner: Optional[Any] = None,
+                 entry_slots: Optional[Dict[str, Dict[str, str]]] = None):
+        self.simulator = simulator
+        self.salary_cap = salary_cap
+        self.slot_assigner = slot_assigner
+        self.entry_slots = entry_slots or {}
+        self.salaries = np.array([p.salary or 0 for p in simulator.players], dtype=np.int64)
+        self.refresh()
+
+    def refresh(self):
+        """Re-snapshot scores after the simulator conditions on new game results"""
+        sim = self.simulator
+        self.entry_scores = sim.scores[:sim.n_entries]
+        self.field_sorted = np.sort(sim.scores[sim.n_entries:], axis=0)
+        self.own_sorted = np.sort(self.entry_scores, axis=0)
+        self.base_payouts = sim.payout_distribution().mean(axis=1)
+
+    def _expected_payouts(self, rows: np.ndarray, new_scores: np.ndarray) -> np.ndarray:
+        """Mean payout of each candidate trial vector (candidates x simulations)"""
+        sim = self.simulator
+        n_field = self.field_sorted.shape[0]
+        old_scores = self.entry_scores[rows]
+        places = np.empty(new_scores.shape, dtype=np.float64)
+        for s in range(sim.n_simulations):
+            column = new_scores[:, s]
+            field_above = n_field - np.searchsorted(self.field_sorted[:, s], column, side='right')
+            own_above = sim.n_entries - np.searchsorted(self.own_sorted[:, s], column, side='right')
+            # The entry's own pre-swap score is not an opponent
+            own_above -= old_scores[:, s] > column
+            places[:, s] = 1 + own_above + field_above * sim.field_scale
+        return sim.payout_distribution(places).mean(axis=1)
+
+    def evaluate(self, swaps: List[Tuple[str, str, str]], batch_size: int = 512) -> List[SwapEvaluation]:
+        """Evaluate (entry_id, out_player_id, in_player_id) swaps, best expected payout gain first"""
+        sim = self.simulator
+        entry_row = {entry_id: row for row, entry_id in enumerate(sim.entry_ids)}
+        valid = [(entry_row[e], sim.player_index[o], sim.player_index[i], (e, o, i)) for e, o, i in swaps
+                 if e in entry_row and o in sim.player_index and i in sim.player_index]
+        if not valid:
+            return []
+
+        fee = sim.contest.entryFee
+        evaluations = []
+        for start in range(0, len(valid), batch_size):
+            batch = valid[start:start + batch_size]
+            rows = np.array([b[0] for b in batch])
+            out_cols = np.array([b[1] for b in batch])
+            in_cols = np.array([b[2] for b in batch])
+
+            new_scores = self.entry_scores[rows] + (sim.outcomes[:, in_cols] - sim.outcomes[:, out_cols]).T
+            payout_diff = self._expected_payouts(rows, new_scores) - self.base_payouts[rows]
+            score_diff = (sim.outcomes[:, in_cols] - sim.outcomes[:, out_cols]).mean(axis=0)
+
+            for k, (_, out_col, in_col, (entry_id, out_id, in_id)) in enumerate(batch):
+                evaluations.append(SwapEvaluation(
+                    entry_id=entry_id,
+                    out_player_id=out_id,
+                    in_player_id=in_id,
+                    salary_diff=int(self.salaries[in_col] - self.salaries[out_col]),
+                    mean_score_diff=round(float(score_diff[k]), 2),
+                    expected_payout_diff=round(float(payout_diff[k]), 2),
+                    roi_diff=round(float(payout_diff[k]) / fee, 4) if fee else 0.0
+                ))
+
+        evaluations.sort(key=lambda e: e.expected_payout_diff, reverse=True)
+        return evaluations
+
+    def candidate_swaps(self, locked_player_ids: Optional[set] = None) -> List[Tuple[str, str, str]]:
+        """Roster-legal, cap-legal swaps between players whose games have not started"""
+        sim = self.simulator
+        locked_player_ids = set(locked_player_ids or ())
+        started = set()
+        for game_id, cols in sim.game_columns.items():
+            if sim.fraction_remaining[game_id] < 1.0:
+                started.update(int(c) for c in cols)
+        positions = [self._position(player) for player in sim.players]
+        open_cols = [c for c in range(len(sim.players))
+                     if c not in started and sim.players[c].playerId not in locked_player_ids]
+        by_position: Dict[str, List[int]] = {}
+        for col in open_cols:
+            by_position.setdefault(positions[col], []).append(col)
+
+        swaps = []
+        for row, entry_id in enumerate(sim.entry_ids):
+            lineup = sim.lineups[row].indices.tolist()
+            lineup_cols = set(lineup)
+            locked = {c for c in lineup if c in started or sim.players[c].playerId in locked_player_ids}
+            pinned: List[str] = []
+            if self.slot_assigner is not None:
+                slots = self._current_slots(entry_id, lineup, positions)
+                if slots is None:
+                    continue
+                pinned = [slots[c] for c in lineup if c in locked]
+            remaining = self.salary_cap - int(self.salaries[lineup].sum())
+            for out_col in lineup:
+                if out_col in locked:
+                    continue
+                movable = [positions[c] for c in lineup if c != out_col and c not in locked]
+                budget = self.salaries[out_col] + remaining
+                for position, in_cols in by_position.items():
+                    if not self._fills_roster(pinned, movable, positions[out_col], position):
+                        continue
+                    for in_col in in_cols:
+                        if in_col not in lineup_cols and self.salaries[in_col] <= budget:
+                            swaps.append((entry_id, sim.players[out_col].playerId, sim.players[in_col].playerId))
+        return swaps
+
+    def _position(self, player: Any) -> str:
+        if not player.pos:
+            return ''
+        # Multi-position players keep every position when slots decide eligibility
+        return '/'.join(player.pos) if self.slot_assigner is not None else player.pos[0]
+
+    def _current_slots(self, entry_id: str, lineup: List[int], positions: List[str]) -> Optional[Dict[int, str]]:
+        """Column -> slot the entry currently plays it in, or None for an unfillable lineup"""
+        submitted = self.entry_slots.get(entry_id, {})
+        slots = [submitted.get(self.simulator.players[c].playerId) for c in lineup]
+        if None in slots:
+            slots = self.slot_assigner.assign([positions[c] for c in lineup])
+            if slots is None:
+                return None
+        return dict(zip(lineup, slots))
+
+    def _fills_roster(self, pinned: List[str], movable: List[str], out_position: str, in_position: str) -> bool:
+        if self.slot_assigner is None:
+            return in_position == out_position
+        # Locked players hold their slots; the rest and the incoming player fill what is left
+        return self.slot_assigner.assign_around(movable + [in_position], pinned) is not None
+
+    def best_swaps(self, locked_player_ids: Optional[set] = None, per_entry: int = 3) -> Dict[str, List[SwapEvaluation]]:
+        """Top positive-value swaps for every entry"""
+        best: Dict[str, List[SwapEvaluation]] = {}
+        for evaluation in self.evaluate(self.candidate_swaps(locked_player_ids)):
+            picks = best.setdefault(evaluation.entry_id, [])
+            if evaluation.expected_payout_diff > 0 and len(picks) < per_entry:
+                picks.append(evaluation)
+        return best
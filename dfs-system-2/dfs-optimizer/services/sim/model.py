@@ -6,6 +6,8 @@ ML-enhanced predictions, and hierarchical simulation
 
 import asyncio
 import logging
+import os
+import sys
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -28,6 +30,13 @@ except ImportError:
     logging.warning("Copulas library not available. Install with: pip install copulas")
 
 from ...packages.shared.types import Player, Contest, Lineup, SimulationResults
+from .model_store import ModelStore
+from .live_contest import LiveEntryResults, SwapEvaluation, LateSwapEvaluator
+from .live_contest import LiveContestSimulator as _LiveContestSimulator
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from src.advanced_optimizer.next_level_features import FieldOwnershipEquilibrium  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -184,6 +193,25 @@ class MLProjectionEnhancer:
         except Exception as e:
             logger.error(f"Failed to train ML model: {e}")
 
+    def save(self, store: ModelStore, name: str = 'ml_projection_enhancer'):
+        """Persist the fitted scaler and forest for other processes to memory-map"""
+        if not self.is_trained:
+            return
+        store.save(name, {'model': self.model, 'scaler': self.scaler, 'feature_columns': self.feature_columns},
+                   metadata={'n_estimators': self.model.n_estimators})
+
+    @classmethod
+    def load(cls, store: ModelStore, name: str = 'ml_projection_enhancer') -> 'MLProjectionEnhancer':
+        """Pre-trained enhancer with read-only memory-mapped arrays; untrained when nothing is stored"""
+        enhancer = cls()
+        saved = store.load(name)
+        if saved is not None:
+            enhancer.model = saved['model']
+            enhancer.scaler = saved['scaler']
+            enhancer.feature_columns = list(saved['feature_columns'])
+            enhancer.is_trained = True
+        return enhancer
+
     def enhance_projection(self, features: Dict[str, float]) -> Tuple[float, float]:
         """Enhance base projection with ML model"""
         if not self.is_trained:
@@ -514,13 +542,30 @@ class MonteCarloSimulator:
         self.player_sampler = PlayerOutcomeSampler(players, enhancements)
 
         # Build ownership data for field modeling
-        self.ownership_data = {}
-        for player in players:
-            self.ownership_data[player.playerId] = player.ownership or 0.15
+        self.ownership_equilibrium = self.enhancements.get('ownership_equilibrium', FieldOwnershipEquilibrium())
+        self.ownership_data = self._field_ownership(players)
 
         self.field_model = FieldModel(self.ownership_data)
         self.contest_simulator = ContestSimulator(contest, self.field_model) if contest else None
 
+    def _field_ownership(self, players: List[Player]) -> Dict[str, float]:
+        """Ownership the field actually rosters: projections fitted to cap-legal field lineups"""
+        ownership = {player.playerId: player.ownership or 0.15 for player in players}
+        pool = [player for player in players if player.pos and player.salary]
+        if self.ownership_equilibrium is None or not pool:
+            return ownership
+
+        equilibrium = self.ownership_equilibrium.solve(
+            [{'name': player.playerId, 'position': player.pos[0], 'salary': player.salary} for player in pool],
+            {player.playerId: ownership[player.playerId] * 100 for player in pool}
+        )
+        # No legal field for this roster (e.g. not a DK NFL slate): keep the projections
+        if not any(equilibrium.realized_ownership.values()):
+            return ownership
+        for player_id, realized in equilibrium.realized_ownership.items():
+            ownership[player_id] = realized / 100
+        return ownership
+
     def simulate_lineup(self, lineup: Lineup, n_simulations: int = 1000) -> SimulationResults:
         """Simulate a single lineup"""
         logger.info(f"Simulating lineup {lineup.lineupId} with {n_simulations} trials")
@@ -705,14 +750,18 @@ class AdvancedMonteCarloSimulator:
     """Advanced Monte Carlo simulator with all enhancements"""
 
     def __init__(self, players: List[Player], contest: Optional[Contest] = None,
-                 historical_data: Optional[pd.DataFrame] = None):
+                 historical_data: Optional[pd.DataFrame] = None,
+                 model_store: Optional[ModelStore] = None):
         self.players = players
         self.contest = contest
+        self.model_store = model_store
 
         # Initialize all enhancements
         self.historical_calibration = HistoricalCalibration()
         self.copula_model = CopulaCorrelationModel()
-        self.ml_enhancer = MLProjectionEnhancer()
+        # A pre-trained enhancer is memory-mapped from the store instead of retrained per simulator
+        self.ml_enhancer = MLProjectionEnhancer.load(model_store) if model_store is not None \
+            else MLProjectionEnhancer()
         self.hierarchical_sim = HierarchicalSimulator()
         self.adaptive_sampler = AdaptiveSampler(target_precision=0.01)
 
@@ -743,8 +792,11 @@ class AdvancedMonteCarloSimulator:
 
             # Train ML model (simplified - would need proper feature engineering)
             # For now, create mock training data
-            mock_training_data = self._create_mock_training_data(historical_data)
-            self.ml_enhancer.train(mock_training_data)
+            if not self.ml_enhancer.is_trained:
+                mock_training_data = self._create_mock_training_data(historical_data)
+                self.ml_enhancer.train(mock_training_data)
+                if self.model_store is not None:
+                    self.ml_enhancer.save(self.model_store)
 
             logger.info("Successfully trained all enhancement models")
 
@@ -909,6 +961,13 @@ class AdvancedMonteCarloSimulator:
             }
         }
 
+class LiveContestSimulator(_LiveContestSimulator):
+    """Live contest simulation with PlayerOutcomeSampler's team, game and position correlations"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('correlation', lambda players: PlayerOutcomeSampler(players).correlation_matrix)
+        super().__init__(*args, **kwargs)
+
 # Convenience functions
 async def simulate_lineup(lineup: Lineup, players: List[Player],
                          contest: Optional[Contest] = None,
@@ -0,0 +1,13 @@
+"""
+Model Store - memory-mapped model persistence
+Shared with the Python pipeline: the implementation lives in src/ai/model_store.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from src.ai.model_store import ModelStore  # noqa: E402
+
+__all__ = ['ModelStore']
@@ -8,19 +8,21 @@ import logging
 import random
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterator, AsyncIterator
 from dataclasses import dataclass
 from itertools import combinations
 import numpy as np
 
 try:
-    from pulp import LpProblem, LpVariable, LpMaximize, LpStatus, lpSum, LpInteger
+    from pulp import (LpProblem, LpVariable, LpMaximize, LpStatus, lpSum, LpInteger,
+                      PULP_CBC_CMD, LpSolutionOptimal, LpSolutionIntegerFeasible)
     PULP_AVAILABLE = True
 except ImportError:
     PULP_AVAILABLE = False
 
 from ...packages.shared.types import Player, Lineup, Ruleset, Site, Sport
 from .model import MonteCarloSimulator, calculate_overall_score
+from .lineup_index import LineupIndex
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,7 @@ class OptimizationResult:
     engine_used: str
     constraints_satisfied: bool
     error_message: Optional[str] = None
+    timed_out: bool = False  # True when the time budget cut the portfolio short
 
 class ILPOptimizer:
     """Integer Linear Programming optimizer using PuLP"""
@@ -45,21 +48,14 @@ class ILPOptimizer:
         if not PULP_AVAILABLE:
             raise ImportError("PuLP not available. Install with: pip install pulp")
 
-    def optimize(self, num_lineups: int = 1, objective: str = 'projection') -> OptimizationResult:
+    def optimize(self, num_lineups: int = 1, objective: str = 'projection',
+                 time_limit: Optional[float] = None,
+                 gap_target: Optional[float] = None) -> OptimizationResult:
         """Generate optimal lineups using ILP"""
         start_time = time.time()
 
         try:
-            lineups = []
-
-            for i in range(num_lineups):
-                lineup = self._solve_single_lineup(objective)
-                if lineup:
-                    # Add unique ID
-                    lineup.lineupId = f"ilp_{int(time.time())}_{i}"
-                    lineups.append(lineup)
-                else:
-                    break
+            lineups = list(self.iter_lineups(num_lineups, objective, time_limit, gap_target))
 
             generation_time = time.time() - start_time
 
@@ -68,7 +64,8 @@ class ILPOptimizer:
                 total_lineups=len(lineups),
                 generation_time=generation_time,
                 engine_used="ILP",
-                constraints_satisfied=len(lineups) > 0
+                constraints_satisfied=len(lineups) > 0,
+                timed_out=_hit_time_limit(len(lineups), num_lineups, generation_time, time_limit)
             )
 
         except Exception as e:
@@ -82,7 +79,34 @@ class ILPOptimizer:
                 error_message=str(e)
             )
 
-    def _solve_single_lineup(self, objective: str) -> Optional[Lineup]:
+    def iter_lineups(self, num_lineups: int = 1, objective: str = 'projection',
+                     time_limit: Optional[float] = None,
+                     gap_target: Optional[float] = None) -> Iterator[Lineup]:
+        """Yield distinct lineups as they are solved until the count or time budget runs out"""
+        deadline = time.monotonic() + time_limit if time_limit else None
+        previous_lineups = []
+
+        for i in range(num_lineups):
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.info(f"ILP time limit reached after {len(previous_lineups)} lineups")
+                    break
+
+            lineup = self._solve_single_lineup(objective, previous_lineups, remaining, gap_target)
+            if not lineup:
+                break
+
+            # Add unique ID
+            lineup.lineupId = f"ilp_{int(time.time())}_{i}"
+            previous_lineups.append(lineup)
+            yield lineup
+
+    def _solve_single_lineup(self, objective: str,
+                             previous_lineups: Optional[List[Lineup]] = None,
+                             time_limit: Optional[float] = None,
+                             gap_target: Optional[float] = None) -> Optional[Lineup]:
         """Solve for a single optimal lineup"""
         # Create the problem
         prob = LpProblem("DFS_Lineup_Optimization", LpMaximize)
@@ -111,17 +135,21 @@ class ILPOptimizer:
         # Exposure constraints
         self._add_exposure_constraints(prob, player_vars)
 
-        # Solve the problem
-        status = prob.solve()
+        # Never return a lineup we already produced
+        for previous in previous_lineups or []:
+            prob += lpSum([player_vars[pid] for pid in previous.playerIds if pid in player_vars]) <= len(previous.playerIds) - 1
+
+        # Solve the problem, keeping the incumbent if the time limit or gap target stops CBC early
+        prob.solve(PULP_CBC_CMD(msg=False, timeLimit=time_limit, gapRel=gap_target))
 
-        if LpStatus[status] == 'Optimal':
+        if prob.sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible):
             # Extract selected players
             selected_players = []
             total_salary = 0
             total_projection = 0
 
             for player in self.players:
-                if player_vars[player.playerId].value() == 1:
+                if (player_vars[player.playerId].value() or 0) > 0.5:
                     selected_players.append(player)
                     total_salary += player.salary
                     total_projection += player.projection or 0
@@ -273,22 +301,12 @@ class SimGuidedOptimizer:
         self.simulator = simulator
 
     def optimize(self, num_lineups: int = 20, n_simulations: int = 1000,
-                randomness: float = 0.1) -> OptimizationResult:
+                randomness: float = 0.1, time_limit: Optional[float] = None) -> OptimizationResult:
         """Generate lineups using sim-guided sampling"""
         start_time = time.time()
 
         try:
-            lineups = []
-            attempts = 0
-            max_attempts = num_lineups * 10  # Allow multiple attempts per lineup
-
-            while len(lineups) < num_lineups and attempts < max_attempts:
-                lineup = self._sample_lineup(randomness)
-                if lineup and self._validate_lineup(lineup):
-                    # Check for duplicates
-                    if not self._is_duplicate(lineup, lineups):
-                        lineups.append(lineup)
-                attempts += 1
+            lineups = list(self.iter_lineups(num_lineups, randomness, time_limit))
 
             # If we have a simulator, rank and select best lineups
             if self.simulator and len(lineups) > num_lineups:
@@ -301,7 +319,8 @@ class SimGuidedOptimizer:
                 total_lineups=len(lineups),
                 generation_time=generation_time,
                 engine_used="Sim-Guided",
-                constraints_satisfied=len(lineups) > 0
+                constraints_satisfied=len(lineups) > 0,
+                timed_out=_hit_time_limit(len(lineups), num_lineups, generation_time, time_limit)
             )
 
         except Exception as e:
@@ -315,6 +334,29 @@ class SimGuidedOptimizer:
                 error_message=str(e)
             )
 
+    def iter_lineups(self, num_lineups: int = 20, randomness: float = 0.1,
+                     time_limit: Optional[float] = None) -> Iterator[Lineup]:
+        """Yield valid, non-duplicate sampled lineups until the count or time budget runs out"""
+        deadline = time.monotonic() + time_limit if time_limit else None
+        lineups = []
+        lineup_index = LineupIndex(list(self.player_map), capacity=num_lineups)
+        attempts = 0
+        max_attempts = num_lineups * 10  # Allow multiple attempts per lineup
+
+        while len(lineups) < num_lineups and attempts < max_attempts:
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.info(f"Sim-guided time limit reached after {len(lineups)} lineups")
+                break
+
+            lineup = self._sample_lineup(randomness)
+            if lineup and self._validate_lineup(lineup):
+                # Check for duplicates
+                if not self._is_duplicate(lineup, lineup_index):
+                    lineups.append(lineup)
+                    lineup_index.add(lineup.playerIds)
+                    yield lineup
+            attempts += 1
+
     def _sample_lineup(self, randomness: float) -> Optional[Lineup]:
         """Sample a lineup using weighted random selection"""
         selected_players = []
@@ -534,13 +576,10 @@ class SimGuidedOptimizer:
 
         return True
 
-    def _is_duplicate(self, lineup: Lineup, existing_lineups: List[Lineup]) -> bool:
+    def _is_duplicate(self, lineup: Lineup, lineup_index: LineupIndex) -> bool:
         """Check if lineup is too similar to existing ones"""
-        for existing in existing_lineups:
-            overlap = len(set(lineup.playerIds) & set(existing.playerIds))
-            if overlap >= len(lineup.playerIds) * 0.8:  # 80% overlap
-                return True
-        return False
+        # One vectorized AND + popcount against the whole portfolio
+        return lineup_index.max_overlap(lineup.playerIds) >= len(lineup.playerIds) * 0.8  # 80% overlap
 
     async def _rank_by_simulation(self, lineups: List[Lineup], n_simulations: int) -> List[Lineup]:
         """Rank lineups by simulation results"""
@@ -618,22 +657,36 @@ class PortfolioOptimizer:
         # Simple implementation - could be much more sophisticated
         return lineups
 
+def _hit_time_limit(found: int, requested: int, elapsed: float,
+                    time_limit: Optional[float]) -> bool:
+    """Whether a short portfolio was caused by the time budget rather than infeasibility"""
+    return bool(time_limit) and found < requested and elapsed >= time_limit
+
 # Main optimization function
 async def optimize_lineups(players: List[Player], ruleset: Ruleset,
                           num_lineups: int = 20, engine: str = 'sim-guided',
                           objective: str = 'projection', randomness: float = 0.1,
-                          contest: Optional[Any] = None) -> OptimizationResult:
+                          contest: Optional[Any] = None,
+                          time_limit: Optional[float] = None,
+                          gap_target: Optional[float] = None) -> OptimizationResult:
     """Main optimization function"""
     try:
+        # Solvers are CPU bound, so run them in a worker thread to keep the event loop free
+        loop = asyncio.get_running_loop()
+
         if engine == 'ilp':
             if not PULP_AVAILABLE:
                 raise ImportError("PuLP not available for ILP optimization")
             optimizer = ILPOptimizer(players, ruleset)
-            return optimizer.optimize(num_lineups, objective)
+            return await loop.run_in_executor(
+                None, optimizer.optimize, num_lineups, objective, time_limit, gap_target
+            )
         else:  # sim-guided
             simulator = MonteCarloSimulator(players, contest) if contest else None
             optimizer = SimGuidedOptimizer(players, ruleset, simulator)
-            return optimizer.optimize(num_lineups, randomness=randomness)
+            return await loop.run_in_executor(
+                None, lambda: optimizer.optimize(num_lineups, randomness=randomness, time_limit=time_limit)
+            )
 
     except Exception as e:
         logger.error(f"Optimization failed: {e}")
@@ -645,3 +698,29 @@ async def optimize_lineups(players: List[Player], ruleset: Ruleset,
             constraints_satisfied=False,
             error_message=str(e)
         )
+
+async def stream_lineups(players: List[Player], ruleset: Ruleset,
+                         num_lineups: int = 20, engine: str = 'sim-guided',
+                         objective: str = 'projection', randomness: float = 0.1,
+                         time_limit: Optional[float] = None,
+                         gap_target: Optional[float] = None) -> AsyncIterator[Lineup]:
+    """Yield lineups as soon as each one is found, stopping at the time budget"""
+    if engine == 'ilp':
+        if not PULP_AVAILABLE:
+            raise ImportError("PuLP not available for ILP optimization")
+        lineup_iter = ILPOptimizer(players, ruleset).iter_lineups(
+            num_lineups, objective, time_limit, gap_target
+        )
+    else:  # sim-guided
+        lineup_iter = SimGuidedOptimizer(players, ruleset).iter_lineups(
+            num_lineups, randomness, time_limit
+        )
+
+    loop = asyncio.get_running_loop()
+    done = object()
+
+    while True:
+        lineup = await loop.run_in_executor(None, next, lineup_iter, done)
+        if lineup is done:
+            break
+        yield lineup
@@ -14,6 +14,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Any
 
+from src.advanced_optimizer.next_level_features import FieldOwnershipEquilibrium
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,6 +27,7 @@ class DraftKingsAPIProxy:
         self.base_url = "https://api.draftkings.com"
         self.lobby_url = "https://www.draftkings.com"
         self.session = None
+        self.ownership_equilibrium = FieldOwnershipEquilibrium()
         
     async def create_session(self):
         """Create aiohttp session with proper headers"""
@@ -141,7 +144,8 @@ class DraftKingsAPIProxy:
                     position = self.normalize_position(draftable.get('rosterSlotId', 'UTIL'))
                     team = self.extract_team(draftable)
                     
-                    # Generate estimated metrics based on salary/position
+                    # Generate estimated metrics based on salary/position; the ownership
+                    # guess is only the target the field fit starts from
                     projection = self.estimate_projection(position, salary)
                     ownership = self.estimate_ownership(salary, position)
                     boom_pct = self.estimate_boom_percentage(projection, position)
@@ -153,7 +157,6 @@ class DraftKingsAPIProxy:
                         'salary': salary,
                         'projection': projection,
                         'ownership': ownership,
-                        'leverage': round((projection / salary * 1000) / (ownership / 100), 2),
                         'boom_pct': boom_pct,
                         'ace_score': round((boom_pct * 0.8) + (projection * 3)),
                         'floor': round(projection * 0.7, 1),
@@ -170,6 +173,10 @@ class DraftKingsAPIProxy:
                 except Exception as e:
                     logger.warning(f"Error processing draftable: {str(e)}")
                     continue
+            
+            self.fit_field_ownership(players)
+            for player in players:
+                player['leverage'] = round((player['projection'] / player['salary'] * 1000) / (player['ownership'] / 100), 2)
                     
             logger.info(f"Processed {len(players)} players")
             return players
@@ -244,6 +251,22 @@ class DraftKingsAPIProxy:
         
         return max(1, round(base_ownership, 1))
     
+    def fit_field_ownership(self, players: List[Dict]):
+        """Replace the ownership guesses with what a cap-legal simulated field actually rosters"""
+        pool = [player for player in players if player['pos'] in ('QB', 'RB', 'WR', 'TE', 'DST')]
+        if not pool:
+            return
+        
+        equilibrium = self.ownership_equilibrium.solve(
+            [{'name': str(i), 'position': player['pos'], 'salary': player['salary']} for i, player in enumerate(pool)],
+            {str(i): player['ownership'] for i, player in enumerate(pool)}
+        )
+        # No legal field from this pool (e.g. a non-NFL slate): keep the estimates
+        if not any(equilibrium.realized_ownership.values()):
+            return
+        for i, player in enumerate(pool):
+            player['ownership'] = max(round(equilibrium.realized_ownership[str(i)], 1), 0.1)
+    
     def estimate_boom_percentage(self, projection: float, position: str) -> int:
         """Estimate boom percentage based on projection and position"""
         base_boom = min(95, projection * 3.5 + 20)
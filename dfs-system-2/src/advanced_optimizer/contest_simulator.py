@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import json
@@ -381,6 +382,18 @@ class AdvancedStackingEngine:
 class AdvancedOwnershipEngine:
     """Advanced ownership projection and game theory engine"""
     
+    FEATURES = ["salary", "projection", "value"]
+    # Weights on within-position percentile ranks (value enters inverted: contrarian)
+    CONTEST_WEIGHTS = {
+        ContestType.CASH: np.array([0.4 * 30, 0.6 * 40, 0.0]),
+        ContestType.GPP: np.array([0.3 * 30, 0.4 * 40, 0.3 * 25]),
+    }
+    CONTEST_WEIGHTS[ContestType.TOURNAMENT] = CONTEST_WEIGHTS[ContestType.GPP]
+    CONTEST_WEIGHTS[ContestType.SATELLITE] = CONTEST_WEIGHTS[ContestType.CASH]
+    CONTEST_WEIGHTS[ContestType.MULTIPLIER] = CONTEST_WEIGHTS[ContestType.CASH]
+    REFERENCE_FIELD_SIZE = 100000
+    CACHE_SIZE = 32
+    
     def __init__(self):
         self.ownership_factors = {
             "salary_factor": 0.25,    # Higher salary = higher ownership  
@@ -389,46 +402,80 @@ class AdvancedOwnershipEngine:
             "news_factor": 0.15,      # Breaking news impact
             "weather_factor": 0.10    # Weather impact on ownership
         }
+        self.calibration: Dict[ContestType, np.ndarray] = {}  # -> [salary, proj, value, intercept] weights
+        self._cache: "OrderedDict[Tuple, Dict[str, float]]" = OrderedDict()
     
     def project_field_ownership(self, players: List[Dict], 
                               contest_type: ContestType,
                               field_size: int = 100000) -> Dict[str, float]:
-        """Project ownership percentages for each player"""
-        
-        ownership_projections = {}
-        
-        for player in players:
-            # Base ownership calculation
-            salary = player["salary"]
-            projection = player.get("projection", 10.0)
-            value = player.get("value", 3.0)
-            
-            # Salary tier influence
-            salary_percentile = self._get_salary_percentile(salary, players)
-            salary_ownership = salary_percentile * 30  # High salary = high ownership
-            
-            # Projection influence  
-            proj_percentile = self._get_projection_percentile(projection, players)
-            proj_ownership = proj_percentile * 40
-            
-            # Value influence (inverse)
-            value_percentile = self._get_value_percentile(value, players)
-            value_ownership = (1 - value_percentile) * 25  # High value = lower ownership
-            
-            # Contest type adjustments
-            if contest_type == ContestType.CASH:
-                # Cash games: higher ownership on safe plays
-                base_ownership = salary_ownership * 0.4 + proj_ownership * 0.6
-            else:
-                # Tournaments: more spread out ownership
-                base_ownership = salary_ownership * 0.3 + proj_ownership * 0.4 + value_ownership * 0.3
-            
-            # Add randomness and specific adjustments
-            final_ownership = max(1.0, min(50.0, base_ownership + np.random.normal(0, 5)))
-            
-            ownership_projections[player["name"]] = round(final_ownership, 1)
-        
-        return ownership_projections
+        """Project ownership percentages for each player (cached per slate snapshot)"""
+        if not players:
+            return {}
+        contest_type = ContestType(contest_type)
+        key = (self._slate_fingerprint(players), contest_type, field_size)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return dict(cached)
+        
+        names = [player["name"] for player in players]
+        features = self._rank_features(players)
+        ownership = self._ownership_from_ranks(features, contest_type)
+        ownership = self._condition_on_field_size(ownership, field_size)
+        ownership_projections = dict(zip(names, np.round(np.clip(ownership, 1.0, 50.0), 1).tolist()))
+        
+        self._cache[key] = ownership_projections
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return dict(ownership_projections)
+    
+    def calibrate(self, slates: List[Tuple[List[Dict], Dict[str, float]]],
+                  contest_type: ContestType = ContestType.GPP) -> np.ndarray:
+        """Fit rank weights to historical actual ownership: [(players, {name: actual %}), ...]"""
+        rows, targets = [], []
+        for players, actual in slates:
+            features = self._rank_features(players)
+            for i, player in enumerate(players):
+                if player["name"] in actual:
+                    rows.append(features[i])
+                    targets.append(actual[player["name"]])
+        if not rows:
+            raise ValueError("No players with actual ownership to calibrate against")
+        
+        design = np.column_stack([np.array(rows), np.ones(len(rows))])
+        coefficients, *_ = np.linalg.lstsq(design, np.array(targets, dtype=float), rcond=None)
+        self.calibration[ContestType(contest_type)] = coefficients
+        self._cache.clear()
+        return coefficients
+    
+    def _rank_features(self, players: List[Dict]) -> np.ndarray:
+        """(players x features) percentile ranks within each position, value inverted"""
+        frame = pd.DataFrame({
+            "position": [player.get("position", "") for player in players],
+            "salary": [player.get("salary", 0) for player in players],
+            "projection": [player.get("projection", 10.0) for player in players],
+        })
+        frame["value"] = [player.get("value", 3.0) for player in players]
+        ranks = frame.groupby("position")[self.FEATURES].rank(pct=True).to_numpy()
+        ranks[:, 2] = 1.0 - ranks[:, 2]  # High value = lower ownership
+        return ranks
+    
+    def _ownership_from_ranks(self, features: np.ndarray, contest_type: ContestType) -> np.ndarray:
+        coefficients = self.calibration.get(contest_type)
+        if coefficients is not None:
+            return features @ coefficients[:-1] + coefficients[-1]
+        weights = self.CONTEST_WEIGHTS[contest_type]
+        return features @ weights
+    
+    def _condition_on_field_size(self, ownership: np.ndarray, field_size: int) -> np.ndarray:
+        """Smaller fields concentrate on chalk, larger fields spread out"""
+        concentration = np.clip(1 + 0.1 * np.log10(self.REFERENCE_FIELD_SIZE / max(field_size, 1)), 0.8, 1.4)
+        return 50.0 * (np.clip(ownership, 0.0, None) / 50.0) ** concentration
+    
+    @staticmethod
+    def _slate_fingerprint(players: List[Dict]) -> int:
+        return hash(tuple((player["name"], player.get("position", ""), player.get("salary", 0),
+                           player.get("projection", 10.0), player.get("value", 3.0)) for player in players))
     
     def calculate_leverage_scores(self, players: List[Dict], 
                                 ownership_projections: Dict[str, float]) -> Dict[str, float]:
@@ -447,21 +494,6 @@ class AdvancedOwnershipEngine:
             leverage_scores[name] = round(leverage, 2)
         
         return leverage_scores
-    
-    def _get_salary_percentile(self, salary: float, players: List[Dict]) -> float:
-        """Get salary percentile within player pool"""
-        salaries = [p["salary"] for p in players]
-        return np.percentile(salaries, salary) / max(salaries)
-    
-    def _get_projection_percentile(self, projection: float, players: List[Dict]) -> float:
-        """Get projection percentile within player pool"""
-        projections = [p.get("projection", 10.0) for p in players]
-        return np.percentile(projections, projection) / max(projections)
-    
-    def _get_value_percentile(self, value: float, players: List[Dict]) -> float:
-        """Get value percentile within player pool"""
-        values = [p.get("value", 3.0) for p in players]
-        return np.percentile(values, value) / max(values) if max(values) > 0 else 0.5
 
 class AdvancedLineupBuilder:
     """Advanced lineup construction with all professional features"""
@@ -10,15 +10,19 @@ Next-Level Advanced DFS Features
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 import json
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
+from scipy import sparse
 from scipy.spatial.distance import cosine, hamming
 import asyncio
 
+from ..optimize.lineup_index import LineupIndex
+
 class AILineupSelector:
     """AI-driven player selection using ML models instead of rules"""
     
@@ -165,89 +169,261 @@ class AILineupSelector:
 class FieldDuplicationDetector:
     """Detect how unique lineups are vs projected field"""
     
-    def __init__(self):
-        self.field_lineup_database = []
+    ROSTER_SLOTS = ['QB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE', 'FLEX', 'DST']
+    FLEX_ELIGIBILITY = {'FLEX': ['RB', 'WR', 'TE']}
+    
+    def __init__(self, batch_size: int = 25000, max_resample_rounds: int = 5):
+        self.field_matrix = np.empty((0, 0), dtype=np.int64)  # Sorted pool indexes, one row per field lineup
+        self.field_players: List[str] = []
+        self.field_index: Optional[LineupIndex] = None
+        self.exact_counts: Dict[bytes, int] = {}
+        self.batch_size = batch_size
+        self.max_resample_rounds = max_resample_rounds
         self.uniqueness_threshold = 0.15  # 15% of field playing similar lineup = not unique
     
+    @property
+    def field_lineup_database(self) -> List[List[str]]:
+        """Field lineups as sorted player name lists"""
+        return [[self.field_players[i] for i in row] for row in self.field_matrix]
+    
     def simulate_field_lineups(self, players: List[Dict], ownership_projections: Dict[str, float],
-                              field_size: int = 100000) -> List[List[str]]:
+                              field_size: int = 100000, salary_cap: int = 50000,
+                              seed: Optional[int] = None) -> np.ndarray:
         """Simulate what the field will play based on ownership"""
         print(f"🎯 Simulating {field_size:,} field lineups for uniqueness detection...")
         
-        field_lineups = []
-        
-        # Create weighted selection based on ownership
-        player_weights = []
-        for player in players:
-            ownership = ownership_projections.get(player['name'], 10.0)
-            # Higher ownership = higher probability of selection
-            weight = ownership / 100.0
-            player_weights.append(weight)
-        
-        # Generate field lineups
-        for _ in range(min(field_size, 10000)):  # Sample for performance
-            lineup = []
-            remaining_salary = 50000  # Simplified
+        rng = np.random.default_rng(seed)
+        names = [p['name'] for p in players]
+        positions = np.array([p['position'] for p in players])
+        salaries = np.array([p['salary'] for p in players], dtype=np.int64)
+        
+        # Higher ownership = higher probability of selection
+        weights = np.array([ownership_projections.get(name, 10.0) / 100.0 for name in names])
+        log_weights = np.log(np.maximum(weights, 1e-9))
+        
+        # Sample whole batches at once, dropping lineups over the cap and resampling the shortfall
+        batches = []
+        remaining = field_size
+        for _ in range(self.max_resample_rounds):
+            if remaining <= 0:
+                break
+            for start in range(0, remaining, self.batch_size):
+                batch = self._sample_field_batch(rng, positions, log_weights,
+                                                 min(self.batch_size, remaining - start))
+                if batch.shape[1] == 0:
+                    break
+                batches.append(batch[salaries[batch].sum(axis=1) <= salary_cap])
+            remaining = field_size - sum(len(b) for b in batches)
+        
+        if batches and batches[0].shape[1] >= 8:
+            field_matrix = np.sort(np.concatenate(batches)[:field_size], axis=1)
+        else:
+            field_matrix = np.empty((0, 0), dtype=np.int64)
+        
+        self._build_field_index(names, field_matrix)
+        print(f"  ✅ Generated {len(field_matrix):,} field simulation lineups")
+        return field_matrix
+    
+    def _sample_field_batch(self, rng: np.random.Generator, positions: np.ndarray,
+                            log_weights: np.ndarray, n: int) -> np.ndarray:
+        """Ownership-weighted sampling without replacement for n lineups (Gumbel top-k per slot)"""
+        columns = []
+        slot_counts: Dict[str, int] = {}
+        for slot in self.ROSTER_SLOTS:
+            if slot not in self.FLEX_ELIGIBILITY:
+                slot_counts[slot] = slot_counts.get(slot, 0) + 1
+        
+        # Fixed positions: top-k of perturbed log-weights is a weighted draw of k distinct players
+        for position, count in slot_counts.items():
+            candidates = np.flatnonzero(positions == position)
+            if len(candidates) < count:
+                continue
+            keys = log_weights[candidates] + rng.gumbel(size=(n, len(candidates)))
+            top = np.argpartition(-keys, count - 1, axis=1)[:, :count]
+            columns.append(candidates[top])
+        
+        if not columns:
+            return np.empty((n, 0), dtype=np.int64)
+        selected = np.concatenate(columns, axis=1)
+        
+        # Flex slots: same draw over eligible players, masking those already rostered
+        for slot in self.ROSTER_SLOTS:
+            eligible = self.FLEX_ELIGIBILITY.get(slot)
+            if eligible is None:
+                continue
+            candidates = np.flatnonzero(np.isin(positions, eligible))
+            local = np.full(len(positions), -1)
+            local[candidates] = np.arange(len(candidates))
             
-            # Weighted random selection based on ownership
-            available_players = players.copy()
+            keys = log_weights[candidates] + rng.gumbel(size=(n, len(candidates)))
+            taken = local[selected]
+            rows = np.broadcast_to(np.arange(n)[:, None], taken.shape)
+            keys[rows[taken >= 0], taken[taken >= 0]] = -np.inf
             
-            for position in ['QB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE', 'FLEX', 'DST']:
-                eligible = [p for p in available_players 
-                           if p['salary'] <= remaining_salary and 
-                           (p['position'] == position or position == 'FLEX')]
-                
-                if eligible:
-                    # Weighted selection based on ownership
-                    weights = [ownership_projections.get(p['name'], 10) / 100 for p in eligible]
-                    selected = np.random.choice(eligible, p=np.array(weights)/sum(weights))
-                    
-                    lineup.append(selected['name'])
-                    remaining_salary -= selected['salary']
-                    available_players.remove(selected)
-            
-            if len(lineup) >= 8:
-                field_lineups.append(sorted(lineup))  # Sort for comparison
+            choice = np.argmax(keys, axis=1)
+            if np.isfinite(keys[np.arange(n), choice]).all():
+                selected = np.column_stack([selected, candidates[choice]])
         
-        self.field_lineup_database = field_lineups
-        print(f"  ✅ Generated {len(field_lineups):,} field simulation lineups")
-        return field_lineups
+        return selected
+    
+    def _build_field_index(self, names: List[str], field_matrix: np.ndarray):
+        """Hash exact lineups and bitset-index the field for near-duplicate counts"""
+        self.field_players = names
+        self.field_matrix = field_matrix
+        self.field_index = LineupIndex(names, capacity=max(1, len(field_matrix)))
+        self.exact_counts = {}
+        if len(field_matrix) == 0:
+            return
+        
+        self.field_index.add_indices(field_matrix)
+        unique_rows, counts = np.unique(field_matrix, axis=0, return_counts=True)
+        self.exact_counts = {row.tobytes(): int(count) for row, count in zip(unique_rows, counts)}
     
     def calculate_lineup_uniqueness(self, user_lineup: List[Dict]) -> Dict[str, float]:
         """Calculate how unique a lineup is vs the field"""
-        if not self.field_lineup_database:
+        total = len(self.field_matrix)
+        if not total:
             return {"uniqueness": 0.5, "field_duplicate_rate": 0.1}
         
-        user_lineup_names = sorted([p['name'] for p in user_lineup])
+        user_names = {p['name'] for p in user_lineup}
         
-        # Count similar lineups in field
-        similar_count = 0
+        # Exact matches: O(1) lookup on the canonical (sorted) lineup
+        player_index = self.field_index.player_index
+        known = sorted(player_index[name] for name in user_names if name in player_index)
         exact_matches = 0
+        if len(known) == len(user_names) == self.field_matrix.shape[1]:
+            exact_matches = self.exact_counts.get(np.array(known, dtype=self.field_matrix.dtype).tobytes(), 0)
         
-        for field_lineup in self.field_lineup_database:
-            # Calculate similarity (Jaccard index)
-            user_set = set(user_lineup_names)
-            field_set = set(field_lineup)
-            
-            intersection = len(user_set.intersection(field_set))
-            union = len(user_set.union(field_set))
-            similarity = intersection / union if union > 0 else 0
-            
-            if similarity >= 0.8:  # 80%+ similar
-                similar_count += 1
-            if similarity == 1.0:  # Exact match
-                exact_matches += 1
+        # Near duplicates: Jaccard from bitset overlaps against the whole field
+        intersections = self.field_index.overlaps(user_names).astype(np.float64)
+        unions = len(user_names) + self.field_matrix.shape[1] - intersections
+        similar_count = int(np.count_nonzero(intersections >= 0.8 * unions))  # 80%+ similar
         
-        uniqueness_score = 1.0 - (similar_count / len(self.field_lineup_database))
-        duplicate_rate = exact_matches / len(self.field_lineup_database)
+        uniqueness_score = 1.0 - (similar_count / total)
+        duplicate_rate = exact_matches / total
         
         return {
             "uniqueness": uniqueness_score,
             "field_duplicate_rate": duplicate_rate,
             "similar_lineups_count": similar_count,
-            "total_field_lineups": len(self.field_lineup_database),
+            "total_field_lineups": total,
             "uniqueness_percentile": uniqueness_score * 100
         }
+    
+    def calculate_portfolio_uniqueness(self, lineups: List[Dict]) -> Dict[str, Dict[str, float]]:
+        """Uniqueness for every lineup in a portfolio, keyed by lineup id"""
+        return {
+            lineup.get('id', f'lineup_{i+1}'): self.calculate_lineup_uniqueness(lineup['players'])
+            for i, lineup in enumerate(lineups)
+        }
+
+@dataclass
+class OwnershipEquilibrium:
+    """Selection weights whose simulated field reproduces a target ownership"""
+    selection_weights: Dict[str, float]   # Pass to simulate_field_lineups as ownership input
+    realized_ownership: Dict[str, float]  # Percent of field lineups rostering each player
+    target_ownership: Dict[str, float]    # Targets rescaled to what the roster can absorb
+    rounds: int
+    max_error: float                      # Largest |realized - target| in ownership points
+    converged: bool
+
+class FieldOwnershipEquilibrium:
+    """Iteratively fits field selection weights until simulated ownership matches projections"""
+    
+    def __init__(self, detector: Optional[FieldDuplicationDetector] = None, lineups_per_round: int = 20000,
+                 max_rounds: int = 8, tolerance: float = 0.5, step: float = 0.7):
+        self.detector = detector or FieldDuplicationDetector()
+        self.lineups_per_round = lineups_per_round
+        self.max_rounds = max_rounds
+        self.tolerance = tolerance  # Ownership points (sampling noise is also accepted)
+        self.step = step
+    
+    def solve(self, players: List[Dict], target_ownership: Dict[str, float],
+              salary_cap: int = 50000, seed: Optional[int] = None) -> OwnershipEquilibrium:
+        """Multiplicative weight updates on log selection weights, one vectorized field per round"""
+        print(f"⚖️ Fitting field ownership equilibrium for {len(players)} players...")
+        
+        rng = np.random.default_rng(seed)
+        names = [p['name'] for p in players]
+        positions = np.array([p['position'] for p in players])
+        salaries = np.array([p['salary'] for p in players], dtype=np.int64)
+        target = np.array([max(target_ownership.get(name, 1.0), 0.01) for name in names]) / 100.0
+        position_codes = np.unique(positions, return_inverse=True)[1]
+        
+        log_weights = np.log(target)
+        realized = np.zeros(len(players))
+        scaled_target = target
+        max_error = np.inf
+        converged = False
+        rounds = 0
+        
+        for rounds in range(1, self.max_rounds + 1):
+            field = self._sample_valid_field(rng, positions, salaries, log_weights, salary_cap)
+            if len(field) == 0:
+                break
+            realized = np.bincount(field.ravel(), minlength=len(players)) / len(field)
+            
+            # Each position can only absorb the slots the roster gives it: keep the target's
+            # shape within a position and match its total to what the field actually rosters
+            realized_totals = np.bincount(position_codes, weights=realized)
+            scaled_target = self._feasible_targets(target, realized_totals, position_codes)
+            
+            error = np.abs(realized - scaled_target)
+            max_error = float(error.max()) * 100
+            # Stop once every gap is within tolerance or within sampling noise of this field size
+            noise = 4.0 * np.sqrt(scaled_target * (1 - np.minimum(scaled_target, 1.0)) / len(field))
+            converged = bool(np.all(error <= np.maximum(self.tolerance / 100, noise)))
+            if converged:
+                break
+            
+            # Raise under-owned players and damp over-owned ones; unseen players get a bounded push
+            ratio = np.log(np.maximum(scaled_target, 1e-9)) - np.log(np.maximum(realized, 0.5 / len(field)))
+            log_weights = log_weights + self.step * np.clip(ratio, -2.0, 2.0)
+            # Re-centre per position: a constant shift changes nothing in the draw
+            log_weights -= np.bincount(position_codes, weights=log_weights)[position_codes] / \
+                np.bincount(position_codes)[position_codes]
+        
+        weights = np.exp(log_weights)
+        weights = weights / weights.max() * 100.0
+        print(f"  ✅ Equilibrium after {rounds} rounds (max error {max_error:.2f} pts{'' if converged else ', not converged'})")
+        
+        return OwnershipEquilibrium(
+            selection_weights=dict(zip(names, weights.tolist())),
+            realized_ownership=dict(zip(names, np.round(realized * 100, 2).tolist())),
+            target_ownership=dict(zip(names, np.round(scaled_target * 100, 2).tolist())),
+            rounds=rounds,
+            max_error=max_error,
+            converged=converged
+        )
+    
+    @staticmethod
+    def _feasible_targets(target: np.ndarray, position_totals: np.ndarray, position_codes: np.ndarray,
+                          max_share: float = 0.95) -> np.ndarray:
+        """Rescale targets to each position's total, capping players and spreading the excess"""
+        scaled = target.copy()
+        capped = np.zeros(len(target), dtype=bool)
+        for _ in range(10):
+            free_totals = np.bincount(position_codes, weights=np.where(capped, 0.0, scaled))
+            capped_totals = np.bincount(position_codes, weights=np.where(capped, scaled, 0.0))
+            scale = (position_totals - capped_totals) / np.maximum(free_totals, 1e-12)
+            scaled = np.where(capped, scaled, scaled * scale[position_codes])
+            over = ~capped & (scaled > max_share)
+            if not over.any():
+                break
+            scaled[over] = max_share
+            capped |= over
+        return scaled
+    
+    def _sample_valid_field(self, rng: np.random.Generator, positions: np.ndarray, salaries: np.ndarray,
+                            log_weights: np.ndarray, salary_cap: int) -> np.ndarray:
+        batches = []
+        for start in range(0, self.lineups_per_round, self.detector.batch_size):
+            n = min(self.detector.batch_size, self.lineups_per_round - start)
+            batch = self.detector._sample_field_batch(rng, positions, log_weights, n)
+            if batch.shape[1] == 0:
+                return np.empty((0, 0), dtype=np.int64)
+            batches.append(batch[salaries[batch].sum(axis=1) <= salary_cap])
+        return np.concatenate(batches)
 
 class LineupSimilarityAnalyzer:
     """Measure similarity across your lineup portfolio"""
@@ -255,80 +431,90 @@ class LineupSimilarityAnalyzer:
     def __init__(self):
         self.similarity_metrics = {}
     
-    def analyze_portfolio_similarity(self, lineups: List[Dict]) -> Dict[str, Any]:
+    def analyze_portfolio_similarity(self, lineups: List[Dict], include_matrix: bool = True,
+                                     top_k: int = 1) -> Dict[str, Any]:
         """Analyze similarity across your entire lineup portfolio"""
         print(f"📊 Analyzing similarity across {len(lineups)} lineup portfolio...")
         
         if len(lineups) < 2:
             return {"avg_similarity": 0, "diversification_score": 1.0}
         
-        similarity_matrix = []
-        lineup_vectors = []
-        
-        # Convert lineups to player vectors
-        all_players = set()
-        for lineup in lineups:
-            for player in lineup['players']:
-                all_players.add(player['name'])
+        # Binary lineup x player matrix; one sparse product gives every pairwise intersection
+        lineup_matrix = self._build_lineup_matrix(lineups)
+        intersections = (lineup_matrix @ lineup_matrix.T).toarray().astype(np.float64)
+        lineup_sizes = np.diag(intersections).copy()
+        unions = lineup_sizes[:, None] + lineup_sizes[None, :] - intersections
         
-        all_players = sorted(list(all_players))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            similarity_matrix = np.where(unions > 0, intersections / unions, 0.0)
+        np.fill_diagonal(similarity_matrix, 1.0)
         
-        # Create binary vectors for each lineup
-        for lineup in lineups:
-            vector = [1 if player in [p['name'] for p in lineup['players']] else 0 
-                     for player in all_players]
-            lineup_vectors.append(vector)
-        
-        # Calculate pairwise similarities
-        similarities = []
-        for i in range(len(lineup_vectors)):
-            row = []
-            for j in range(len(lineup_vectors)):
-                if i == j:
-                    similarity = 1.0
-                else:
-                    # Jaccard similarity
-                    vec1, vec2 = lineup_vectors[i], lineup_vectors[j]
-                    intersection = sum(a * b for a, b in zip(vec1, vec2))
-                    union = sum(max(a, b) for a, b in zip(vec1, vec2))
-                    similarity = intersection / union if union > 0 else 0
-                
-                row.append(similarity)
-                if i != j:
-                    similarities.append(similarity)
-            
-            similarity_matrix.append(row)
+        # Upper triangle holds each distinct pair once
+        rows, cols = np.triu_indices(len(lineups), k=1)
+        pair_similarities = similarity_matrix[rows, cols]
         
         # Portfolio analysis
-        avg_similarity = np.mean(similarities)
-        max_similarity = np.max(similarities)
-        min_similarity = np.min(similarities)
+        avg_similarity = float(pair_similarities.mean())
+        max_similarity = float(pair_similarities.max())
+        min_similarity = float(pair_similarities.min())
         diversification_score = 1.0 - avg_similarity  # Higher = more diverse
         
-        # Identify most/least similar lineup pairs
-        similarity_pairs = []
-        for i in range(len(lineups)):
-            for j in range(i + 1, len(lineups)):
-                similarity_pairs.append({
-                    'lineup1': lineups[i]['id'],
-                    'lineup2': lineups[j]['id'], 
-                    'similarity': similarity_matrix[i][j],
-                    'overlap_players': self._get_overlap_players(lineups[i], lineups[j])
-                })
+        # Identify most/least similar lineup pairs without sorting every pair
+        k = max(1, min(top_k, len(pair_similarities)))
+        most_similar = self._top_k_pairs(-pair_similarities, k)
+        least_similar = self._top_k_pairs(pair_similarities, k)
+        
+        def describe(pair_idx: int) -> Dict[str, Any]:
+            i, j = rows[pair_idx], cols[pair_idx]
+            return {
+                'lineup1': lineups[i]['id'],
+                'lineup2': lineups[j]['id'],
+                'similarity': float(pair_similarities[pair_idx]),
+                'overlap_players': self._get_overlap_players(lineups[i], lineups[j])
+            }
         
-        # Sort by similarity
-        similarity_pairs.sort(key=lambda x: x['similarity'], reverse=True)
+        most_similar_pairs = [describe(idx) for idx in most_similar]
+        least_similar_pairs = [describe(idx) for idx in least_similar]
         
-        return {
+        analysis = {
             'avg_similarity': round(avg_similarity, 3),
             'max_similarity': round(max_similarity, 3),
             'min_similarity': round(min_similarity, 3),
             'diversification_score': round(diversification_score, 3),
-            'most_similar_pair': similarity_pairs[0] if similarity_pairs else None,
-            'least_similar_pair': similarity_pairs[-1] if similarity_pairs else None,
-            'similarity_matrix': similarity_matrix,
+            'most_similar_pair': most_similar_pairs[0],
+            'least_similar_pair': least_similar_pairs[0],
+            'most_similar_pairs': most_similar_pairs,
+            'least_similar_pairs': least_similar_pairs,
             'portfolio_grade': self._grade_portfolio_diversity(diversification_score)
         }
+        
+        # The full N x N matrix is large for big portfolios, so callers can opt out
+        if include_matrix:
+            analysis['similarity_matrix'] = similarity_matrix.tolist()
+        
+        return analysis
+    
+    def _build_lineup_matrix(self, lineups: List[Dict]) -> sparse.csr_matrix:
+        """Build a sparse binary lineup x player matrix"""
+        player_columns = {}
+        row_idx, col_idx = [], []
+        
+        for i, lineup in enumerate(lineups):
+            for name in {p['name'] for p in lineup['players']}:
+                row_idx.append(i)
+                col_idx.append(player_columns.setdefault(name, len(player_columns)))
+        
+        data = np.ones(len(row_idx), dtype=np.int32)
+        return sparse.csr_matrix((data, (row_idx, col_idx)),
+                                 shape=(len(lineups), max(1, len(player_columns))))
+    
+    def _top_k_pairs(self, scores: np.ndarray, k: int) -> np.ndarray:
+        """Indexes of the k smallest scores, ordered"""
+        if k < len(scores):
+            candidates = np.argpartition(scores, k - 1)[:k]
+        else:
+            candidates = np.arange(len(scores))
+        return candidates[np.argsort(scores[candidates], kind='stable')]
     
     def _get_overlap_players(self, lineup1: Dict, lineup2: Dict) -> List[str]:
         """Get overlapping players between two lineups"""
@@ -645,6 +831,7 @@ class NextLevelDFSEngine:
         self.sport = sport
         self.ai_selector = AILineupSelector(sport)
         self.field_detector = FieldDuplicationDetector()
+        self.ownership_equilibrium = FieldOwnershipEquilibrium(self.field_detector)
         self.similarity_analyzer = LineupSimilarityAnalyzer()
         self.ownership_engine = AdaptiveOwnershipEngine()
         self.ev_dashboard = LiveEVDashboard()
@@ -662,9 +849,12 @@ class NextLevelDFSEngine:
         # Step 2: Calculate adaptive ownership
         adaptive_ownership = await self.ownership_engine.get_adaptive_ownership(players, live_data)
         
-        # Step 3: Simulate field lineups for uniqueness detection
+        # Step 3: Simulate field lineups for uniqueness detection, with selection weights
+        # fitted so the simulated field actually plays the projected ownership
+        salary_cap = lineup_constraints.get('salary_cap', 50000)
+        equilibrium = self.ownership_equilibrium.solve(players, adaptive_ownership, salary_cap)
         field_lineups = self.field_detector.simulate_field_lineups(
-            players, adaptive_ownership, contest_info.get('field_size', 100000)
+            players, equilibrium.selection_weights, contest_info.get('field_size', 100000), salary_cap
         )
         
         # Step 4: Generate AI-driven lineups
@@ -688,15 +878,13 @@ class NextLevelDFSEngine:
         live_ev_data = self.ev_dashboard.calculate_live_ev(ai_lineups, contest_info, adaptive_ownership)
         
         # Step 7: Check uniqueness vs field
-        uniqueness_results = {}
-        for lineup in ai_lineups:
-            uniqueness = self.field_detector.calculate_lineup_uniqueness(lineup['players'])
-            uniqueness_results[lineup['id']] = uniqueness
+        uniqueness_results = self.field_detector.calculate_portfolio_uniqueness(ai_lineups)
         
         # Compile complete analysis
         complete_analysis = {
             'ai_lineups': ai_lineups,
             'adaptive_ownership': adaptive_ownership,
+            'field_ownership': equilibrium.realized_ownership,
             'similarity_analysis': similarity_analysis,
             'live_ev_data': live_ev_data,
             'uniqueness_results': uniqueness_results,
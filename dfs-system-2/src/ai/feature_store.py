@@ -0,0 +1,176 @@
+"""
+Rolling Feature Store - weekly player/team usage features materialized from play-by-play
+Play-by-play is reduced to player-week and team-week counts in one grouped aggregation
+each, rolled over trailing windows, turned into rate features (target share, air yards
+share, red-zone share, snap share, EPA per play, completion rate, yards per attempt) and
+written to season/week partitions keyed by (player_id, season, week). Projection code
+reads the latest row per player instead of recomputing from raw plays.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..ingest.partitioned_store import PartitionedPlayStore
+
+WINDOWS = (3, 5)
+DEFAULT_WINDOW = 5
+KEY = ['player_id', 'season', 'week']
+
+PLAYER_COUNTS = ['games', 'targets', 'receptions', 'air_yards', 'rz_opportunities', 'rush_attempts',
+                 'pass_attempts', 'completions', 'passing_yards', 'opportunities', 'epa']
+SNAP_COUNTS = ['snaps', 'team_snaps']
+TEAM_COUNTS = ['team_games', 'team_plays', 'team_pass_plays', 'team_targets', 'team_air_yards',
+               'team_rz_plays', 'team_epa']
+
+# feature name -> (numerator, denominator) over rolled sums
+PLAYER_RATES = {
+    'targets': ('targets', 'games'),
+    'air_yards': ('air_yards', 'games'),
+    'target_share': ('targets', 'team_targets'),
+    'air_yards_share': ('air_yards', 'team_air_yards'),
+    'red_zone_share': ('rz_opportunities', 'team_rz_plays'),
+    'snap_share': ('snaps', 'team_snaps'),
+    'epa_per_play': ('epa', 'opportunities'),
+    'completion_rate': ('completions', 'pass_attempts'),
+    'yards_per_attempt': ('passing_yards', 'pass_attempts'),
+}
+TEAM_RATES = {
+    'team_plays': ('team_plays', 'team_games'),
+    'team_pass_rate': ('team_pass_plays', 'team_plays'),
+    'team_epa_per_play': ('team_epa', 'team_plays'),
+}
+
+
+def _values(plays: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in plays.columns:
+        return np.zeros(len(plays))
+    return pd.to_numeric(plays[column], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+
+def _ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    return (numerator / denominator.where(denominator > 0)).fillna(0.0)
+
+
+def weekly_usage(pbp: pd.DataFrame, snap_counts: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Player-week counting stats with their team-week totals alongside.
+    snap_counts: optional player_id/season/week/snaps/team_snaps rows."""
+    plays = pbp[pbp['play_type'].isin(['pass', 'run'])] if 'play_type' in pbp.columns else pbp
+    plays = plays[plays['posteam'].notna()]
+    keys = {'season': plays['season'].to_numpy(), 'week': plays['week'].to_numpy(),
+            'team': plays['posteam'].to_numpy()}
+    red_zone = _values(plays, 'yardline_100') <= 20
+    if 'yardline_100' not in plays.columns:
+        red_zone[:] = False
+    complete = _values(plays, 'complete_pass')
+    air_yards = _values(plays, 'air_yards')
+    epa = _values(plays, 'epa')
+    zeros = np.zeros(len(plays))
+
+    # One long frame of (player, play) rows across roles, then a single grouped sum
+    roles = []
+    for role, columns in (
+        ('receiver_player_id', {'targets': 1.0, 'receptions': complete, 'air_yards': air_yards,
+                                'rz_opportunities': red_zone.astype(float)}),
+        ('rusher_player_id', {'rush_attempts': 1.0, 'rz_opportunities': red_zone.astype(float)}),
+        ('passer_player_id', {'pass_attempts': _values(plays, 'pass_attempt'), 'completions': complete,
+                              'passing_yards': _values(plays, 'passing_yards')}),
+    ):
+        if role not in plays.columns:
+            continue
+        mask = plays[role].notna().to_numpy()
+        frame = {'player_id': plays[role].to_numpy()[mask]}
+        frame.update({k: v[mask] for k, v in keys.items()})
+        for name in PLAYER_COUNTS:
+            value = columns.get(name, zeros)
+            frame[name] = value[mask] if isinstance(value, np.ndarray) else np.full(mask.sum(), value)
+        frame['opportunities'] = np.ones(mask.sum())
+        frame['epa'] = epa[mask]
+        roles.append(pd.DataFrame(frame))
+    if not roles:
+        return pd.DataFrame(columns=KEY + ['team'] + PLAYER_COUNTS + SNAP_COUNTS + TEAM_COUNTS)
+
+    players = pd.concat(roles, ignore_index=True) \
+        .groupby(['player_id', 'season', 'week', 'team'], sort=False)[PLAYER_COUNTS].sum().reset_index()
+    players['games'] = 1.0
+
+    targeted = plays['receiver_player_id'].notna().to_numpy() if 'receiver_player_id' in plays.columns \
+        else np.zeros(len(plays), dtype=bool)
+    teams = pd.DataFrame({**keys,
+                          'team_plays': 1.0,
+                          'team_pass_plays': _values(plays, 'pass_attempt'),
+                          'team_targets': targeted.astype(float),
+                          'team_air_yards': np.where(targeted, air_yards, 0.0),
+                          'team_rz_plays': red_zone.astype(float),
+                          'team_epa': epa}) \
+        .groupby(['team', 'season', 'week'], sort=False).sum().reset_index()
+    teams['team_games'] = 1.0
+
+    weekly = players.merge(teams[['team', 'season', 'week'] + TEAM_COUNTS], on=['team', 'season', 'week'],
+                           how='left')
+
+    # Without snap counts, opportunities over team plays stands in for snap share
+    weekly['snaps'] = weekly['opportunities']
+    weekly['team_snaps'] = weekly['team_plays']
+    if snap_counts is not None and not snap_counts.empty:
+        snaps = weekly[KEY].merge(snap_counts[KEY + SNAP_COUNTS], on=KEY, how='left')
+        has_snaps = snaps['snaps'].notna().to_numpy()
+        weekly.loc[has_snaps, SNAP_COUNTS] = snaps.loc[has_snaps, SNAP_COUNTS].to_numpy()
+    return weekly
+
+
+def rolling_features(weekly: pd.DataFrame, windows: Sequence[int] = WINDOWS) -> pd.DataFrame:
+    """Trailing-window rates per player through each week (inclusive)"""
+    weekly = weekly.sort_values(KEY).reset_index(drop=True)
+    features = weekly[KEY + ['team']].copy()
+    grouped = weekly.groupby(['player_id', 'season'], sort=False)[PLAYER_COUNTS + SNAP_COUNTS + TEAM_COUNTS]
+    for window in windows:
+        rolled = grouped.rolling(window, min_periods=1).sum().reset_index(level=[0, 1], drop=True).sort_index()
+        for name, (numerator, denominator) in {**PLAYER_RATES, **TEAM_RATES}.items():
+            features[f"{name}_l{window}"] = _ratio(rolled[numerator], rolled[denominator]).to_numpy()
+    return features
+
+
+class FeatureStore:
+    """Materialized rolling features in season/week partitions"""
+
+    def __init__(self, root: Path, windows: Sequence[int] = WINDOWS):
+        self.windows = tuple(windows)
+        self.store = PartitionedPlayStore(Path(root), file_name='features.parquet')
+
+    def materialize(self, pbp: pd.DataFrame, snap_counts: Optional[pd.DataFrame] = None) -> Dict[int, List[int]]:
+        """Compute features from a season's play-by-play and write the weeks that are not final yet"""
+        features = rolling_features(weekly_usage(pbp, snap_counts), self.windows)
+        written = {}
+        for season, season_features in features.groupby('season'):
+            season = int(season)
+            first_open = self.store.first_open_week(season)
+            open_weeks = season_features[season_features['week'] >= first_open]
+            written[season] = self.store.write_weeks(season, open_weeks)
+        return written
+
+    def latest_season(self) -> Optional[int]:
+        seasons = [int(season) for season, weeks in self.store.manifest.items() if weeks]
+        return max(seasons) if seasons else None
+
+    def lookup(self, player_ids: Iterable[str], season: int, week: Optional[int] = None,
+               columns: Optional[List[str]] = None, max_lookback: int = 4) -> pd.DataFrame:
+        """Latest stored features for each player entering `week` (all stored weeks when None)"""
+        wanted = {str(pid) for pid in player_ids}
+        weeks = [w for w in self.store.stored_weeks(season) if week is None or w < week]
+        found = []
+        # Newest partition first; byes and injuries push a few players one partition back
+        for stored_week in reversed(weeks[-max_lookback:]):
+            if not wanted:
+                break
+            rows = self.store.load(seasons=[season], weeks=[stored_week],
+                                   columns=(KEY + columns) if columns else None,
+                                   filters=[('player_id', 'in', sorted(wanted))])
+            if len(rows):
+                found.append(rows)
+                wanted -= set(rows['player_id'].astype(str))
+        if not found:
+            return pd.DataFrame(columns=['player_id'])
+        return pd.concat(found, ignore_index=True)
@@ -0,0 +1,101 @@
+"""
+Model Store - parallel model fitting and memory-mapped model persistence
+Independent models are fitted in separate worker processes (joblib / loky). Fitted
+models are dumped uncompressed so their numpy arrays can be memory-mapped on load:
+every process that loads a model maps the same read-only file pages instead of
+retraining or copying it, and repeat loads within a process come from a memo.
+(scikit-learn trees copy their node arrays when unpickled, so forests load fast
+but are not shared; coefficient and scaler arrays are.)
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+# (path, mtime_ns, mmap_mode) -> loaded object, shared read-only within the process
+_loaded: Dict[Tuple[str, int, Optional[str]], Any] = {}
+
+
+def fit_parallel(fit: Callable[..., Any], tasks: Dict[str, tuple],
+                 n_jobs: Optional[int] = None) -> Dict[str, Any]:
+    """Run fit(*args) for every task in its own worker process; {name: result}.
+    fit must be a module-level function; n_jobs=1 fits in-process."""
+    if not tasks:
+        return {}
+    if n_jobs is None:
+        n_jobs = min(len(tasks), os.cpu_count() or 1)
+    results = joblib.Parallel(n_jobs=n_jobs, backend='loky')(
+        joblib.delayed(fit)(*args) for args in tasks.values())
+    return dict(zip(tasks, results))
+
+
+class ModelStore:
+    """Fitted models as joblib files under one directory, with a JSON manifest"""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.root / MANIFEST_NAME
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}.joblib"
+
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def exists(self, name: str) -> bool:
+        return self.path(name).exists()
+
+    def metadata(self, name: str) -> Dict[str, Any]:
+        return self.manifest().get(name, {}).get('metadata', {})
+
+    def save(self, name: str, obj: Any, metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """Dump uncompressed (compressed files cannot be memory-mapped) and record it in the manifest"""
+        path = self.path(name)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        joblib.dump(obj, tmp_path)
+        os.replace(tmp_path, path)
+
+        manifest = self.manifest()
+        manifest[name] = {
+            'file': path.name,
+            'created_at': datetime.now().isoformat(),
+            'bytes': path.stat().st_size,
+            'metadata': metadata or {},
+        }
+        manifest_tmp = self.manifest_path.with_suffix(f".tmp{os.getpid()}")
+        with open(manifest_tmp, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(manifest_tmp, self.manifest_path)
+        logger.info(f"Saved model {name} to {path}")
+        return path
+
+    def load(self, name: str, mmap_mode: Optional[str] = 'r') -> Optional[Any]:
+        """Stored object with its arrays memory-mapped (read-only by default); None when missing.
+        A file rewritten since the last load is loaded again."""
+        path = self.path(name)
+        try:
+            key = (str(path.resolve()), path.stat().st_mtime_ns, mmap_mode)
+        except OSError:
+            return None
+        obj = _loaded.get(key)
+        if obj is None:
+            obj = joblib.load(path, mmap_mode=mmap_mode)
+            # Drop stale versions of the same file
+            for stale in [k for k in _loaded if k[0] == key[0]]:
+                del _loaded[stale]
+            _loaded[key] = obj
+        return obj
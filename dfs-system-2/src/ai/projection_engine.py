@@ -17,16 +17,46 @@ except ImportError:
     HAS_ML_LIBS = False
 
 from ..data.schemas import SportType, Projection
+from .feature_store import DEFAULT_WINDOW, FeatureStore
+from .model_store import ModelStore, fit_parallel
+
+# Identifier columns never fed to the models
+ID_COLUMNS = ['player_id', 'name', 'team', 'position', 'game_id']
+PREDICTION_CACHE_SIZE = 100000  # Cached predictions per model before the cache is reset
+
+
+def _fit_model(model, scaler, X_train, X_test, y_train, y_test):
+    """Fit one scaler + model pair (runs in a worker process); returns (model, scaler, scores)"""
+    try:
+        # Scale features
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
+        
+        # Train model
+        model.fit(X_train_scaled, y_train)
+        
+        # Evaluate
+        y_pred = model.predict(X_test_scaled)
+        mse = mean_squared_error(y_test, y_pred)
+        mae = mean_absolute_error(y_test, y_pred)
+        return model, scaler, {'mse': mse, 'mae': mae, 'rmse': np.sqrt(mse)}
+    
+    except Exception as e:
+        return model, scaler, {"error": str(e)}
+
 
 class AIProjectionEngine:
     """AI-powered projection engine with ensemble methods"""
     
-    def __init__(self, sport: SportType, config_dir: str = "src/config"):
+    def __init__(self, sport: SportType, config_dir: str = "src/config",
+                 feature_store: Optional[FeatureStore] = None):
         self.sport = sport
         self.config_dir = Path(config_dir)
+        self.feature_store = feature_store
         self.models = {}
         self.scalers = {}
         self.feature_importance = {}
+        self._prediction_cache: Dict[str, Dict[int, float]] = {}  # model -> feature-row hash -> prediction
         
         # Load AI configuration
         self.ai_config = self._load_ai_config()
@@ -75,6 +105,10 @@ class AIProjectionEngine:
         """Create feature matrix for ML models"""
         features = player_data.copy()
         
+        # Materialized usage features (NFL) come from the feature store by player key
+        if self.feature_store is not None and self.sport == SportType.NFL and 'player_id' in features.columns:
+            features = self._add_stored_features(features)
+        
         # Add contextual features based on sport
         if self.sport == SportType.NBA:
             features = self._add_nba_features(features, contextual_data)
@@ -86,30 +120,63 @@ class AIProjectionEngine:
         
         return features
     
+    def _add_stored_features(self, features: pd.DataFrame) -> pd.DataFrame:
+        """Join each player's latest rolling features entering the slate week"""
+        season = int(features['season'].iloc[0]) if 'season' in features.columns else self.feature_store.latest_season()
+        week = int(features['week'].iloc[0]) if 'week' in features.columns else None
+        if season is None:
+            return features
+        
+        stored = self.feature_store.lookup(features['player_id'].astype(str), season, week)
+        if stored.empty:
+            return features
+        stored = stored.drop(columns=[c for c in ('season', 'week', 'team') if c in stored.columns])
+        features = features.assign(_key=features['player_id'].astype(str)) \
+            .merge(stored.rename(columns={'player_id': '_key'}), on='_key', how='left', suffixes=('', '_stored')) \
+            .drop(columns='_key')
+        
+        # The model's share features use the default window
+        for name in ('snap_share', 'target_share', 'red_zone_share'):
+            column = f"{name}_l{DEFAULT_WINDOW}"
+            if column in features.columns:
+                features[name] = features[name].fillna(features[column]) if name in features.columns \
+                    else features[column]
+        return features
+    
+    def _placeholder(self, features: pd.DataFrame, column: str, low: float, high: float) -> np.ndarray:
+        """Stand-in values in [low, high) for inputs without a real source yet. Drawn from a hash
+        of the player id and column, so a player's inputs (and cached predictions) are stable"""
+        key = next((col for col in ('player_id', 'name') if col in features.columns), None)
+        if key is None:
+            return np.random.uniform(low, high, len(features))
+        hashes = pd.util.hash_pandas_object(features[key].astype(str) + f"|{column}", index=False).to_numpy()
+        unit = (hashes >> np.uint64(11)).astype(float) / float(1 << 53)
+        return low + unit * (high - low)
+    
     def _add_nba_features(self, features: pd.DataFrame, contextual_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """Add NBA-specific features"""
         # Usage rate and pace features
         if 'usage_rate' not in features.columns:
-            features['usage_rate'] = np.random.uniform(0.15, 0.35, len(features))  # Placeholder
+            features['usage_rate'] = self._placeholder(features, 'usage_rate', 0.15, 0.35)  # Placeholder
         
         if 'pace' not in features.columns:
-            features['pace'] = np.random.uniform(95, 105, len(features))  # Placeholder
+            features['pace'] = self._placeholder(features, 'pace', 95, 105)  # Placeholder
         
         # Minutes projections
         if 'projected_minutes' not in features.columns:
-            features['projected_minutes'] = np.random.uniform(15, 40, len(features))
+            features['projected_minutes'] = self._placeholder(features, 'projected_minutes', 15, 40)
         
         # Rest days
-        features['rest_days'] = np.random.randint(0, 4, len(features))
+        features['rest_days'] = np.floor(self._placeholder(features, 'rest_days', 0, 4)).astype(int)
         
         # Back-to-back indicator
-        features['back_to_back'] = np.random.choice([0, 1], len(features), p=[0.8, 0.2])
+        features['back_to_back'] = (self._placeholder(features, 'back_to_back', 0, 1) < 0.2).astype(int)
         
         # Team pace factor
-        features['team_pace'] = np.random.uniform(95, 105, len(features))
+        features['team_pace'] = self._placeholder(features, 'team_pace', 95, 105)
         
         # Defensive rating against position
-        features['opp_def_rating'] = np.random.uniform(100, 120, len(features))
+        features['opp_def_rating'] = self._placeholder(features, 'opp_def_rating', 100, 120)
         
         return features
     
@@ -117,26 +184,27 @@ class AIProjectionEngine:
         """Add NFL-specific features"""
         # Snap share
         if 'snap_share' not in features.columns:
-            features['snap_share'] = np.random.uniform(0.3, 1.0, len(features))
+            features['snap_share'] = self._placeholder(features, 'snap_share', 0.3, 1.0)
         
         # Target share for pass catchers
         if 'target_share' not in features.columns:
-            features['target_share'] = np.random.uniform(0.1, 0.3, len(features))
+            features['target_share'] = self._placeholder(features, 'target_share', 0.1, 0.3)
         
         # Red zone usage
-        features['red_zone_share'] = np.random.uniform(0.05, 0.25, len(features))
+        if 'red_zone_share' not in features.columns:
+            features['red_zone_share'] = self._placeholder(features, 'red_zone_share', 0.05, 0.25)
         
         # Weather impact (for outdoor games)
-        features['weather_impact'] = np.random.uniform(0.0, 0.3, len(features))
+        features['weather_impact'] = self._placeholder(features, 'weather_impact', 0.0, 0.3)
         
         # Vegas game total
-        features['game_total'] = np.random.uniform(40, 55, len(features))
+        features['game_total'] = self._placeholder(features, 'game_total', 40, 55)
         
         # Team implied total
-        features['team_total'] = np.random.uniform(17, 35, len(features))
+        features['team_total'] = self._placeholder(features, 'team_total', 17, 35)
         
         # Defense vs position ranking
-        features['dvp_rank'] = np.random.randint(1, 33, len(features))
+        features['dvp_rank'] = np.floor(self._placeholder(features, 'dvp_rank', 1, 33)).astype(int)
         
         return features
     
@@ -145,181 +213,172 @@ class AIProjectionEngine:
         # Salary-based features
         if 'salary' in features.columns:
             features['salary_per_1k'] = features['salary'] / 1000
-            features['value_score'] = np.random.uniform(3, 8, len(features))  # Points per $1k
+            features['value_score'] = self._placeholder(features, 'value_score', 3, 8)  # Points per $1k
         
         # Injury risk score
-        features['injury_risk'] = np.random.uniform(0.0, 0.3, len(features))
+        features['injury_risk'] = self._placeholder(features, 'injury_risk', 0.0, 0.3)
         
         # Ownership projection
         if 'projected_ownership' not in features.columns:
-            features['projected_ownership'] = np.random.uniform(0.02, 0.4, len(features))
+            features['projected_ownership'] = self._placeholder(features, 'projected_ownership', 0.02, 0.4)
         
         # Recent form (last 5 games average)
-        features['recent_form'] = np.random.uniform(0.8, 1.2, len(features))
+        features['recent_form'] = self._placeholder(features, 'recent_form', 0.8, 1.2)
         
         # Matchup difficulty score
-        features['matchup_difficulty'] = np.random.uniform(0.0, 1.0, len(features))
+        features['matchup_difficulty'] = self._placeholder(features, 'matchup_difficulty', 0.0, 1.0)
         
         return features
     
-    def train_models(self, training_data: pd.DataFrame, target_column: str = 'actual_points') -> Dict[str, float]:
-        """Train ensemble models on historical data"""
+    def train_models(self, training_data: pd.DataFrame, target_column: str = 'actual_points',
+                     n_jobs: Optional[int] = None) -> Dict[str, float]:
+        """Train ensemble models on historical data, one worker process per model (n_jobs=1: in-process)"""
         if not HAS_ML_LIBS:
             return {"error": "ML libraries not available"}
         
         # Prepare features
         feature_columns = [col for col in training_data.columns 
-                          if col not in ['actual_points', 'player_id', 'name', 'team', 'position', 'game_id']]
+                          if col != target_column and col not in ID_COLUMNS]
         
         X = training_data[feature_columns].fillna(0)
         y = training_data[target_column].fillna(0)
         
+        # Retrained models invalidate every cached prediction
+        self._prediction_cache.clear()
+        
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
+        # Each model and its scaler are fitted in their own worker process
+        tasks = {model_name: (model, self.scalers[model_name], X_train, X_test, y_train, y_test)
+                 for model_name, model in self.models.items()}
+        results = fit_parallel(_fit_model, tasks, n_jobs=n_jobs)
+        
         model_scores = {}
         
-        for model_name, model in self.models.items():
-            try:
-                # Scale features
-                X_train_scaled = self.scalers[model_name].fit_transform(X_train)
-                X_test_scaled = self.scalers[model_name].transform(X_test)
-                
-                # Train model
-                model.fit(X_train_scaled, y_train)
-                
-                # Evaluate
-                y_pred = model.predict(X_test_scaled)
-                mse = mean_squared_error(y_test, y_pred)
-                mae = mean_absolute_error(y_test, y_pred)
-                
-                model_scores[model_name] = {
-                    'mse': mse,
-                    'mae': mae,
-                    'rmse': np.sqrt(mse)
-                }
-                
-                # Store feature importance
-                if hasattr(model, 'feature_importances_'):
-                    importance_dict = dict(zip(feature_columns, model.feature_importances_))
-                    self.feature_importance[model_name] = importance_dict
-                
-                print(f"{model_name} - RMSE: {np.sqrt(mse):.3f}, MAE: {mae:.3f}")
-                
-            except Exception as e:
-                print(f"Error training {model_name}: {e}")
-                model_scores[model_name] = {"error": str(e)}
+        for model_name, (model, scaler, scores) in results.items():
+            if 'error' in scores:
+                print(f"Error training {model_name}: {scores['error']}")
+                model_scores[model_name] = scores
+                continue
+            
+            # Fitted copies come back from the workers
+            self.models[model_name] = model
+            self.scalers[model_name] = scaler
+            model_scores[model_name] = scores
+            
+            # Store feature importance
+            if hasattr(model, 'feature_importances_'):
+                importance_dict = dict(zip(feature_columns, model.feature_importances_))
+                self.feature_importance[model_name] = importance_dict
+            
+            print(f"{model_name} - RMSE: {scores['rmse']:.3f}, MAE: {scores['mae']:.3f}")
         
         return model_scores
     
     def generate_projections(self, player_data: pd.DataFrame, contextual_data: Dict[str, pd.DataFrame]) -> List[Projection]:
-        """Generate projections using ensemble methods"""
+        """Generate projections using ensemble methods, one batch per model over the whole slate"""
         # Create features
         features = self.create_features(player_data, contextual_data)
+        if features.empty:
+            return []
         
-        projections = []
+        # Generate baseline projections
+        baseline = self._generate_baseline_projections(features)
         
-        for _, player in features.iterrows():
-            # Generate baseline projection
-            baseline_proj = self._generate_baseline_projection(player)
-            
-            # Generate ML projections if available
-            ml_projections = {}
-            if HAS_ML_LIBS and self.models:
-                ml_projections = self._generate_ml_projections(player, features.columns)
-            
-            # Ensemble the projections
-            final_projection = self._ensemble_projections(baseline_proj, ml_projections, player)
-            
-            projections.append(final_projection)
+        # Generate ML projections if available
+        ml_predictions = {}
+        if HAS_ML_LIBS and self.models:
+            ml_predictions = self._generate_ml_predictions(features)
         
-        return projections
+        # Ensemble the projections
+        return self._ensemble_projections(baseline, ml_predictions, features)
     
-    def _generate_baseline_projection(self, player: pd.Series) -> Dict[str, float]:
-        """Generate rules-based baseline projection"""
+    def _generate_baseline_projections(self, features: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Generate rules-based baseline projections for every row"""
+        n = len(features)
         # Simple baseline based on salary and position
-        salary = player.get('salary', 5000)
-        position = player.get('position', 'FLEX')
+        salary = features['salary'].fillna(5000).to_numpy(dtype=float) if 'salary' in features.columns \
+            else np.full(n, 5000.0)
+        position = features['position'].fillna('FLEX').to_numpy() if 'position' in features.columns \
+            else np.full(n, 'FLEX')
         
         if self.sport == SportType.NBA:
             # NBA baseline: roughly 5-6 points per $1000 salary
-            base_points = (salary / 1000) * np.random.uniform(4.5, 6.0)
+            base_points = (salary / 1000) * np.random.uniform(4.5, 6.0, n)
             
             # Position adjustments
-            if position in ['PG', 'SG']:
-                base_points *= np.random.uniform(0.95, 1.1)
-            elif position in ['SF', 'PF']:
-                base_points *= np.random.uniform(0.9, 1.05)
-            else:  # C
-                base_points *= np.random.uniform(0.85, 1.0)
+            guards = np.isin(position, ['PG', 'SG'])
+            forwards = np.isin(position, ['SF', 'PF'])
+            factor = np.where(guards, np.random.uniform(0.95, 1.1, n),
+                              np.where(forwards, np.random.uniform(0.9, 1.05, n),
+                                       np.random.uniform(0.85, 1.0, n)))  # C
         
         else:  # NFL
             # NFL baseline: roughly 2.5-3.5 points per $1000 salary
-            base_points = (salary / 1000) * np.random.uniform(2.2, 3.8)
+            base_points = (salary / 1000) * np.random.uniform(2.2, 3.8, n)
             
             # Position adjustments
-            if position == 'QB':
-                base_points *= np.random.uniform(1.1, 1.3)
-            elif position == 'RB':
-                base_points *= np.random.uniform(0.9, 1.2)
-            elif position in ['WR', 'TE']:
-                base_points *= np.random.uniform(0.8, 1.1)
-            else:  # DST
-                base_points *= np.random.uniform(0.7, 1.0)
+            factor = np.select(
+                [position == 'QB', position == 'RB', np.isin(position, ['WR', 'TE'])],
+                [np.random.uniform(1.1, 1.3, n), np.random.uniform(0.9, 1.2, n), np.random.uniform(0.8, 1.1, n)],
+                default=np.random.uniform(0.7, 1.0, n)  # DST
+            )
+        base_points = base_points * factor
         
         return {
-            'mean': max(base_points, 0),
+            'mean': np.maximum(base_points, 0),
             'std': base_points * 0.3,  # 30% standard deviation
-            'floor': max(base_points * 0.6, 0),
+            'floor': np.maximum(base_points * 0.6, 0),
             'ceiling': base_points * 1.8
         }
     
-    def _generate_ml_projections(self, player: pd.Series, feature_columns: List[str]) -> Dict[str, Dict[str, float]]:
-        """Generate ML-based projections"""
+    def _feature_matrix(self, features: pd.DataFrame) -> pd.DataFrame:
+        """Numeric model inputs: identifier columns dropped, missing values zeroed"""
+        matrix = features.drop(columns=[col for col in ID_COLUMNS if col in features.columns])
+        return matrix.apply(pd.to_numeric, errors='coerce').fillna(0).astype(float)
+    
+    def _generate_ml_predictions(self, features: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Raw model predictions for every row; rows seen before are served from the cache"""
         if not self.models:
             return {}
         
-        ml_projections = {}
-        
-        # Prepare feature vector
-        feature_vector = []
-        for col in feature_columns:
-            if col in ['player_id', 'name', 'team', 'position', 'game_id']:
-                continue
-            value = player.get(col, 0)
-            if pd.isna(value):
-                value = 0
-            feature_vector.append(float(value))
-        
-        feature_vector = np.array(feature_vector).reshape(1, -1)
+        matrix = self._feature_matrix(features)
+        predictions = {}
         
         for model_name, model in self.models.items():
             try:
-                # Scale features
-                feature_vector_scaled = self.scalers[model_name].transform(feature_vector)
+                scaler = self.scalers[model_name]
+                # Match the training column order when the scaler recorded it
+                columns = getattr(scaler, 'feature_names_in_', None)
+                X = matrix.reindex(columns=columns, fill_value=0.0) if columns is not None else matrix
+                
+                row_hashes = pd.util.hash_pandas_object(X, index=False).to_numpy()
+                cache = self._prediction_cache.setdefault(model_name, {})
+                cached = np.array([cache.get(h, np.nan) for h in row_hashes.tolist()], dtype=float)
+                missing = np.isnan(cached)
                 
-                # Predict
-                prediction = model.predict(feature_vector_scaled)[0]
+                if missing.any():
+                    # One scale + predict call for every uncached row
+                    X_scaled = scaler.transform(X[missing])
+                    cached[missing] = model.predict(X_scaled)
+                    if len(cache) > PREDICTION_CACHE_SIZE:
+                        cache.clear()
+                    cache.update(zip(row_hashes[missing].tolist(), cached[missing].tolist()))
                 
-                ml_projections[model_name] = {
-                    'mean': max(prediction, 0),
-                    'std': prediction * 0.25,  # 25% standard deviation for ML
-                    'floor': max(prediction * 0.7, 0),
-                    'ceiling': prediction * 1.6
-                }
+                predictions[model_name] = cached
                 
             except Exception as e:
                 print(f"Error generating ML projection with {model_name}: {e}")
         
-        return ml_projections
+        return predictions
     
-    def _ensemble_projections(self, baseline: Dict[str, float], 
-                            ml_projections: Dict[str, Dict[str, float]], 
-                            player: pd.Series) -> Projection:
+    def _ensemble_projections(self, baseline: Dict[str, np.ndarray],
+                            ml_predictions: Dict[str, np.ndarray],
+                            features: pd.DataFrame) -> List[Projection]:
         """Combine baseline and ML projections using weighted ensemble"""
         
         # Default weights from config
-        ensemble_config = self.ai_config.get('projection_engines', {}).get('ensemble_ml', {})
         baseline_weight = 0.4
         ml_weight = 0.6
         
@@ -329,34 +388,46 @@ class AIProjectionEngine:
             ml_weight = 1.0 - baseline_weight
         
         # Start with baseline
-        final_mean = baseline['mean'] * baseline_weight
-        final_std = baseline['std'] * baseline_weight
-        final_floor = baseline['floor'] * baseline_weight
-        final_ceiling = baseline['ceiling'] * baseline_weight
-        
-        # Add ML projections
-        if ml_projections:
-            ml_count = len(ml_projections)
-            ml_weight_per_model = ml_weight / ml_count
-            
-            for model_name, proj in ml_projections.items():
-                final_mean += proj['mean'] * ml_weight_per_model
-                final_std += proj['std'] * ml_weight_per_model
-                final_floor += proj['floor'] * ml_weight_per_model
-                final_ceiling += proj['ceiling'] * ml_weight_per_model
-        
-        # Create projection object
-        return Projection(
-            player_id=str(player.get('player_id', player.get('name', 'unknown'))),
-            sport=self.sport,
-            mean=final_mean,
-            floor=final_floor,
-            ceiling=final_ceiling,
-            std=final_std,
-            baseline_projection=baseline['mean'],
-            ml_projection=final_mean - baseline['mean'] * baseline_weight if ml_projections else None,
-            confidence=min(0.9, 0.5 + len(ml_projections) * 0.1)  # Higher confidence with more models
-        )
+        final = {stat: values * baseline_weight for stat, values in baseline.items()}
+        
+        # Add ML projections (25% standard deviation for ML)
+        if ml_predictions:
+            predictions = np.vstack(list(ml_predictions.values()))  # models x players
+            ml_stats = {
+                'mean': np.maximum(predictions, 0),
+                'std': predictions * 0.25,
+                'floor': np.maximum(predictions * 0.7, 0),
+                'ceiling': predictions * 1.6
+            }
+            ml_weight_per_model = ml_weight / len(ml_predictions)
+            for stat, values in ml_stats.items():
+                final[stat] = final[stat] + values.sum(axis=0) * ml_weight_per_model
+        
+        if 'player_id' in features.columns:
+            player_ids = features['player_id']
+        elif 'name' in features.columns:
+            player_ids = features['name']
+        else:
+            player_ids = pd.Series(['unknown'] * len(features))
+        
+        ml_projection = final['mean'] - baseline['mean'] * baseline_weight
+        confidence = min(0.9, 0.5 + len(ml_predictions) * 0.1)  # Higher confidence with more models
+        
+        # Create projection objects
+        return [
+            Projection(
+                player_id=str(player_id),
+                sport=self.sport,
+                mean=float(final['mean'][i]),
+                floor=float(final['floor'][i]),
+                ceiling=float(final['ceiling'][i]),
+                std=float(final['std'][i]),
+                baseline_projection=float(baseline['mean'][i]),
+                ml_projection=float(ml_projection[i]) if ml_predictions else None,
+                confidence=confidence
+            )
+            for i, player_id in enumerate(player_ids.tolist())
+        ]
     
     def get_feature_importance(self, model_name: str = None) -> Dict[str, float]:
         """Get feature importance from trained models"""
@@ -379,11 +450,10 @@ class AIProjectionEngine:
         return avg_importance
     
     def save_models(self, output_dir: str):
-        """Save trained models and scalers"""
+        """Save trained models and scalers (memory-mappable joblib) plus a JSON summary"""
         output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
+        output_path.mkdir(parents=True, exist_ok=True)
         
-        # Save models (would use joblib in real implementation)
         model_info = {
             'sport': self.sport.value,
             'models': list(self.models.keys()),
@@ -391,7 +461,30 @@ class AIProjectionEngine:
             'created_at': datetime.now().isoformat()
         }
         
+        ModelStore(output_path).save(
+            self._model_name,
+            {'models': self.models, 'scalers': self.scalers, 'feature_importance': self.feature_importance},
+            metadata={'models': model_info['models']}
+        )
+        
         with open(output_path / 'model_info.json', 'w') as f:
             json.dump(model_info, f, indent=2)
         
-        print(f"Model information saved to {output_path}")
+        print(f"Models saved to {output_path}")
+    
+    def load_models(self, input_dir: str, mmap_mode: Optional[str] = 'r') -> bool:
+        """Load models saved by save_models; arrays are memory-mapped read-only and shared
+        across processes. Returns False when nothing is stored."""
+        saved = ModelStore(Path(input_dir)).load(self._model_name, mmap_mode=mmap_mode)
+        if saved is None:
+            return False
+        
+        self.models = dict(saved['models'])
+        self.scalers = dict(saved['scalers'])
+        self.feature_importance = dict(saved['feature_importance'])
+        self._prediction_cache.clear()
+        return True
+    
+    @property
+    def _model_name(self) -> str:
+        return f"{self.sport.value.lower()}_ensemble"
@@ -256,6 +256,14 @@ class OptimizationConfig(BaseModel):
     # Advanced
     randomness: float = Field(0.0, ge=0, le=1, description="Randomness factor")
     ownership_penalty: float = Field(0.0, description="Ownership penalty factor")
+    
+    # Anytime solving
+    time_limit_seconds: Optional[float] = Field(None, gt=0, description="Wall-clock budget for the whole portfolio")
+    gap_target: Optional[float] = Field(None, ge=0, le=1, description="Relative MIP gap at which a solve may stop")
+    
+    # Roster slot assignment
+    late_swap_flexibility: bool = Field(False, description="Put later-game players in FLEX/UTIL slots")
+    game_start_times: Optional[Dict[str, datetime]] = Field(None, description="Start time per game ID")
 
 # Simulation Models  
 class SimulationResult(BaseModel):
@@ -3,12 +3,13 @@ Base Ingestor Class - Foundation for all data ingestors
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 import pandas as pd
 import os
-import json
+
+from .columnar_cache import ColumnarCache, Filters
 
 class BaseIngestor(ABC):
     """Abstract base class for all data ingestors"""
@@ -18,6 +19,7 @@ class BaseIngestor(ABC):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.cache_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'cache')
         os.makedirs(self.cache_dir, exist_ok=True)
+        self.cache = ColumnarCache(self.cache_dir, default_format=config.get('cache_format', 'parquet'))
 
     @abstractmethod
     def fetch_data(self) -> Dict[str, pd.DataFrame]:
@@ -57,46 +59,26 @@ class BaseIngestor(ABC):
             self.logger.error(f"Error cleaning data: {e}")
             return data
 
-    def cache_data(self, data: pd.DataFrame, filename: str, ttl_hours: int = 24) -> None:
-        """Cache data to disk with TTL"""
+    def cache_data(self, data: pd.DataFrame, filename: str, ttl_hours: int = 24,
+                   format: Optional[str] = None) -> None:
+        """Cache data to disk with TTL (Parquet by default, 'arrow' for memory-mappable IPC)"""
         try:
-            cache_file = os.path.join(self.cache_dir, filename)
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'ttl_hours': ttl_hours,
-                'data': data.to_dict('records')
-            }
-
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, default=str)
-
+            cache_file = self.cache.write(filename, data, ttl_hours, format)
             self.logger.info(f"Cached data to {cache_file}")
 
         except Exception as e:
             self.logger.error(f"Error caching data: {e}")
 
-    def load_cached_data(self, filename: str) -> Optional[pd.DataFrame]:
-        """Load cached data if still valid"""
+    def load_cached_data(self, filename: str, columns: Optional[List[str]] = None,
+                         filters: Optional[Filters] = None, memory_map: bool = False) -> Optional[pd.DataFrame]:
+        """Load cached data if still valid, reading only the requested columns and matching rows"""
         try:
-            cache_file = os.path.join(self.cache_dir, filename)
-
-            if not os.path.exists(cache_file):
-                return None
-
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
-
-            # Check if cache is still valid
-            cache_time = datetime.fromisoformat(cache_data['timestamp'])
-            ttl_hours = cache_data['ttl_hours']
-            expiry_time = cache_time + timedelta(hours=ttl_hours)
-
-            if datetime.now() > expiry_time:
-                self.logger.info(f"Cache expired for {filename}")
+            if not self.cache.is_valid(filename):
+                if self.cache.manifest(filename) is not None:
+                    self.logger.info(f"Cache expired for {filename}")
                 return None
 
-            # Convert back to DataFrame
-            data = pd.DataFrame(cache_data['data'])
+            data = self.cache.read(filename, columns=columns, filters=filters, memory_map=memory_map)
             self.logger.info(f"Loaded cached data from {filename}")
             return data
 
@@ -104,6 +86,21 @@ class BaseIngestor(ABC):
             self.logger.error(f"Error loading cached data: {e}")
             return None
 
+    def cached_fetch(self, filename: str, fetch: Callable[[], pd.DataFrame], ttl_hours: int = 24,
+                     **read_kwargs) -> pd.DataFrame:
+        """Cached frame when still valid, otherwise fetch and cache non-empty results"""
+        data = self.load_cached_data(filename, **read_kwargs)
+        if data is not None:
+            return data
+
+        data = fetch()
+        if isinstance(data, pd.DataFrame) and not data.empty:
+            self.cache_data(data, filename, ttl_hours)
+            if read_kwargs:
+                # Same projection / filters as a cache hit would have returned
+                return self.load_cached_data(filename, **read_kwargs)
+        return data
+
     def get_data_quality_report(self, data: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
         """Generate comprehensive data quality report"""
         report = {
@@ -0,0 +1,156 @@
+"""
+Columnar Cache - Parquet / Arrow IPC storage for ingestor DataFrames
+Each entry is one data file plus a small JSON sidecar manifest carrying its TTL and
+schema, so freshness checks never open the data. Reads push column projection and
+row filters down to the file; Arrow IPC entries can be memory-mapped so several
+processes share the same pages.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+
+# DNF filters as accepted by pyarrow.parquet: [('week', '>=', 10), ('position', 'in', ['QB', 'WR'])]
+Filters = Sequence[Tuple[str, str, Any]]
+
+
+class ColumnarCache:
+    """TTL'd columnar entries under one directory"""
+
+    def __init__(self, cache_dir: str, default_format: str = 'parquet',
+                 row_group_size: int = 64 * 1024, compression: str = 'zstd'):
+        if default_format not in FORMATS:
+            raise ValueError(f"Unknown cache format: {default_format}")
+        self.cache_dir = cache_dir
+        self.default_format = default_format
+        self.row_group_size = row_group_size
+        self.compression = compression
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def entry_name(filename: str) -> str:
+        """Legacy callers pass 'players.json'; the entry is keyed by the stem"""
+        stem, ext = os.path.splitext(filename)
+        return stem if ext in ('.json', '.parquet', '.arrow', '.csv') else filename
+
+    def _manifest_path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}.manifest.json")
+
+    def manifest(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._manifest_path(self.entry_name(name)), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_valid(self, name: str) -> bool:
+        manifest = self.manifest(name)
+        if manifest is None:
+            return False
+        expiry = datetime.fromisoformat(manifest['timestamp']) + timedelta(hours=manifest['ttl_hours'])
+        return datetime.now() <= expiry and os.path.exists(os.path.join(self.cache_dir, manifest['file']))
+
+    def write(self, name: str, data: pd.DataFrame, ttl_hours: float = 24,
+              format: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Write the frame and then its manifest (the manifest marks the entry complete).
+        metadata: small JSON-able dict kept in the manifest, e.g. the hash of the source content"""
+        name = self.entry_name(name)
+        format = format or self.default_format
+        if format not in FORMATS:
+            raise ValueError(f"Unknown cache format: {format}")
+
+        table = self._to_table(data)
+        file_name = f"{name}{FORMATS[format]}"
+        path = os.path.join(self.cache_dir, file_name)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        if format == 'parquet':
+            pq.write_table(table, tmp_path, row_group_size=self.row_group_size, compression=self.compression)
+        else:
+            # Uncompressed so readers can memory-map buffers without decoding
+            with pa.OSFile(tmp_path, 'wb') as sink, ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=self.row_group_size)
+        os.replace(tmp_path, path)
+
+        manifest = {
+            'file': file_name,
+            'format': format,
+            'timestamp': datetime.now().isoformat(),
+            'ttl_hours': ttl_hours,
+            'rows': table.num_rows,
+            'columns': table.column_names,
+            'schema': {field.name: str(field.type) for field in table.schema},
+            'metadata': metadata or {},
+        }
+        manifest_path = self._manifest_path(name)
+        with open(f"{manifest_path}.tmp{os.getpid()}", 'w') as f:
+            json.dump(manifest, f)
+        os.replace(f"{manifest_path}.tmp{os.getpid()}", manifest_path)
+        return path
+
+    def read_table(self, name: str, columns: Optional[List[str]] = None,
+                   filters: Optional[Filters] = None, memory_map: bool = False,
+                   ignore_ttl: bool = False) -> Optional[pa.Table]:
+        """Arrow table for a valid entry, or None when missing or expired"""
+        name = self.entry_name(name)
+        if not ignore_ttl and not self.is_valid(name):
+            return None
+        manifest = self.manifest(name)
+        if manifest is None:
+            return None
+        path = os.path.join(self.cache_dir, manifest['file'])
+        if columns is not None:
+            columns = [col for col in columns if col in manifest['columns']]
+        expression = pq.filters_to_expression(filters) if filters else None
+
+        if manifest['format'] == 'parquet':
+            # Row groups whose statistics miss the filter are never decoded
+            return pq.read_table(path, columns=columns, filters=expression, memory_map=memory_map)
+
+        if memory_map:
+            table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+            if columns is None and expression is None:
+                return table
+            return ds.dataset(table).to_table(columns=columns, filter=expression)
+        return ds.dataset(path, format='ipc').to_table(columns=columns, filter=expression)
+
+    def read(self, name: str, columns: Optional[List[str]] = None, filters: Optional[Filters] = None,
+             memory_map: bool = False, ignore_ttl: bool = False) -> Optional[pd.DataFrame]:
+        table = self.read_table(name, columns, filters, memory_map, ignore_ttl)
+        return None if table is None else table.to_pandas()
+
+    def invalidate(self, name: str) -> None:
+        name = self.entry_name(name)
+        manifest = self.manifest(name)
+        paths = [self._manifest_path(name)]
+        if manifest is not None:
+            paths.append(os.path.join(self.cache_dir, manifest['file']))
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _to_table(data: pd.DataFrame) -> pa.Table:
+        """Arrow table from a frame; mixed-type object columns are stored as strings"""
+        try:
+            return pa.Table.from_pandas(data, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            data = data.copy()
+            for col in data.columns[data.dtypes == object]:
+                try:
+                    pa.array(data[col], from_pandas=True)
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    data[col] = data[col].map(
+                        lambda v: None if v is None or (isinstance(v, float) and v != v) else str(v))
+            return pa.Table.from_pandas(data, preserve_index=False)
@@ -188,13 +188,19 @@ class FantasyNerdsIngestor(BaseIngestor):
         data = {}
 
         for platform in platforms:
-            data[f'{platform}_salaries'] = self.fetch_dfs_salaries(platform, week)
-            data[f'{platform}_bangforbuck'] = self.fetch_bang_for_buck(platform, week)
+            data[f'{platform}_salaries'] = self.cached_fetch(
+                f"fantasy_nerds_{platform}_salaries_w{week}", lambda: self.fetch_dfs_salaries(platform, week))
+            data[f'{platform}_bangforbuck'] = self.cached_fetch(
+                f"fantasy_nerds_{platform}_bangforbuck_w{week}", lambda: self.fetch_bang_for_buck(platform, week),
+                ttl_hours=1)
 
         # Add common data
-        data['projections'] = self.fetch_player_projections(week)
-        data['defensive_rankings'] = self.fetch_defensive_rankings(week)
-        data['injuries'] = self.fetch_injury_reports(week)
+        data['projections'] = self.cached_fetch(f"fantasy_nerds_projections_w{week}",
+                                                lambda: self.fetch_player_projections(week), ttl_hours=1)
+        data['defensive_rankings'] = self.cached_fetch(f"fantasy_nerds_defensive_rankings_w{week}",
+                                                       lambda: self.fetch_defensive_rankings(week))
+        data['injuries'] = self.cached_fetch(f"fantasy_nerds_injuries_w{week}",
+                                             lambda: self.fetch_injury_reports(week), ttl_hours=1)
 
         return data
 
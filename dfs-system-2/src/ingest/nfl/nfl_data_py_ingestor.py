@@ -28,6 +28,7 @@ except ImportError:
     logging.warning("nfl-data-py not installed. Install with: pip install nfl-data-py")
 
 from ..base import BaseIngestor
+from ...ai.feature_store import FeatureStore
 
 class NFLDataPyIngestor(BaseIngestor):
     """Ingestor for nfl-data-py library data"""
@@ -39,6 +40,8 @@ class NFLDataPyIngestor(BaseIngestor):
         if not NFL_DATA_PY_AVAILABLE:
             raise ImportError("nfl-data-py is required. Install with: pip install nfl-data-py")
 
+        self.feature_store = FeatureStore(os.path.join(self.cache_dir, 'features', 'nfl_weekly'))
+
     def fetch_data(self) -> Dict[str, pd.DataFrame]:
         """Implement abstract method - fetch all data"""
         return self.fetch_all_data()
@@ -172,32 +175,16 @@ class NFLDataPyIngestor(BaseIngestor):
             # EPA (Expected Points Added) is already in nfl-data-py
             # Add additional custom metrics
 
-            # Completion percentage by situation
-            if 'complete_pass' in pbp_data.columns and 'pass_attempt' in pbp_data.columns:
-                pbp_data['completion_pct'] = (
-                    pbp_data.groupby(['passer_player_id', 'week'])['complete_pass']
-                    .transform('sum') /
-                    pbp_data.groupby(['passer_player_id', 'week'])['pass_attempt']
-                    .transform('sum')
-                )
-
-            # Yards per attempt
-            if 'passing_yards' in pbp_data.columns and 'pass_attempt' in pbp_data.columns:
-                pbp_data['ypa'] = (
-                    pbp_data.groupby(['passer_player_id', 'week'])['passing_yards']
-                    .transform('sum') /
-                    pbp_data.groupby(['passer_player_id', 'week'])['pass_attempt']
-                    .transform('sum')
-                )
-
-            # Touchdown percentage
-            if 'pass_touchdown' in pbp_data.columns and 'pass_attempt' in pbp_data.columns:
-                pbp_data['td_pct'] = (
-                    pbp_data.groupby(['passer_player_id', 'week'])['pass_touchdown']
-                    .transform('sum') /
-                    pbp_data.groupby(['passer_player_id', 'week'])['pass_attempt']
-                    .transform('sum')
-                )
+            # Per passer-week totals in one grouped pass, then the rates from them
+            sum_cols = [col for col in ('complete_pass', 'passing_yards', 'pass_touchdown')
+                        if col in pbp_data.columns]
+            if sum_cols and 'pass_attempt' in pbp_data.columns:
+                totals = pbp_data.groupby(['passer_player_id', 'week'])[sum_cols + ['pass_attempt']].transform('sum')
+                attempts = totals['pass_attempt']
+                for col, metric in (('complete_pass', 'completion_pct'), ('passing_yards', 'ypa'),
+                                    ('pass_touchdown', 'td_pct')):
+                    if col in totals.columns:
+                        pbp_data[metric] = totals[col] / attempts
 
             return pbp_data
 
@@ -212,14 +199,26 @@ class NFLDataPyIngestor(BaseIngestor):
 
         self.logger.info(f"Fetching all NFL data for {year}")
 
+        # Season data changes at most daily; play-by-play refreshes twice a day in season
         data = {
-            'player_stats': self.fetch_player_stats(year),
-            'rosters': self.fetch_rosters(year),
-            'schedules': self.fetch_schedules(year),
-            'play_by_play': self.fetch_play_by_play(year),
-            'injuries': self.fetch_injuries(year)
+            'player_stats': self.cached_fetch(f"nfl_data_py_player_stats_{year}",
+                                              lambda: self.fetch_player_stats(year), ttl_hours=12),
+            'rosters': self.cached_fetch(f"nfl_data_py_rosters_{year}", lambda: self.fetch_rosters(year)),
+            'schedules': self.cached_fetch(f"nfl_data_py_schedules_{year}", lambda: self.fetch_schedules(year)),
+            'play_by_play': self.cached_fetch(f"nfl_data_py_pbp_{year}",
+                                              lambda: self.fetch_play_by_play(year), ttl_hours=12),
+            'injuries': self.cached_fetch(f"nfl_data_py_injuries_{year}",
+                                          lambda: self.fetch_injuries(year), ttl_hours=2)
         }
 
+        # Materialize rolling usage features for the projection engine
+        if not data['play_by_play'].empty:
+            try:
+                written = self.feature_store.materialize(data['play_by_play'])
+                self.logger.info(f"Materialized features for weeks {written}")
+            except Exception as e:
+                self.logger.error(f"Error materializing features: {e}")
+
         # Log summary
         total_records = sum(len(df) for df in data.values() if isinstance(df, pd.DataFrame))
         self.logger.info(f"Total records fetched: {total_records}")
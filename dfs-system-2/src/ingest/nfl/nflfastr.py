@@ -1,18 +1,48 @@
 import pandas as pd
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 from ..base import ParquetIngestor, DataNormalizer
+from ..partitioned_store import PartitionedPlayStore
 from ...data.schemas import DataIngestionStatus, SportType
 
+# Select relevant columns for DFS analysis
+NFLFASTR_COLUMNS = [
+    'game_id', 'week', 'season', 'game_date', 'home_team', 'away_team',
+    'posteam', 'defteam', 'play_type', 'yards_gained', 'touchdown', 'air_yards', 'epa',
+    'passer_player_name', 'passer_player_id', 'passing_yards',
+    'receiver_player_name', 'receiver_player_id', 'receiving_yards',
+    'rusher_player_name', 'rusher_player_id', 'rushing_yards',
+    'fantasy_player_name', 'fantasy_player_id', 'fantasy_points',
+    'red_zone', 'goal_to_go', 'down', 'ydstogo', 'yardline_100',
+    'qb_dropback', 'rush_attempt', 'pass_attempt', 'complete_pass',
+    'interception', 'fumble', 'safety', 'penalty'
+]
+TEAM_COLUMNS = ['home_team', 'away_team', 'posteam', 'defteam']
+NAME_COLUMNS = ['passer_player_name', 'receiver_player_name', 'rusher_player_name', 'fantasy_player_name']
+
+# Raw value -> normalized value, filled as new teams/names show up and kept for the process
+_TEAM_LOOKUP: Dict[str, str] = {}
+_NAME_LOOKUP: Dict[str, str] = {}
+
+def normalize_with_lookup(series: pd.Series, lookup: Dict[str, str],
+                          normalize: Callable[[pd.DataFrame, str], pd.DataFrame]) -> pd.Series:
+    """Normalize each distinct value once, then map the whole column"""
+    unseen = [value for value in series.dropna().unique() if value not in lookup]
+    if unseen:
+        normalized = normalize(pd.DataFrame({'value': unseen}), 'value')['value']
+        lookup.update(zip(unseen, normalized))
+    return series.map(lookup).where(series.notna(), series)
+
 class NFLFastRIngestor(ParquetIngestor):
-    """Ingestor for nflfastR play-by-play data"""
+    """Ingestor for nflfastR play-by-play data, stored incrementally by season and week"""
     
     def __init__(self, sport: SportType, source_name: str, config: Dict[str, Any]):
         super().__init__(sport, source_name, config)
         self.current_year = datetime.now().year
+        self.store = PartitionedPlayStore(self.cache_dir / 'nflfastr_plays')
         
     def ingest(self) -> DataIngestionStatus:
-        """Ingest nflfastR play-by-play data"""
+        """Ingest nflfastR play-by-play data for weeks not yet final in the store"""
         start_time = datetime.now()
         errors = []
         warnings = []
@@ -21,6 +51,7 @@ class NFLFastRIngestor(ParquetIngestor):
         try:
             # Get current season play-by-play data
             url = self.config['url'].format(year=self.current_year)
+            first_week = self.store.first_open_week(self.current_year)
             
             df = self._fetch_data(url)
             
@@ -30,6 +61,16 @@ class NFLFastRIngestor(ParquetIngestor):
                     warnings=["No data returned from nflfastR API"]
                 )
             
+            # Only weeks that can still change get processed
+            if 'week' in df.columns:
+                df = df[df['week'] >= first_week]
+                if df.empty:
+                    return self._create_status(
+                        "success",
+                        warnings=[f"No new nflfastR weeks since week {first_week - 1}"],
+                        execution_time=(datetime.now() - start_time).total_seconds()
+                    )
+            
             # Basic data processing and normalization
             df = self._process_nflfastr_data(df)
             total_records = len(df)
@@ -56,22 +97,9 @@ class NFLFastRIngestor(ParquetIngestor):
     
     def _process_nflfastr_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process and clean nflfastR data"""
-        # Select relevant columns for DFS analysis
-        relevant_cols = [
-            'game_id', 'week', 'season', 'game_date', 'home_team', 'away_team',
-            'posteam', 'defteam', 'play_type', 'yards_gained', 'touchdown',
-            'passer_player_name', 'passer_player_id', 'passing_yards',
-            'receiver_player_name', 'receiver_player_id', 'receiving_yards',
-            'rusher_player_name', 'rusher_player_id', 'rushing_yards',
-            'fantasy_player_name', 'fantasy_player_id', 'fantasy_points',
-            'red_zone', 'goal_to_go', 'down', 'ydstogo', 'yardline_100',
-            'qb_dropback', 'rush_attempt', 'pass_attempt', 'complete_pass',
-            'interception', 'fumble', 'safety', 'penalty'
-        ]
-        
         # Filter to available columns
-        available_cols = [col for col in relevant_cols if col in df.columns]
-        df = df[available_cols].copy()
+        available_cols = [col for col in NFLFASTR_COLUMNS if col in df.columns]
+        df = df[available_cols]
         
         # Filter out non-regular plays
         df = df[
@@ -80,15 +108,16 @@ class NFLFastRIngestor(ParquetIngestor):
             ])
         ].copy()
         
-        # Normalize team names
-        for team_col in ['home_team', 'away_team', 'posteam', 'defteam']:
+        # Normalize team and player names through the cached lookups
+        for team_col in TEAM_COLUMNS:
             if team_col in df.columns:
-                df = DataNormalizer.normalize_team_names(df, team_col)
+                df[team_col] = normalize_with_lookup(df[team_col], _TEAM_LOOKUP,
+                                                     DataNormalizer.normalize_team_names)
         
-        # Normalize player names
-        for name_col in ['passer_player_name', 'receiver_player_name', 'rusher_player_name', 'fantasy_player_name']:
+        for name_col in NAME_COLUMNS:
             if name_col in df.columns:
-                df = DataNormalizer.normalize_player_names(df, name_col)
+                df[name_col] = normalize_with_lookup(df[name_col], _NAME_LOOKUP,
+                                                     DataNormalizer.normalize_player_names)
         
         # Convert game_date to datetime
         if 'game_date' in df.columns:
@@ -104,10 +133,14 @@ class NFLFastRIngestor(ParquetIngestor):
         return df
     
     def _save_processed_data(self, df: pd.DataFrame, filename: str):
-        """Save processed data to cache"""
-        cache_path = self.cache_dir / f"{filename}_{self.current_year}.parquet"
-        df.to_parquet(cache_path, compression='snappy')
-        print(f"Saved {len(df)} records to {cache_path}")
+        """Write the processed weeks into their season/week partitions"""
+        season = int(df['season'].iloc[0]) if 'season' in df.columns and len(df) else self.current_year
+        weeks = self.store.write_weeks(season, df)
+        print(f"Saved {len(df)} {filename} records for {season} weeks {weeks} to {self.store.root}")
+    
+    def load_plays(self, seasons=None, weeks=None, columns=None) -> pd.DataFrame:
+        """Stored plays for the given seasons/weeks (all by default)"""
+        return self.store.load(seasons, weeks, columns)
 
 class NFLScheduleIngestor(ParquetIngestor):
     """Ingestor for nflfastR schedule data"""
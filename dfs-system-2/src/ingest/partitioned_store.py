@@ -0,0 +1,100 @@
+"""
+Partitioned Play Store - season/week partitioned Parquet with an ingestion manifest
+Plays live under root/season=YYYY/week=WW/plays.parquet (hive layout, so readers can
+prune partitions) and root/_manifest.json records which weeks are stored and which
+are final, letting ingestors fetch and process only the weeks that can still change.
+The same layout backs the weekly feature store (features.parquet).
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+MANIFEST_NAME = '_manifest.json'
+
+
+class PartitionedPlayStore:
+    """Season/week partitions of processed play-by-play"""
+
+    def __init__(self, root: Path, file_name: str = 'plays.parquet'):
+        self.root = Path(root)
+        self.file_name = file_name
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        tmp_path = self.manifest_path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def partition_path(self, season: int, week: int) -> Path:
+        return self.root / f"season={season}" / f"week={week:02d}" / self.file_name
+
+    def stored_weeks(self, season: int) -> List[int]:
+        return sorted(int(week) for week in self.manifest.get(str(season), {}))
+
+    def first_open_week(self, season: int) -> int:
+        """Earliest week that still needs (re)processing: one past the last final week"""
+        weeks = self.manifest.get(str(season), {})
+        final = [int(week) for week, entry in weeks.items() if entry.get('final')]
+        return max(final) + 1 if final else 1
+
+    def write_weeks(self, season: int, plays: pd.DataFrame, week_col: str = 'week') -> List[int]:
+        """Replace the partitions for every week present in `plays`; returns the weeks written"""
+        season_entries = self.manifest.setdefault(str(season), {})
+        written = []
+        for week, week_plays in plays.groupby(week_col, sort=True):
+            week = int(week)
+            path = self.partition_path(season, week)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.parent / f".{self.file_name}.{os.getpid()}.tmp"  # dot prefix: ignored by readers
+            # Partition values live in the directory names, not the files
+            week_plays.drop(columns=[c for c in ('season', week_col) if c in week_plays.columns]) \
+                .to_parquet(tmp_path, compression='snappy', index=False)
+            os.replace(tmp_path, path)
+            season_entries[str(week)] = {
+                'rows': int(len(week_plays)),
+                'updated': datetime.now().isoformat(),
+                'final': False,
+            }
+            written.append(week)
+
+        # Every week before the newest stored one has finished (stat corrections aside)
+        if season_entries:
+            latest = max(int(week) for week in season_entries)
+            for week, entry in season_entries.items():
+                entry['final'] = int(week) < latest
+        self._save_manifest()
+        return written
+
+    def load(self, seasons: Optional[Iterable[int]] = None, weeks: Optional[Iterable[int]] = None,
+             columns: Optional[List[str]] = None, filters: Optional[List[tuple]] = None) -> pd.DataFrame:
+        """Stored rows, reading only the requested season/week partitions and columns.
+        filters: extra DNF row filters, e.g. [('player_id', 'in', ids)]"""
+        if not any(self.root.glob(f"season=*/week=*/{self.file_name}")):
+            return pd.DataFrame()
+        dataset = ds.dataset(str(self.root), format='parquet', partitioning='hive')
+        filters = list(filters or [])
+        if seasons is not None:
+            filters.append(('season', 'in', [int(s) for s in seasons]))
+        if weeks is not None:
+            filters.append(('week', 'in', [int(w) for w in weeks]))
+        expression = pq.filters_to_expression(filters) if filters else None
+        if columns is not None:
+            columns = [col for col in columns if col in dataset.schema.names]
+        return dataset.to_table(columns=columns, filter=expression).to_pandas()
@@ -8,6 +8,7 @@ from ..data.schemas import (
     Player, Lineup, LineupPlayer, SportType, SiteType, 
     CSVExport, ExportConfig
 )
+from ..optimize.slot_assignment import SlotAssigner
 
 class CSVImporter:
     """Import salary data and player information from DK/FD CSV files"""
@@ -216,8 +217,16 @@ class CSVImporter:
 class CSVExporter:
     """Export lineups to DK/FD upload format"""
     
+    # Flexible columns and the positions that can fill them
+    SLOT_ELIGIBILITY = {
+        'FLEX': ['RB', 'WR', 'TE'],
+        'G': ['PG', 'SG'],
+        'F': ['SF', 'PF'],
+        'UTIL': ['PG', 'SG', 'SF', 'PF', 'C', 'G', 'F'],
+    }
+    
     def __init__(self):
-        pass
+        self._slot_assigners: Dict[Tuple[str, ...], SlotAssigner] = {}
     
     def export_lineups(self, lineups: List[Lineup], config: ExportConfig, 
                       output_path: str) -> str:
@@ -250,19 +259,13 @@ class CSVExporter:
         else:  # NBA
             columns = ['PG', 'SG', 'SF', 'PF', 'C', 'G', 'F', 'UTIL']
         
-        for lineup in lineups:
+        # Map players to positions for the whole portfolio
+        slot_rows = []
+        for lineup, position_mapping in zip(lineups, self._map_portfolio_to_positions(lineups, columns)):
+            slot_rows.append([self._format_player_name(player.player_id) if player else ''
+                              for player in position_mapping])
             row_data = {}
             
-            # Map players to positions
-            position_mapping = self._map_players_to_positions(lineup.players, columns)
-            
-            for pos in columns:
-                if pos in position_mapping:
-                    player = position_mapping[pos]
-                    row_data[pos] = self._format_player_name(player.player_id)
-                else:
-                    row_data[pos] = ''
-            
             # Add optional columns
             if config.include_projections:
                 row_data['Projected Points'] = round(lineup.total_projection, 2)
@@ -278,7 +281,8 @@ class CSVExporter:
             
             export_data.append(row_data)
         
-        return pd.DataFrame(export_data)
+        # Slot columns repeat (RB, RB, ...) so they are built positionally
+        return pd.concat([pd.DataFrame(slot_rows, columns=columns), pd.DataFrame(export_data)], axis=1)
     
     def _create_fd_export(self, lineups: List[Lineup], config: ExportConfig) -> pd.DataFrame:
         """Create FanDuel export format"""
@@ -290,19 +294,13 @@ class CSVExporter:
         else:  # NBA
             columns = ['PG', 'PG', 'SG', 'SG', 'SF', 'SF', 'PF', 'PF', 'C']
         
-        for lineup in lineups:
+        # Map players to positions for the whole portfolio
+        slot_rows = []
+        for lineup, position_mapping in zip(lineups, self._map_portfolio_to_positions(lineups, columns)):
+            slot_rows.append([self._format_player_name(player.player_id) if player else ''
+                              for player in position_mapping])
             row_data = {}
             
-            # Map players to positions
-            position_mapping = self._map_players_to_positions(lineup.players, columns)
-            
-            for pos in columns:
-                if pos in position_mapping:
-                    player = position_mapping[pos]
-                    row_data[pos] = self._format_player_name(player.player_id)
-                else:
-                    row_data[pos] = ''
-            
             # Add optional columns
             if config.include_projections:
                 row_data['Projected Points'] = round(lineup.total_projection, 2)
@@ -316,52 +314,39 @@ class CSVExporter:
             
             export_data.append(row_data)
         
-        return pd.DataFrame(export_data)
+        # Slot columns repeat (RB, RB, ...) so they are built positionally
+        return pd.concat([pd.DataFrame(slot_rows, columns=columns), pd.DataFrame(export_data)], axis=1)
+    
+    def _map_portfolio_to_positions(self, lineups: List[Lineup], 
+                                    required_positions: List[str]) -> List[List[Optional[LineupPlayer]]]:
+        """Map every lineup's players to export columns, rejecting lineups with no valid assignment"""
+        mappings = []
+        for lineup in lineups:
+            position_mapping = self._map_players_to_positions(lineup.players, required_positions)
+            if position_mapping is None:
+                raise ValueError(f"Lineup {lineup.id} cannot fill roster slots {required_positions}")
+            mappings.append(position_mapping)
+        return mappings
     
     def _map_players_to_positions(self, players: List[LineupPlayer], 
-                                 required_positions: List[str]) -> Dict[str, LineupPlayer]:
-        """Map players to required positions for export"""
-        position_mapping = {}
-        available_players = players.copy()
-        
-        # First pass: exact position matches
-        for pos in required_positions:
-            if pos in position_mapping:
-                continue  # Position already filled
-                
-            for player in available_players:
-                if player.roster_position == pos:
-                    position_mapping[pos] = player
-                    available_players.remove(player)
-                    break
-        
-        # Second pass: flexible position matching
-        remaining_positions = [pos for pos in required_positions if pos not in position_mapping]
-        
-        for pos in remaining_positions:
-            for player in available_players:
-                if self._position_compatible(player.roster_position, pos):
-                    position_mapping[pos] = player
-                    available_players.remove(player)
-                    break
-        
+                                 required_positions: List[str]) -> Optional[List[Optional[LineupPlayer]]]:
+        """Map players to required positions for export (one entry per column)"""
+        assigner = self._get_slot_assigner(required_positions)
+        slot_indices = assigner.assign_indices([player.roster_position for player in players])
+        if slot_indices is None:
+            return None
+        
+        position_mapping: List[Optional[LineupPlayer]] = [None] * len(required_positions)
+        for player, j in zip(players, slot_indices):
+            position_mapping[j] = player
         return position_mapping
     
-    def _position_compatible(self, player_position: str, required_position: str) -> bool:
-        """Check if player position is compatible with required position"""
-        # NFL compatibility
-        if required_position == 'FLEX':
-            return player_position in ['RB', 'WR', 'TE']
-        
-        # NBA compatibility
-        if required_position == 'G':
-            return player_position in ['PG', 'SG']
-        elif required_position == 'F':
-            return player_position in ['SF', 'PF']
-        elif required_position == 'UTIL':
-            return True  # Any position
-        
-        return player_position == required_position
+    def _get_slot_assigner(self, required_positions: List[str]) -> SlotAssigner:
+        """Slot assigner per column layout (eligibility masks are memoized inside)"""
+        key = tuple(required_positions)
+        if key not in self._slot_assigners:
+            self._slot_assigners[key] = SlotAssigner(required_positions, self.SLOT_ELIGIBILITY)
+        return self._slot_assigners[key]
     
     def _format_player_name(self, player_id: str) -> str:
         """Format player name for export (placeholder - would lookup actual name)"""
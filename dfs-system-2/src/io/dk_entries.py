@@ -0,0 +1,154 @@
+"""
+DraftKings entries export parser
+Reads the entries and player-pool sections of a DK entries CSV in one pass into
+columnar tables, with each slot's player id and lock flag
+"""
+
+import csv
+import numpy as np
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+LOCKED_MARKER = '(LOCKED)'
+POOL_COLUMNS = ['Position', 'Name + ID', 'Name', 'ID', 'Roster Position', 'Salary',
+                'Game Info', 'TeamAbbrev', 'AvgPointsPerGame']
+
+@dataclass
+class EntryTable:
+    """Entries section of a DK entries export, one row per entry"""
+    slot_names: List[str]
+    entry_ids: List[str] = field(default_factory=list)
+    contest_names: List[str] = field(default_factory=list)
+    contest_ids: List[str] = field(default_factory=list)
+    entry_fees: List[str] = field(default_factory=list)
+    slot_ids: np.ndarray = None       # (n_entries, n_slots) int64 DK player ids, 0 = empty
+    locked: np.ndarray = None         # (n_entries, n_slots) bool lock flags
+    
+    def __len__(self) -> int:
+        return len(self.entry_ids)
+
+@dataclass
+class PlayerPoolTable:
+    """Player-pool section of a DK entries export"""
+    ids: np.ndarray = None            # int64 DK player ids
+    names: List[str] = field(default_factory=list)
+    positions: List[str] = field(default_factory=list)
+    roster_positions: List[str] = field(default_factory=list)
+    salaries: np.ndarray = None       # int64
+    game_info: List[str] = field(default_factory=list)
+    teams: List[str] = field(default_factory=list)
+    avg_points: np.ndarray = None     # float64
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @property
+    def active(self) -> np.ndarray:
+        """DK zeroes out the average of inactive/out players"""
+        return self.avg_points > 0
+    
+    @property
+    def game_ids(self) -> List[str]:
+        return [info.split(' ')[0] for info in self.game_info]
+    
+    def index_by_id(self) -> Dict[int, int]:
+        return {int(pid): i for i, pid in enumerate(self.ids)}
+
+@dataclass
+class DKEntriesFile:
+    """Both sections of a DK entries export"""
+    entries: EntryTable
+    pool: PlayerPoolTable
+
+class DKEntriesParser:
+    """Single-pass streaming parser for DK entries exports (entries + player pool layout)"""
+    
+    def parse(self, file_path: str) -> DKEntriesFile:
+        """Read the file once and return columnar entries and player pool"""
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"DK entries file not found: {file_path}")
+        
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
+            return self.parse_rows(csv.reader(f))
+    
+    def parse_rows(self, rows: Iterator[List[str]]) -> DKEntriesFile:
+        """Parse already-split CSV rows (header first)"""
+        rows = iter(rows)
+        header = next(rows, None)
+        if not header:
+            raise ValueError("DK entries file is empty")
+        
+        # Slot columns run from after 'Entry Fee' to the first blank column
+        slot_end = header.index('', 4) if '' in header[4:] else len(header)
+        slot_names = [name.strip() for name in header[4:slot_end]]
+        n_slots = len(slot_names)
+        if not n_slots:
+            raise ValueError("No roster slot columns found in DK entries header")
+        pool_start = self._find_pool_start(header, slot_end)
+        
+        entries = EntryTable(slot_names=slot_names)
+        slot_ids, locked = array('q'), array('b')
+        pool = PlayerPoolTable()
+        pool_ids, salaries, avg_points = array('q'), array('q'), array('d')
+        
+        for row in rows:
+            entry_id = row[0].strip() if row else ''
+            if entry_id.isdigit():
+                entries.entry_ids.append(entry_id)
+                entries.contest_names.append(row[1].strip())
+                entries.contest_ids.append(row[2].strip())
+                entries.entry_fees.append(row[3].strip())
+                for cell in (row[4:slot_end] + [''] * n_slots)[:n_slots]:
+                    player_id, is_locked = self.parse_slot(cell)
+                    slot_ids.append(player_id)
+                    locked.append(is_locked)
+            
+            # The pool header may sit on the first row or further down the instructions block
+            if pool_start is None:
+                pool_start = self._find_pool_start(row, slot_end)
+                continue
+            
+            if len(row) >= pool_start + len(POOL_COLUMNS) and row[pool_start + 3].strip().isdigit():
+                try:
+                    salary = int(row[pool_start + 5])
+                    points = float(row[pool_start + 8] or 0)
+                except ValueError:
+                    continue
+                pool_ids.append(int(row[pool_start + 3]))
+                salaries.append(salary)
+                avg_points.append(points)
+                pool.positions.append(row[pool_start].strip())
+                pool.names.append(row[pool_start + 2].strip())
+                pool.roster_positions.append(row[pool_start + 4].strip())
+                pool.game_info.append(row[pool_start + 6].strip())
+                pool.teams.append(row[pool_start + 7].strip())
+        
+        entries.slot_ids = np.frombuffer(slot_ids, dtype=np.int64).reshape(-1, n_slots).copy()
+        entries.locked = np.frombuffer(locked, dtype=np.int8).reshape(-1, n_slots).astype(bool)
+        pool.ids = np.frombuffer(pool_ids, dtype=np.int64).copy()
+        pool.salaries = np.frombuffer(salaries, dtype=np.int64).copy()
+        pool.avg_points = np.frombuffer(avg_points, dtype=np.float64).copy()
+        
+        return DKEntriesFile(entries=entries, pool=pool)
+    
+    @staticmethod
+    def parse_slot(cell: str) -> Tuple[int, bool]:
+        """'Name (12345) (LOCKED)' -> (12345, True); empty cells give (0, False)"""
+        is_locked = LOCKED_MARKER in cell
+        if is_locked:
+            cell = cell.replace(LOCKED_MARKER, '')
+        cell = cell.strip()
+        if not cell.endswith(')'):
+            return 0, is_locked
+        player_id = cell[cell.rfind('(') + 1:-1].strip()
+        return (int(player_id) if player_id.isdigit() else 0), is_locked
+    
+    @staticmethod
+    def _find_pool_start(row: List[str], slot_end: int) -> Optional[int]:
+        try:
+            return row.index('Name + ID', slot_end) - 1
+        except ValueError:
+            return None
@@ -0,0 +1,313 @@
+"""
+Batch late-swap optimizer
+Re-optimizes every entry of a DKEntries upload from slate arrays built once (salaries,
+projections, slot eligibility): each entry is a small MIP with its locked slots fixed,
+solved in turn within its contest against the running exposure counts and the lineups
+already chosen, and contests run in parallel. Only players whose games have not started
+can come in, portfolio exposure limits are honored and no contest receives the same
+lineup twice.
+"""
+
+import csv
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+from ortools.linear_solver import pywraplp
+
+from ..io.dk_entries import DKEntriesParser
+from .lineup_index import LineupIndex
+from .slot_assignment import SlotAssigner
+
+
+@dataclass
+class SwapPlayer:
+    """Pool player available to the late-swap model"""
+    player_id: str
+    name: str
+    position: str
+    salary: int
+    projection: float
+    team: str = ''
+    game_id: str = ''
+    active: bool = True
+    start_time: Optional[datetime] = None
+
+
+@dataclass
+class LateSwapEntry:
+    """One contest entry from a DKEntries upload"""
+    entry_id: str
+    contest_id: str
+    contest_name: str = ''
+    entry_fee: str = ''
+    player_ids: List[str] = field(default_factory=list)  # One per roster slot, '' if empty
+    locked_slots: Set[int] = field(default_factory=set)
+
+
+@dataclass
+class LateSwapResult:
+    """Re-optimized lineup for one entry"""
+    entry_id: str
+    contest_id: str
+    player_ids: List[str]
+    swapped_slots: List[int]
+    total_salary: int
+    total_projection: float
+    status: str  # optimized, unchanged or infeasible
+
+
+class LateSwapOptimizer:
+    """Late-swap solver for one slate; entries are solved one MIP at a time per contest"""
+
+    def __init__(self, pool: List[SwapPlayer], slot_assigner: SlotAssigner, salary_cap: int = 50000,
+                 max_exposure: float = 1.0, exposure_overrides: Optional[Dict[str, float]] = None):
+        self.pool = pool
+        self.slot_assigner = slot_assigner
+        self.slots = slot_assigner.slots
+        self.salary_cap = salary_cap
+        self.player_index = {p.player_id: i for i, p in enumerate(pool)}
+
+        # Slate arrays shared by every entry's MIP
+        self.salaries = np.array([p.salary for p in pool], dtype=np.int64)
+        self.projections = np.array([p.projection for p in pool], dtype=np.float64)
+        self.active = np.array([p.active for p in pool], dtype=bool)
+        masks = [slot_assigner.eligibility_mask(p.position) for p in pool]
+        self.eligible = np.array([[mask >> j & 1 for j in range(len(self.slots))] for mask in masks],
+                                 dtype=bool).reshape(len(pool), len(self.slots))
+
+        overrides = exposure_overrides or {}
+        self.exposure_limits = np.array([overrides.get(p.player_id, max_exposure) for p in pool])
+
+    @classmethod
+    def from_rules(cls, pool: List[SwapPlayer], rules: Dict[str, Any], **kwargs) -> 'LateSwapOptimizer':
+        """Build the slate optimizer from a roster rules file"""
+        return cls(pool, SlotAssigner.from_rules(rules), salary_cap=rules['salary_cap'], **kwargs)
+
+    def optimize_entries(self, entries: List[LateSwapEntry], locked_player_ids: Iterable[str] = (),
+                         max_workers: Optional[int] = None,
+                         time_limit_seconds: Optional[float] = None,
+                         keep: Optional[Dict[str, LateSwapResult]] = None) -> List[LateSwapResult]:
+        """Re-optimize all entries, running contests in parallel
+
+        Entries found in `keep` are not re-solved; their lineups still count toward
+        exposure and duplicate checks so an incremental pass stays consistent.
+        """
+        keep = keep or {}
+        locked_players = set(locked_player_ids)
+        # Players in started games can stay where they are locked but never swap in
+        swappable = self.active & np.array([p.player_id not in locked_players for p in self.pool], dtype=bool)
+        deadline = time.monotonic() + time_limit_seconds if time_limit_seconds else None
+
+        contests: Dict[str, List[LateSwapEntry]] = {}
+        for entry in entries:
+            contests.setdefault(entry.contest_id, []).append(entry)
+        caps = self._allocate_exposure(len(entries), [len(group) for group in contests.values()])
+
+        # Contests with nothing to re-solve are answered straight from `keep`
+        contest_results = [[keep[entry.entry_id] for entry in group]
+                           for group in contests.values() if all(e.entry_id in keep for e in group)]
+        pending = [(group, cap) for group, cap in zip(contests.values(), caps)
+                   if not all(e.entry_id in keep for e in group)]
+
+        workers = max_workers or min(len(pending), os.cpu_count() or 1)
+        if workers <= 1 or len(pending) <= 1:
+            contest_results += [self._optimize_contest(group, swappable, cap, deadline, keep)
+                                for group, cap in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._optimize_contest, group, swappable, cap, deadline,
+                                           {e.entry_id: keep[e.entry_id] for e in group if e.entry_id in keep})
+                           for group, cap in pending]
+                contest_results += [future.result() for future in futures]
+
+        by_entry = {result.entry_id: result for results in contest_results for result in results}
+        return [by_entry[entry.entry_id] for entry in entries]
+
+    def _allocate_exposure(self, total_entries: int, group_sizes: List[int]) -> List[np.ndarray]:
+        """Split each player's portfolio exposure cap across contests (largest remainder)"""
+        portfolio_caps = np.floor(self.exposure_limits * total_entries + 1e-9).astype(np.int64)
+        shares = np.outer(group_sizes, portfolio_caps) / max(total_entries, 1)
+        base = np.floor(shares + 1e-9).astype(np.int64)
+
+        # Hand leftover units to the contests with the largest fractional share
+        leftover = portfolio_caps - base.sum(axis=0)
+        rank = np.argsort(np.argsort(-(shares - base), axis=0, kind='stable'), axis=0)
+        return list(base + (rank < leftover[None, :]))
+
+    def _optimize_contest(self, entries: List[LateSwapEntry], swappable: np.ndarray,
+                          caps: np.ndarray, deadline: Optional[float],
+                          keep: Optional[Dict[str, LateSwapResult]] = None) -> List[LateSwapResult]:
+        """Re-optimize one contest's entries against running exposure and duplicate state"""
+        keep = keep or {}
+        usage = np.zeros(len(self.pool), dtype=np.int64)
+        # Locked players count toward exposure up front
+        for entry in entries:
+            for slot in entry.locked_slots:
+                i = self.player_index.get(entry.player_ids[slot])
+                if i is not None:
+                    usage[i] += 1
+
+        lineup_index = LineupIndex([p.player_id for p in self.pool], capacity=len(entries))
+        results: Dict[str, LateSwapResult] = {}
+        # Kept lineups are recorded first so re-solved entries see the whole contest
+        solve_order = [e for e in entries if e.entry_id in keep] + [e for e in entries if e.entry_id not in keep]
+        for entry in solve_order:
+            result = keep.get(entry.entry_id)
+            if result is None:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                result = self._optimize_entry(entry, swappable & (usage < caps), lineup_index, remaining)
+
+            for slot, player_id in enumerate(result.player_ids):
+                i = self.player_index.get(player_id)
+                if i is not None and slot not in entry.locked_slots:
+                    usage[i] += 1
+            lineup_index.add(result.player_ids)
+            results[entry.entry_id] = result
+
+        return [results[entry.entry_id] for entry in entries]
+
+    def _optimize_entry(self, entry: LateSwapEntry, available: np.ndarray, lineup_index: LineupIndex,
+                        time_limit_seconds: Optional[float]) -> LateSwapResult:
+        """Solve one entry with its locked slots fixed"""
+        locked = {slot: self.player_index.get(entry.player_ids[slot]) for slot in entry.locked_slots}
+        locked_idx = {i for i in locked.values() if i is not None}
+        locked_salary = int(sum(self.salaries[i] for i in locked_idx))
+        open_slots = [s for s in range(len(self.slots)) if s not in entry.locked_slots]
+        if not open_slots:
+            return self._result(entry, list(entry.player_ids), 'unchanged')
+
+        solver = pywraplp.Solver.CreateSolver('SCIP')
+        if not solver:
+            raise RuntimeError("SCIP solver not available")
+
+        # Variables only for eligible, available players in open slots
+        candidates = available.copy()
+        candidates[list(locked_idx)] = False
+        slot_vars: Dict[Tuple[int, int], Any] = {}
+        for s in open_slots:
+            for i in np.flatnonzero(candidates & self.eligible[:, s]):
+                slot_vars[(int(i), s)] = solver.IntVar(0, 1, f'x_{i}_{s}')
+
+        player_terms: Dict[int, List[Any]] = {}
+        slot_terms: Dict[int, List[Any]] = {s: [] for s in open_slots}
+        for (i, s), var in slot_vars.items():
+            player_terms.setdefault(i, []).append(var)
+            slot_terms[s].append(var)
+
+        # Every open slot is filled and no player is used twice
+        for terms in slot_terms.values():
+            solver.Add(solver.Sum(terms) == 1)
+        for terms in player_terms.values():
+            solver.Add(solver.Sum(terms) <= 1)
+
+        # Salary cap including locked players
+        solver.Add(solver.Sum([var * int(self.salaries[i]) for (i, _), var in slot_vars.items()])
+                   <= self.salary_cap - locked_salary)
+
+        # No duplicates: any earlier lineup containing all our locked players must differ in an open slot
+        if len(lineup_index):
+            overlaps = lineup_index.overlaps(self.pool[i].player_id for i in locked_idx)
+            for row in np.flatnonzero(overlaps == len(locked_idx)):
+                members = [i for i in lineup_index.member_indices(row) if i in player_terms]
+                if len(members) == len(open_slots):
+                    solver.Add(solver.Sum([v for i in members for v in player_terms[i]]) <= len(open_slots) - 1)
+
+        solver.Maximize(solver.Sum([var * float(self.projections[i]) for (i, _), var in slot_vars.items()]))
+
+        if time_limit_seconds is not None:
+            solver.SetTimeLimit(max(1, int(time_limit_seconds * 1000)))
+        status = solver.Solve()
+
+        if status not in (pywraplp.Solver.OPTIMAL, pywraplp.Solver.FEASIBLE):
+            return self._result(entry, list(entry.player_ids), 'infeasible')
+
+        player_ids = list(entry.player_ids)
+        for (i, s), var in slot_vars.items():
+            if var.solution_value() > 0.5:
+                player_ids[s] = self.pool[i].player_id
+        status_name = 'optimized' if player_ids != entry.player_ids else 'unchanged'
+        return self._result(entry, player_ids, status_name)
+
+    def _result(self, entry: LateSwapEntry, player_ids: List[str], status: str) -> LateSwapResult:
+        indices = [self.player_index.get(pid) for pid in player_ids]
+        return LateSwapResult(
+            entry_id=entry.entry_id,
+            contest_id=entry.contest_id,
+            player_ids=player_ids,
+            swapped_slots=[s for s, pid in enumerate(player_ids) if pid != entry.player_ids[s]],
+            total_salary=int(sum(self.salaries[i] for i in indices if i is not None)),
+            total_projection=float(sum(self.projections[i] for i in indices if i is not None)),
+            status=status
+        )
+
+
+def parse_game_start(game_info: str) -> Optional[datetime]:
+    """Kickoff time from DK 'Game Info' text such as 'PHI@KC 09/14/2025 04:25PM ET'"""
+    parts = game_info.split()
+    if len(parts) < 3:
+        return None
+    try:
+        start = datetime.strptime(f"{parts[1]} {parts[2]}", '%m/%d/%Y %I:%M%p')
+    except ValueError:
+        return None
+    return start.replace(tzinfo=ZoneInfo('America/New_York'))
+
+
+def load_dk_entries(file_path: str) -> Tuple[List[LateSwapEntry], List[SwapPlayer]]:
+    """Read entries and the player pool from a DKEntries export"""
+    parsed = DKEntriesParser().parse(file_path)
+    table, pool = parsed.entries, parsed.pool
+
+    entries = [
+        LateSwapEntry(
+            entry_id=table.entry_ids[k],
+            contest_id=table.contest_ids[k],
+            contest_name=table.contest_names[k],
+            entry_fee=table.entry_fees[k],
+            player_ids=[str(pid) if pid else '' for pid in table.slot_ids[k]],
+            locked_slots=set(np.flatnonzero(table.locked[k]).tolist())
+        )
+        for k in range(len(table))
+    ]
+
+    players = [
+        SwapPlayer(
+            player_id=str(pool.ids[i]),
+            name=pool.names[i],
+            position=pool.positions[i],
+            salary=int(pool.salaries[i]),
+            projection=float(pool.avg_points[i]),
+            team=pool.teams[i],
+            game_id=game_id,
+            active=bool(pool.avg_points[i] > 0),  # DK zeroes out inactive players
+            start_time=parse_game_start(pool.game_info[i])
+        )
+        for i, game_id in enumerate(pool.game_ids)
+    ]
+    return entries, players
+
+
+def write_dk_upload(entries: List[LateSwapEntry], results: List[LateSwapResult],
+                    pool: List[SwapPlayer], slots: List[str], output_path: str) -> str:
+    """Write re-optimized entries in DK upload format"""
+    names = {p.player_id: p.name for p in pool}
+    results_by_entry = {result.entry_id: result for result in results}
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Entry ID', 'Contest Name', 'Contest ID', 'Entry Fee'] + slots)
+        for entry in entries:
+            player_ids = results_by_entry[entry.entry_id].player_ids
+            writer.writerow([entry.entry_id, entry.contest_name, entry.contest_id, entry.entry_fee] +
+                            [f"{names.get(pid, '')} ({pid})" if pid else '' for pid in player_ids])
+
+    print(f"Exported {len(entries)} late-swap entries to {output_path}")
+    return str(output_path)
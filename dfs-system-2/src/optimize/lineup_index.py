@@ -0,0 +1,187 @@
+"""
+Lineup index for fast overlap and duplicate checks
+Encodes each lineup as a fixed-width player bitmask over pool indexes so that
+"max overlap with any existing lineup" is one vectorized AND + popcount
+"""
+
+import zlib
+import numpy as np
+from typing import Dict, Iterable, List, Sequence, Set
+
+_BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Count set bits in each element of a uint64 array"""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return np.bitwise_count(words)
+    as_bytes = np.ascontiguousarray(words).view(np.uint8).reshape(words.shape + (8,))
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+class LineupIndex:
+    """Bitmask index of lineups over a fixed player pool"""
+
+    def __init__(self, player_ids: Sequence[str], capacity: int = 256):
+        self.player_index: Dict[str, int] = {pid: i for i, pid in enumerate(player_ids)}
+        self.n_words = max(1, (len(self.player_index) + 63) // 64)
+        # Word-major storage: a query only touches the few words its players live in
+        self._words = np.zeros((self.n_words, max(1, capacity)), dtype=np.uint64)
+        self._size = 0
+        self._rows_by_key: Dict[bytes, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def masks(self) -> np.ndarray:
+        """Bitmasks for all indexed lineups (one row per lineup)"""
+        return self._words[:, :self._size].T
+
+    def encode(self, player_ids: Iterable[str]) -> np.ndarray:
+        """Encode a lineup as a bitmask; unknown players are ignored"""
+        mask = np.zeros(self.n_words, dtype=np.uint64)
+        for pid in player_ids:
+            i = self.player_index.get(pid)
+            if i is not None:
+                mask[i >> 6] |= np.uint64(1) << np.uint64(i & 63)
+        return mask
+
+    def add(self, player_ids: Iterable[str]) -> int:
+        """Add a lineup and return its row number"""
+        mask = self.encode(player_ids)
+        if self._size == self._words.shape[1]:
+            self._words = np.concatenate([self._words, np.zeros_like(self._words)], axis=1)
+        row = self._size
+        self._words[:, row] = mask
+        self._rows_by_key.setdefault(mask.tobytes(), row)
+        self._size += 1
+        return row
+
+    def add_indices(self, index_rows: np.ndarray) -> np.ndarray:
+        """Bulk-add lineups given as rows of pool indexes; returns their row numbers"""
+        index_rows = np.asarray(index_rows, dtype=np.int64)
+        n_new = len(index_rows)
+        while self._size + n_new > self._words.shape[1]:
+            self._words = np.concatenate([self._words, np.zeros_like(self._words)], axis=1)
+
+        rows = np.arange(self._size, self._size + n_new)
+        flat_idx = index_rows.ravel()
+        flat_rows = np.repeat(rows, index_rows.shape[1] if index_rows.ndim > 1 else 1)
+        bits = np.left_shift(np.uint64(1), (flat_idx & 63).astype(np.uint64))
+        np.bitwise_or.at(self._words, (flat_idx >> 6, flat_rows), bits)
+
+        for row, mask in zip(rows, self._words[:, rows].T.copy()):
+            self._rows_by_key.setdefault(mask.tobytes(), int(row))
+        self._size += n_new
+        return rows
+
+    def contains(self, player_ids: Iterable[str]) -> bool:
+        """Exact duplicate check"""
+        return self.encode(player_ids).tobytes() in self._rows_by_key
+
+    def overlaps(self, player_ids: Iterable[str]) -> np.ndarray:
+        """Shared player counts between a lineup and every indexed lineup"""
+        counts = np.zeros(self._size, dtype=np.uint8)
+        if self._size == 0:
+            return counts
+        query = self.encode(player_ids)
+        for w in np.flatnonzero(query):
+            counts += popcount(self._words[w, :self._size] & query[w])
+        return counts
+
+    def max_overlap(self, player_ids: Iterable[str]) -> int:
+        """Largest number of players shared with any indexed lineup"""
+        overlaps = self.overlaps(player_ids)
+        return int(overlaps.max()) if len(overlaps) else 0
+
+    def is_too_similar(self, player_ids: Iterable[str], max_overlap: int) -> bool:
+        """True if any indexed lineup shares more than max_overlap players"""
+        return self.max_overlap(player_ids) > max_overlap
+
+    def member_indices(self, row: int) -> np.ndarray:
+        """Pool indexes of the players in an indexed lineup"""
+        bits = np.unpackbits(np.ascontiguousarray(self._words[:, row]).view(np.uint8), bitorder='little')
+        return np.flatnonzero(bits[:len(self.player_index)])
+
+    def exposure_counts(self) -> np.ndarray:
+        """Number of indexed lineups using each pool player"""
+        if self._size == 0:
+            return np.zeros(len(self.player_index), dtype=np.int64)
+        bits = np.unpackbits(np.ascontiguousarray(self.masks).view(np.uint8), axis=1, bitorder='little')
+        return bits[:, :len(self.player_index)].sum(axis=0, dtype=np.int64)
+
+
+class MinHashLineupIndex:
+    """MinHash/LSH variant for very large pools where full bitmasks get wide"""
+
+    _PRIME = (1 << 61) - 1
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 42):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self._a = rng.integers(1, self._PRIME, size=num_perm, dtype=np.int64).astype(object)
+        self._b = rng.integers(0, self._PRIME, size=num_perm, dtype=np.int64).astype(object)
+        self._player_hash: Dict[str, int] = {}
+        self._signatures: List[np.ndarray] = []
+        self._lineups: List[frozenset] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [dict() for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._lineups)
+
+    def _hash_player(self, pid: str) -> np.ndarray:
+        hashed = self._player_hash.get(pid)
+        if hashed is None:
+            x = zlib.crc32(pid.encode())
+            hashed = np.array([(a * x + b) % self._PRIME for a, b in zip(self._a, self._b)],
+                              dtype=np.uint64)
+            self._player_hash[pid] = hashed
+        return hashed
+
+    def signature(self, player_ids: Iterable[str]) -> np.ndarray:
+        """MinHash signature for a lineup"""
+        hashes = [self._hash_player(pid) for pid in player_ids]
+        if not hashes:
+            return np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        return np.min(np.stack(hashes), axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        r = self.rows_per_band
+        return [signature[i * r:(i + 1) * r].tobytes() for i in range(self.bands)]
+
+    def add(self, player_ids: Iterable[str]) -> int:
+        """Add a lineup and return its row number"""
+        players = frozenset(player_ids)
+        signature = self.signature(players)
+        row = len(self._lineups)
+        self._lineups.append(players)
+        self._signatures.append(signature)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(row)
+        return row
+
+    def candidates(self, player_ids: Iterable[str]) -> Set[int]:
+        """Rows sharing at least one LSH band with the lineup"""
+        found: Set[int] = set()
+        for band, key in enumerate(self._band_keys(self.signature(player_ids))):
+            found.update(self._buckets[band].get(key, ()))
+        return found
+
+    def max_overlap(self, player_ids: Iterable[str]) -> int:
+        """Largest exact overlap among LSH candidates (may miss low-similarity lineups)"""
+        players = frozenset(player_ids)
+        return max((len(players & self._lineups[row]) for row in self.candidates(players)), default=0)
+
+    def is_too_similar(self, player_ids: Iterable[str], max_overlap: int) -> bool:
+        """True if an LSH candidate shares more than max_overlap players"""
+        return self.max_overlap(player_ids) > max_overlap
+
+    def contains(self, player_ids: Iterable[str]) -> bool:
+        """Exact duplicate check among LSH candidates"""
+        players = frozenset(player_ids)
+        return any(self._lineups[row] == players for row in self.candidates(players))
@@ -4,7 +4,6 @@ Live Data DFS Optimizer - Professional MIP-based lineup generation with real-tim
 """
 
 import asyncio
-import aiohttp
 import json
 import logging
 from datetime import datetime, timedelta
@@ -28,6 +27,9 @@ from dataclasses import dataclass
 from enum import Enum
 import scipy.stats
 
+from .swap_candidates import SwapCandidateIndex
+from ..utils.http_client import get_http_pool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -84,8 +86,9 @@ class LiveDataOptimizer:
         self.sport = sport
         self.site = site
         self.api_base = "http://localhost:8001"
-        self.session = None
+        self.http = get_http_pool()
         self.players: List[Player] = []
+        self._swap_index: Optional[Tuple[List[Player], SwapCandidateIndex]] = None
         self.last_data_update = None
         self.data_cache_ttl = 900  # 15 minutes
 
@@ -105,22 +108,18 @@ class LiveDataOptimizer:
 
     async def initialize(self):
         """Initialize the optimizer with live data connection"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+        self.http.register_source("live_api", rate_per_second=10.0, burst=10, timeout=30)
         logger.info(f"🚀 Live Data Optimizer initialized for {self.sport} {self.site}")
 
     async def close(self):
-        """Clean up resources"""
-        if self.session:
-            await self.session.close()
+        """Clean up resources (connections stay in the shared pool)"""
+        pass
 
     async def load_live_data(self, force_refresh: bool = False) -> bool:
         """Load live player data from DraftKings API"""
         try:
-            # Ensure session exists
-            if not self.session:
-                logger.info("Initializing session for live data loading...")
+            # Ensure the live API source is registered
+            if "live_api" not in self.http.sources:
                 await self.initialize()
 
             # Check cache validity
@@ -133,7 +132,7 @@ class LiveDataOptimizer:
             url = f"{self.api_base}/api/players?sport={self.sport}"
             logger.info(f"Fetching live data from: {url}")
 
-            async with self.session.get(url) as response:
+            async with self.http.request("live_api", url) as response:
                 if response.status != 200:
                     logger.error(f"API request failed with status {response.status}")
                     return False
@@ -618,16 +617,32 @@ class LiveDataOptimizer:
         locked_players = set(locked_players or [])
         swap_recommendations = []
 
+        swap_index = self._get_swap_index()
+
         # Analyze each lineup for potential improvements
         for lineup_idx, lineup in enumerate(lineups):
             lineup_swaps = []
+            lineup_names = {p.name for p in lineup.players}
+            excluded = lineup_names | locked_players
+            remaining_salary = self.salary_cap - sum(p.salary for p in lineup.players)
 
             for player in lineup.players:
                 if player.name in locked_players:
                     continue
 
+                # Skip positions where even the best affordable player can't clear the threshold
+                max_salary = player.salary + remaining_salary
+                min_salary = swap_index.min_salary(player.position)
+                if min_salary is None:
+                    continue
+                best_value = (swap_index.best_projection(player.position, max_salary) - player.projection
+                              - ((min_salary - player.salary) / 1000) * 2)
+                if best_value <= 0.5:
+                    continue
+
                 # Find potential replacements
-                replacements = self._find_swap_candidates(player, lineup.players)
+                replacements = self._find_swap_candidates(player, lineup.players, max_salary=max_salary,
+                                                          exclude_names=excluded, limit=3)
 
                 for replacement in replacements[:3]:  # Top 3 candidates
                     salary_diff = replacement.salary - player.salary
@@ -660,27 +675,24 @@ class LiveDataOptimizer:
         logger.info(f"✅ Generated {len(swap_recommendations)} late swap recommendations")
         return swap_recommendations
 
-    def _find_swap_candidates(self, current_player: Player, lineup_players: List[Player]) -> List[Player]:
-        """Find potential replacement players for a given player"""
-        candidates = []
-
-        for player in self.players:
-            # Same position, not in current lineup, not banned
-            if (player.position == current_player.position and
-                player.name not in [p.name for p in lineup_players] and
-                not player.banned):
-
-                # Calculate fit score
-                salary_efficiency = player.projection / player.salary
-                ownership_leverage = 1 / max(player.ownership, 1)  # Lower ownership = higher leverage
-
-                fit_score = salary_efficiency * ownership_leverage
-                player.fit_score = fit_score
-                candidates.append(player)
-
-        # Sort by fit score
-        candidates.sort(key=lambda x: x.fit_score, reverse=True)
-        return candidates
+    def _get_swap_index(self) -> SwapCandidateIndex:
+        """Swap-candidate index for the current pool, rebuilt only when the pool is replaced"""
+        cached = self._swap_index
+        if cached is None or cached[0] is not self.players:
+            cached = (self.players, SwapCandidateIndex(self.players))
+            self._swap_index = cached
+        return cached[1]
+
+    def _find_swap_candidates(self, current_player: Player, lineup_players: List[Player],
+                              max_salary: Optional[int] = None,
+                              exclude_names: Optional[set] = None,
+                              limit: Optional[int] = None) -> List[Player]:
+        """Find potential replacement players for a given player, best fit score first"""
+        if exclude_names is None:
+            exclude_names = {p.name for p in lineup_players}
+        index = self._get_swap_index()
+        return [player for player, _ in index.candidates(current_player.position, max_salary,
+                                                         exclude_names, limit)]
 
     def _get_swap_reason(self, salary_diff: int, projection_diff: float, ownership_diff: float) -> str:
         """Generate human-readable reason for the swap"""
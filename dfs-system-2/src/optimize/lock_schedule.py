@@ -0,0 +1,132 @@
+"""
+Game-start lock index
+Keeps a priority queue of upcoming kickoffs for a slate and re-optimizes only the
+late-swap entries whose slots become immutable at each lock boundary
+"""
+
+import asyncio
+import heapq
+import numpy as np
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from .late_swap import LateSwapEntry, LateSwapOptimizer, LateSwapResult, SwapPlayer
+
+
+@dataclass
+class LockEvent:
+    """A game reaching its start time"""
+    game_id: str
+    start_time: datetime
+    player_indexes: np.ndarray  # Pool indexes that become immutable
+
+
+class GameLockIndex:
+    """Priority queue of upcoming game locks over a player pool"""
+
+    def __init__(self, game_start_times: Dict[str, datetime], player_games: List[str]):
+        self.game_start_times = dict(game_start_times)
+        games = np.array(player_games, dtype=object)
+        self.players_by_game = {game_id: np.flatnonzero(games == game_id) for game_id in self.game_start_times}
+        self.locked = np.zeros(len(player_games), dtype=bool)
+        self.locked_games: Set[str] = set()
+        self._queue: List[Tuple[datetime, str]] = [(start, game_id) for game_id, start in self.game_start_times.items()]
+        heapq.heapify(self._queue)
+
+    @classmethod
+    def from_pool(cls, pool: List[SwapPlayer],
+                  game_start_times: Optional[Dict[str, datetime]] = None) -> 'GameLockIndex':
+        """Build from the slate pool, taking start times from the players when not given"""
+        if game_start_times is None:
+            game_start_times = {}
+            for player in pool:
+                if player.game_id and player.start_time is not None:
+                    game_start_times.setdefault(player.game_id, player.start_time)
+        return cls(game_start_times, [player.game_id for player in pool])
+
+    def next_lock_time(self) -> Optional[datetime]:
+        """Start time of the next game still to lock"""
+        return self._queue[0][0] if self._queue else None
+
+    def advance(self, now: Optional[datetime] = None) -> List[LockEvent]:
+        """Pop every game that has started by `now`"""
+        now = now or datetime.now(timezone.utc)
+        events = []
+        while self._queue and self._queue[0][0] <= now:
+            start, game_id = heapq.heappop(self._queue)
+            player_indexes = self.players_by_game[game_id]
+            self.locked[player_indexes] = True
+            self.locked_games.add(game_id)
+            events.append(LockEvent(game_id, start, player_indexes))
+        return events
+
+
+class LateSwapLockService:
+    """Re-optimizes only the entries touched by each game lock"""
+
+    def __init__(self, optimizer: LateSwapOptimizer, entries: List[LateSwapEntry],
+                 lock_index: Optional[GameLockIndex] = None, **optimize_kwargs):
+        self.optimizer = optimizer
+        self.lock_index = lock_index or GameLockIndex.from_pool(optimizer.pool)
+        self.entries = [LateSwapEntry(e.entry_id, e.contest_id, e.contest_name, e.entry_fee,
+                                      list(e.player_ids), set(e.locked_slots)) for e in entries]
+        self.results: Dict[str, LateSwapResult] = {}
+        self.optimize_kwargs = optimize_kwargs
+
+    @property
+    def locked_player_ids(self) -> Set[str]:
+        return {self.optimizer.pool[i].player_id for i in np.flatnonzero(self.lock_index.locked)}
+
+    def run_initial(self, now: Optional[datetime] = None) -> List[LateSwapResult]:
+        """Apply locks already due, then optimize every entry once"""
+        self._lock_slots(self.lock_index.advance(now))
+        return self._optimize(keep={})
+
+    def poll(self, now: Optional[datetime] = None) -> List[LateSwapResult]:
+        """Handle locks due by `now`; returns the re-optimized results (empty if nothing locked)"""
+        events = self.lock_index.advance(now)
+        if not events:
+            return []
+
+        affected = self._lock_slots(events)
+        print(f"🔒 {', '.join(e.game_id for e in events)} locked - re-optimizing {len(affected)} entries")
+        keep = {entry_id: result for entry_id, result in self.results.items() if entry_id not in affected}
+        results = self._optimize(keep)
+        return [result for result in results if result.entry_id in affected]
+
+    async def run(self, max_sleep_seconds: float = 60.0):
+        """Sleep until each kickoff and re-optimize as games lock"""
+        # Solves are CPU bound: run them off the event loop
+        loop = asyncio.get_running_loop()
+        if not self.results:
+            await loop.run_in_executor(None, self.run_initial)
+        while self.lock_index.next_lock_time() is not None:
+            wait = (self.lock_index.next_lock_time() - datetime.now(timezone.utc)).total_seconds()
+            await asyncio.sleep(min(max(wait, 0.0), max_sleep_seconds))
+            if wait <= max_sleep_seconds:
+                await loop.run_in_executor(None, self.poll)
+
+    def _lock_slots(self, events: List[LockEvent]) -> Set[str]:
+        """Lock open slots holding players from the started games; returns affected entry ids"""
+        newly_locked = set()
+        for event in events:
+            newly_locked.update(int(i) for i in event.player_indexes)
+
+        affected = set()
+        player_index = self.optimizer.player_index
+        for entry in self.entries:
+            slots = {s for s, pid in enumerate(entry.player_ids)
+                     if s not in entry.locked_slots and player_index.get(pid) in newly_locked}
+            if slots:
+                entry.locked_slots |= slots
+                affected.add(entry.entry_id)
+        return affected
+
+    def _optimize(self, keep: Dict[str, LateSwapResult]) -> List[LateSwapResult]:
+        results = self.optimizer.optimize_entries(self.entries, self.locked_player_ids,
+                                                  keep=keep, **self.optimize_kwargs)
+        for entry, result in zip(self.entries, results):
+            entry.player_ids = list(result.player_ids)
+            self.results[entry.entry_id] = result
+        return results
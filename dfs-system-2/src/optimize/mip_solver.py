@@ -1,7 +1,9 @@
+import asyncio
 import json
+import time
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator, AsyncIterator
 from pathlib import Path
 from ortools.linear_solver import pywraplp
 from datetime import datetime
@@ -10,6 +12,8 @@ from ..data.schemas import (
     Player, Lineup, LineupPlayer, OptimizationConfig, 
     SportType, SiteType
 )
+from .lineup_index import LineupIndex
+from .slot_assignment import SlotAssigner
 
 class MIPOptimizer:
     """Mixed Integer Programming optimizer for DFS lineup generation"""
@@ -21,6 +25,7 @@ class MIPOptimizer:
         
         # Load roster rules
         self.rules = self._load_roster_rules()
+        self.slot_assigner = SlotAssigner.from_rules(self.rules)
         
         # Initialize solver
         self.solver = pywraplp.Solver.CreateSolver('SCIP')
@@ -51,89 +56,129 @@ class MIPOptimizer:
                         players: List[Player], 
                         config: OptimizationConfig) -> List[Lineup]:
         """Optimize multiple lineups with diversification"""
+        return list(self.iter_lineups(players, config))
+    
+    def iter_lineups(self, 
+                    players: List[Player], 
+                    config: OptimizationConfig) -> Iterator[Lineup]:
+        """Yield lineups as they are solved, stopping at the time budget if one is set"""
         if not players:
             raise ValueError("No players provided for optimization")
         
+        deadline = None
+        if config.time_limit_seconds:
+            deadline = time.monotonic() + config.time_limit_seconds
+        
         lineups = []
-        used_combinations = set()
+        lineup_index = LineupIndex([p.id for p in players], capacity=config.num_lineups)
         
         for lineup_num in range(config.num_lineups):
-            print(f"Optimizing lineup {lineup_num + 1}/{config.num_lineups}")
+            remaining_seconds = None
+            if deadline is not None:
+                remaining_seconds = deadline - time.monotonic()
+                if remaining_seconds <= 0:
+                    print(f"Time limit reached, returning {len(lineups)}/{config.num_lineups} lineups")
+                    break
             
-            # Create solver instance for this lineup
-            solver = pywraplp.Solver.CreateSolver('SCIP')
-            if not solver:
-                raise RuntimeError("SCIP solver not available")
-            
-            # Create variables
-            player_vars = {}
-            for i, player in enumerate(players):
-                player_vars[i] = solver.IntVar(0, 1, f'player_{i}')
-            
-            # Add constraints
-            self._add_roster_constraints(solver, players, player_vars)
-            self._add_salary_constraints(solver, players, player_vars)
-            self._add_exposure_constraints(solver, players, player_vars, config, lineups)
-            self._add_lock_ban_constraints(solver, players, player_vars, config)
-            
-            # Add diversification constraints
-            if lineups:
-                self._add_diversification_constraints(solver, players, player_vars, lineups, config)
+            print(f"Optimizing lineup {lineup_num + 1}/{config.num_lineups}")
             
-            # Set objective
-            self._set_objective(solver, players, player_vars, config)
+            lineup = self._solve_lineup(players, config, lineup_index, lineup_num, remaining_seconds)
+            if lineup is None:
+                print(f"No solution found for lineup {lineup_num + 1}")
+                break
             
-            # Solve
-            status = solver.Solve()
+            # Check for duplicate lineups
+            lineup_player_ids = [p.player_id for p in lineup.players]
+            if lineup_index.contains(lineup_player_ids):
+                print(f"Duplicate lineup detected for lineup {lineup_num + 1}, skipping")
+                continue
             
-            if status == pywraplp.Solver.OPTIMAL:
-                lineup = self._extract_lineup(players, player_vars, lineup_num)
-                
-                # Check for duplicate lineups
-                lineup_key = tuple(sorted([p.player_id for p in lineup.players]))
-                if lineup_key not in used_combinations:
-                    lineups.append(lineup)
-                    used_combinations.add(lineup_key)
-                else:
-                    print(f"Duplicate lineup detected for lineup {lineup_num + 1}, skipping")
-            else:
-                print(f"No optimal solution found for lineup {lineup_num + 1}")
+            lineups.append(lineup)
+            lineup_index.add(lineup_player_ids)
+            yield lineup
+    
+    async def stream_lineups(self, 
+                            players: List[Player], 
+                            config: OptimizationConfig) -> AsyncIterator[Lineup]:
+        """Async version of iter_lineups that runs each solve off the event loop"""
+        loop = asyncio.get_running_loop()
+        lineup_iter = self.iter_lineups(players, config)
+        done = object()
+        
+        while True:
+            lineup = await loop.run_in_executor(None, next, lineup_iter, done)
+            if lineup is done:
                 break
+            yield lineup
+    
+    def _solve_lineup(self, players: List[Player], config: OptimizationConfig,
+                      lineup_index: LineupIndex, lineup_num: int,
+                      time_limit_seconds: Optional[float] = None) -> Optional[Lineup]:
+        """Build and solve the model for one lineup, accepting the incumbent on timeout"""
+        # Create solver instance for this lineup
+        solver = pywraplp.Solver.CreateSolver('SCIP')
+        if not solver:
+            raise RuntimeError("SCIP solver not available")
+        
+        # Create variables
+        player_vars = {}
+        for i, player in enumerate(players):
+            player_vars[i] = solver.IntVar(0, 1, f'player_{i}')
+        
+        # Add constraints
+        self._add_roster_constraints(solver, players, player_vars)
+        self._add_salary_constraints(solver, players, player_vars)
+        self._add_exposure_constraints(solver, players, player_vars, config, lineup_index)
+        self._add_lock_ban_constraints(solver, players, player_vars, config)
+        
+        # Add diversification constraints
+        if len(lineup_index):
+            self._add_diversification_constraints(solver, player_vars, lineup_index, config)
         
-        return lineups
+        # Set objective
+        self._set_objective(solver, players, player_vars, config)
+        
+        # Solve within the remaining budget
+        if time_limit_seconds is not None:
+            solver.SetTimeLimit(max(1, int(time_limit_seconds * 1000)))
+        
+        params = pywraplp.MPSolverParameters()
+        if config.gap_target is not None:
+            params.SetDoubleParam(pywraplp.MPSolverParameters.RELATIVE_MIP_GAP, config.gap_target)
+        
+        status = solver.Solve(params)
+        
+        if status == pywraplp.Solver.OPTIMAL:
+            return self._extract_lineup(players, player_vars, lineup_num, config)
+        if status == pywraplp.Solver.FEASIBLE:
+            # Time limit hit with an incumbent - good enough for an anytime portfolio
+            print(f"Using best incumbent for lineup {lineup_num + 1}")
+            return self._extract_lineup(players, player_vars, lineup_num, config)
+        
+        return None
     
     def _add_roster_constraints(self, solver, players: List[Player], player_vars: Dict[int, Any]):
-        """Add roster construction constraints"""
-        positions = self.rules['positions']
+        """Add roster construction constraints (every slot filled by one eligible player)"""
+        slots = self.slot_assigner.slots
         
-        # Group players by position
-        position_players = {}
+        # Player-slot variables only for eligible pairs
+        player_slots = {i: [] for i in player_vars}
+        slot_players = {j: [] for j in range(len(slots))}
         for i, player in enumerate(players):
-            pos = self._get_player_position(player)
-            if pos not in position_players:
-                position_players[pos] = []
-            position_players[pos].append(i)
-        
-        # Add position constraints
-        for pos_name, pos_rules in positions.items():
-            eligible_positions = pos_rules['eligible_positions']
-            min_players = pos_rules['min']
-            max_players = pos_rules['max']
-            
-            # Find players eligible for this roster position
-            eligible_player_indices = []
-            for eligible_pos in eligible_positions:
-                if eligible_pos in position_players:
-                    eligible_player_indices.extend(position_players[eligible_pos])
-            
-            if eligible_player_indices:
-                # Must select between min and max players for this position
-                solver.Add(
-                    solver.Sum([player_vars[i] for i in eligible_player_indices]) >= min_players
-                )
-                solver.Add(
-                    solver.Sum([player_vars[i] for i in eligible_player_indices]) <= max_players
-                )
+            mask = self.slot_assigner.eligibility_mask(self._get_player_position(player))
+            for j in range(len(slots)):
+                if mask >> j & 1:
+                    var = solver.IntVar(0, 1, f'slot_{i}_{j}')
+                    player_slots[i].append(var)
+                    slot_players[j].append(var)
+        
+        # A selected player fills exactly one slot
+        for i, slot_vars in player_slots.items():
+            solver.Add(solver.Sum(slot_vars) == player_vars[i])
+        
+        # Each slot is filled exactly once
+        for j, slot_vars in slot_players.items():
+            solver.Add(solver.Sum(slot_vars) == 1)
         
         # Total roster size constraint
         total_players = solver.Sum(player_vars.values())
@@ -154,27 +199,20 @@ class MIPOptimizer:
             solver.Add(total_salary >= min_salary)
     
     def _add_exposure_constraints(self, solver, players: List[Player], player_vars: Dict[int, Any],
-                                 config: OptimizationConfig, existing_lineups: List[Lineup]):
+                                 config: OptimizationConfig, lineup_index: LineupIndex):
         """Add exposure constraints across multiple lineups"""
-        if not config.max_exposure or not existing_lineups:
+        if not config.max_exposure or not len(lineup_index):
             return
         
         # Count how many times each player has been used
-        player_usage_count = {}
-        for player in players:
-            player_usage_count[player.id] = 0
-        
-        for lineup in existing_lineups:
-            for lineup_player in lineup.players:
-                if lineup_player.player_id in player_usage_count:
-                    player_usage_count[lineup_player.player_id] += 1
+        player_usage_count = lineup_index.exposure_counts()
         
         # Add exposure constraints
-        max_lineups = len(existing_lineups) + 1  # Including current lineup
+        max_lineups = len(lineup_index) + 1  # Including current lineup
         for i, player in enumerate(players):
             max_exposure = config.max_exposure.get(player.id, 1.0)
             max_usage = int(max_exposure * max_lineups)
-            current_usage = player_usage_count.get(player.id, 0)
+            current_usage = player_usage_count[i]
             
             if current_usage >= max_usage:
                 # Player has reached exposure limit
@@ -195,23 +233,18 @@ class MIPOptimizer:
                 if player.id in config.banned_players:
                     solver.Add(player_vars[i] == 0)
     
-    def _add_diversification_constraints(self, solver, players: List[Player], player_vars: Dict[int, Any],
-                                       existing_lineups: List[Lineup], config: OptimizationConfig):
+    def _add_diversification_constraints(self, solver, player_vars: Dict[int, Any],
+                                       lineup_index: LineupIndex, config: OptimizationConfig):
         """Add constraints to ensure lineup diversity"""
-        if not config.max_overlap or not existing_lineups:
+        if not config.max_overlap or not len(lineup_index):
             return
         
         # Prevent too much overlap with existing lineups
         max_overlap_players = int(config.max_overlap * self.rules['roster_size'])
         
-        for existing_lineup in existing_lineups:
-            existing_player_ids = {p.player_id for p in existing_lineup.players}
-            
-            # Count overlapping players
-            overlap_vars = []
-            for i, player in enumerate(players):
-                if player.id in existing_player_ids:
-                    overlap_vars.append(player_vars[i])
+        for row in range(len(lineup_index)):
+            # Pool indexes come straight from the lineup bitmask
+            overlap_vars = [player_vars[i] for i in lineup_index.member_indices(row)]
             
             if overlap_vars:
                 solver.Add(solver.Sum(overlap_vars) <= max_overlap_players)
@@ -246,27 +279,27 @@ class MIPOptimizer:
         solver.Maximize(solver.Sum(objective_terms))
     
     def _extract_lineup(self, players: List[Player], player_vars: Dict[int, Any], 
-                       lineup_id: int) -> Lineup:
+                       lineup_id: int, config: OptimizationConfig) -> Lineup:
         """Extract lineup from solver solution"""
+        chosen = [player for i, player in enumerate(players) if player_vars[i].solution_value() > 0.5]
+        roster_positions = self._assign_roster_positions(chosen, config)
+        
         selected_players = []
         total_salary = 0
         total_projection = 0.0
         
-        for i, player in enumerate(players):
-            if player_vars[i].solution_value() > 0.5:  # Selected
-                roster_position = self._assign_roster_position(player, selected_players)
-                
-                lineup_player = LineupPlayer(
-                    player_id=player.id,
-                    roster_position=roster_position,
-                    salary=self._get_player_salary(player),
-                    projection=self._get_player_projection(player),
-                    ownership=getattr(player, 'projected_ownership', None)
-                )
-                
-                selected_players.append(lineup_player)
-                total_salary += lineup_player.salary
-                total_projection += lineup_player.projection
+        for player, roster_position in zip(chosen, roster_positions):
+            lineup_player = LineupPlayer(
+                player_id=player.id,
+                roster_position=roster_position,
+                salary=self._get_player_salary(player),
+                projection=self._get_player_projection(player),
+                ownership=getattr(player, 'projected_ownership', None)
+            )
+            
+            selected_players.append(lineup_player)
+            total_salary += lineup_player.salary
+            total_projection += lineup_player.projection
         
         return Lineup(
             id=f"lineup_{lineup_id}",
@@ -279,16 +312,16 @@ class MIPOptimizer:
     def _get_player_position(self, player: Player) -> str:
         """Get player's position"""
         if self.site == SiteType.DRAFTKINGS:
-            return getattr(player, 'dk_position', player.position)
+            return player.dk_position or player.position
         else:
-            return getattr(player, 'fd_position', player.position)
+            return player.fd_position or player.position
     
     def _get_player_salary(self, player: Player) -> int:
         """Get player's salary for the site"""
         if self.site == SiteType.DRAFTKINGS:
-            return getattr(player, 'dk_salary', player.salary)
+            return player.dk_salary or player.salary
         else:
-            return getattr(player, 'fd_salary', player.salary)
+            return player.fd_salary or player.salary
     
     def _get_player_projection(self, player: Player) -> float:
         """Get player's projection - placeholder for now"""
@@ -300,27 +333,13 @@ class MIPOptimizer:
         # This would connect to the simulation system
         return self._get_player_projection(player) * 1.1  # Placeholder
     
-    def _assign_roster_position(self, player: Player, existing_players: List[LineupPlayer]) -> str:
-        """Assign specific roster position to player"""
-        player_position = self._get_player_position(player)
-        positions = self.rules['positions']
-        
-        # Count existing positions
-        position_counts = {}
-        for existing_player in existing_players:
-            pos = existing_player.roster_position
-            position_counts[pos] = position_counts.get(pos, 0) + 1
-        
-        # Find best position for this player
-        for pos_name, pos_rules in positions.items():
-            if player_position in pos_rules['eligible_positions']:
-                current_count = position_counts.get(pos_name, 0)
-                if current_count < pos_rules['max']:
-                    return pos_name
-        
-        # Fallback to first eligible position
-        for pos_name, pos_rules in positions.items():
-            if player_position in pos_rules['eligible_positions']:
-                return pos_name
-        
-        return player_position  # Fallback
+    def _assign_roster_positions(self, players: List[Player], config: OptimizationConfig) -> List[str]:
+        """Assign roster slots to a lineup's players via exact matching"""
+        positions = [self._get_player_position(player) for player in players]
+        
+        start_times = None
+        if config.late_swap_flexibility and config.game_start_times:
+            start_times = [config.game_start_times.get(player.game_id) for player in players]
+        
+        slots = self.slot_assigner.assign(positions, start_times)
+        return slots if slots is not None else positions  # Fallback
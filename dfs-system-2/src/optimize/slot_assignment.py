@@ -0,0 +1,157 @@
+"""
+Exact roster-slot assignment
+Matches a lineup's players to site roster slots (QB, RB, FLEX, G, UTIL, ...) as a
+small bipartite matching so multi-position players never produce an invalid lineup
+"""
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class SlotAssigner:
+    """Player -> roster slot matching over memoized eligibility masks"""
+
+    def __init__(self, slots: Sequence[str], eligibility: Dict[str, Sequence[str]]):
+        self.slots = list(slots)
+        self.eligibility = {slot: set(eligibility.get(slot, [slot])) | {slot} for slot in self.slots}
+        # Wider slots (FLEX/UTIL) leave the most room for late swaps
+        self.slot_width = np.array([len(self.eligibility[slot]) for slot in self.slots])
+        self._mask_cache: Dict[str, int] = {}
+        self._assignment_cache: Dict[Tuple, Optional[Tuple[int, ...]]] = {}
+
+    @classmethod
+    def from_rules(cls, rules: Dict[str, Any]) -> 'SlotAssigner':
+        """Build slots from a rules file: each position row contributes `min` slots"""
+        slots = []
+        eligibility = {}
+        for pos_name, pos_rules in rules['positions'].items():
+            slots.extend([pos_name] * pos_rules['min'])
+            eligibility[pos_name] = pos_rules['eligible_positions']
+
+        if len(slots) != rules['roster_size']:
+            raise ValueError(f"Position minimums give {len(slots)} slots, roster size is {rules['roster_size']}")
+        return cls(slots, eligibility)
+
+    def eligibility_mask(self, position: str) -> int:
+        """Bitmask of slots a position string (e.g. 'PG/SG') can fill"""
+        mask = self._mask_cache.get(position)
+        if mask is None:
+            parts = set(position.split('/')) | {position}
+            mask = 0
+            for j, slot in enumerate(self.slots):
+                if parts & self.eligibility[slot]:
+                    mask |= 1 << j
+            self._mask_cache[position] = mask
+        return mask
+
+    def assign(self, positions: Sequence[str],
+               start_times: Optional[Sequence[Any]] = None) -> Optional[List[str]]:
+        """Slot name for each player (same order), or None if no valid assignment exists"""
+        slot_indices = self.assign_indices(positions, start_times)
+        if slot_indices is None:
+            return None
+        return [self.slots[j] for j in slot_indices]
+
+    def assign_indices(self, positions: Sequence[str],
+                       start_times: Optional[Sequence[Any]] = None) -> Optional[List[int]]:
+        """Slot index for each player; with start times, later games go to wider slots"""
+        n = len(positions)
+        if n > len(self.slots):
+            return None
+        ranks = self._time_ranks(start_times) if start_times is not None else [0] * n
+
+        # Lineups with the same positions (and start-time order) share one solution
+        order = sorted(range(n), key=lambda i: (positions[i], ranks[i]))
+        key = tuple((positions[i], ranks[i]) for i in order)
+        if key not in self._assignment_cache:
+            masks = [self.eligibility_mask(pos) for pos, _ in key]
+            if any(ranks):
+                self._assignment_cache[key] = self._match_flexible(masks, [rank for _, rank in key])
+            else:
+                self._assignment_cache[key] = self._match(masks)
+
+        sorted_slots = self._assignment_cache[key]
+        if sorted_slots is None:
+            return None
+        slot_indices = [0] * n
+        for k, i in enumerate(order):
+            slot_indices[i] = sorted_slots[k]
+        return slot_indices
+
+    def assign_around(self, positions: Sequence[str], fixed_slots: Sequence[str]) -> Optional[List[str]]:
+        """Slot name for each player when fixed_slots (e.g. locked players' slots) are already taken"""
+        taken = 0
+        for slot in fixed_slots:
+            free = [j for j, name in enumerate(self.slots) if name == slot and not taken >> j & 1]
+            if not free:
+                return None
+            taken |= 1 << free[0]
+        open_mask = ((1 << len(self.slots)) - 1) & ~taken
+        if len(positions) > bin(open_mask).count('1'):
+            return None
+
+        slot_indices = self._match([self.eligibility_mask(pos) & open_mask for pos in positions])
+        if slot_indices is None:
+            return None
+        return [self.slots[j] for j in slot_indices]
+
+    def assign_portfolio(self, lineups_positions: Sequence[Sequence[str]],
+                         lineups_start_times: Optional[Sequence[Sequence[Any]]] = None
+                         ) -> List[Optional[List[str]]]:
+        """Assign slots for every lineup in a portfolio"""
+        if lineups_start_times is None:
+            lineups_start_times = [None] * len(lineups_positions)
+        return [self.assign(positions, start_times)
+                for positions, start_times in zip(lineups_positions, lineups_start_times)]
+
+    def _match(self, masks: List[int]) -> Optional[Tuple[int, ...]]:
+        """Maximum bipartite matching via augmenting paths (Kuhn)"""
+        slot_owner = [-1] * len(self.slots)
+
+        def augment(i: int, seen: List[int]) -> bool:
+            candidates = masks[i]
+            while candidates:
+                j = (candidates & -candidates).bit_length() - 1
+                candidates &= candidates - 1
+                if seen[0] >> j & 1:
+                    continue
+                seen[0] |= 1 << j
+                if slot_owner[j] < 0 or augment(slot_owner[j], seen):
+                    slot_owner[j] = i
+                    return True
+            return False
+
+        # Most constrained players first keeps augmenting paths short
+        for i in sorted(range(len(masks)), key=lambda i: bin(masks[i]).count('1')):
+            if not augment(i, [0]):
+                return None
+
+        player_slot = [0] * len(masks)
+        for j, i in enumerate(slot_owner):
+            if i >= 0:
+                player_slot[i] = j
+        return tuple(player_slot)
+
+    def _match_flexible(self, masks: List[int], ranks: List[int]) -> Optional[Tuple[int, ...]]:
+        """Feasible assignment maximizing sum(start rank * slot width)"""
+        n_slots = len(self.slots)
+        eligible = np.array([[mask >> j & 1 for j in range(n_slots)] for mask in masks], dtype=bool)
+        gain = np.outer(ranks, self.slot_width).astype(np.float64)
+        # Ineligible pairs cost more than any achievable gain
+        cost = np.where(eligible, -gain, gain.sum() + 1.0)
+
+        rows, cols = linear_sum_assignment(cost)
+        if not eligible[rows, cols].all():
+            return None
+        player_slot = [0] * len(masks)
+        for i, j in zip(rows, cols):
+            player_slot[i] = int(j)
+        return tuple(player_slot)
+
+    @staticmethod
+    def _time_ranks(start_times: Sequence[Any]) -> List[int]:
+        """Dense start-time ranks (1 = earliest); unknown times rank 0"""
+        known = sorted({t for t in start_times if t is not None})
+        rank_of = {t: k + 1 for k, t in enumerate(known)}
+        return [rank_of.get(t, 0) if t is not None else 0 for t in start_times]
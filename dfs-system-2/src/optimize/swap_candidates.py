@@ -0,0 +1,97 @@
+"""
+Swap-candidate index
+Per-position player tables sorted by salary with prefix maxima of projection and fit
+score, so "best replacements under the remaining salary" is a binary search plus a
+short scan. Built once per player pool and never mutated afterwards.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def fit_score(projection: float, salary: float, ownership: float) -> float:
+    """Salary efficiency weighted by ownership leverage (lower owned = higher)"""
+    if salary <= 0:
+        return 0.0
+    return (projection / salary) * (1 / max(ownership, 1))
+
+
+@dataclass(frozen=True)
+class PositionTable:
+    """Players at one position, ascending by salary"""
+    players: Tuple[Any, ...]
+    names: Tuple[str, ...]
+    salaries: np.ndarray
+    projections: np.ndarray
+    fit_scores: np.ndarray
+    max_projection: np.ndarray  # prefix max over the salary order
+    max_fit: np.ndarray
+    fit_order: np.ndarray       # table indexes by descending fit score
+
+
+class SwapCandidateIndex:
+    """Read-only replacement lookup over a player pool; safe to share across requests"""
+
+    def __init__(self, players: Iterable[Any]):
+        by_position: Dict[str, List[Any]] = {}
+        for player in players:
+            if not getattr(player, 'banned', False):
+                by_position.setdefault(player.position, []).append(player)
+        self.tables = {position: self._build_table(group) for position, group in by_position.items()}
+
+    @staticmethod
+    def _build_table(players: List[Any]) -> PositionTable:
+        players = sorted(players, key=lambda p: p.salary)
+        salaries = np.array([p.salary for p in players], dtype=np.int64)
+        projections = np.array([p.projection for p in players], dtype=np.float64)
+        fits = np.array([fit_score(p.projection, p.salary, p.ownership) for p in players])
+        return PositionTable(
+            players=tuple(players),
+            names=tuple(p.name for p in players),
+            salaries=salaries,
+            projections=projections,
+            fit_scores=fits,
+            max_projection=np.maximum.accumulate(projections),
+            max_fit=np.maximum.accumulate(fits),
+            fit_order=np.argsort(-fits, kind='stable'),
+        )
+
+    def _affordable(self, position: str, max_salary: Optional[float]) -> Tuple[Optional[PositionTable], int]:
+        table = self.tables.get(position)
+        if table is None:
+            return None, 0
+        if max_salary is None:
+            return table, len(table.players)
+        return table, int(np.searchsorted(table.salaries, max_salary, side='right'))
+
+    def best_projection(self, position: str, max_salary: Optional[float] = None) -> float:
+        """Highest projection at a position within budget (upper bound for pruning)"""
+        table, end = self._affordable(position, max_salary)
+        return float(table.max_projection[end - 1]) if end else float('-inf')
+
+    def best_fit(self, position: str, max_salary: Optional[float] = None) -> float:
+        table, end = self._affordable(position, max_salary)
+        return float(table.max_fit[end - 1]) if end else float('-inf')
+
+    def min_salary(self, position: str) -> Optional[int]:
+        table = self.tables.get(position)
+        return int(table.salaries[0]) if table is not None and len(table.players) else None
+
+    def candidates(self, position: str, max_salary: Optional[float] = None,
+                   exclude_names: Optional[Set[str]] = None,
+                   limit: Optional[int] = None) -> List[Tuple[Any, float]]:
+        """(player, fit score) by descending fit, affordable and not excluded"""
+        table, end = self._affordable(position, max_salary)
+        if not end:
+            return []
+        exclude_names = exclude_names or set()
+
+        results = []
+        for i in table.fit_order:
+            if i >= end or table.names[i] in exclude_names:
+                continue
+            results.append((table.players[i], float(table.fit_scores[i])))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
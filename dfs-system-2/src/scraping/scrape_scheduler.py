@@ -0,0 +1,209 @@
+"""
+Scrape Scheduler - concurrent page fetching with per-host politeness and parse caching
+Jobs for different hosts run in parallel while each host keeps its own request spacing
+(a token bucket in the shared HTTP pool) and in-flight limit. HTML parsing runs in a
+process pool, and parsed results are cached by a hash of the page content so pages
+that have not changed since the last pass never reach the parser.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+from ..ingest.columnar_cache import ColumnarCache
+from ..utils.http_client import HttpClientPool, get_http_pool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HostPolicy:
+    """Politeness limits for one host"""
+    delay: float = 2.0     # Seconds between request starts
+    concurrency: int = 1   # Requests in flight at once
+
+
+@dataclass
+class ScrapeJob:
+    """One page to fetch and the parser for its body"""
+    name: str
+    url: str
+    parse: Callable[[bytes], Any]  # Module-level so it can run in a worker process
+    timeout: float = 30.0
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self.url).netloc.lower()
+
+
+def _host_key(host: str) -> str:
+    return host[4:] if host.startswith('www.') else host
+
+
+class ParseCache:
+    """Parsed results keyed by page content hash: an in-memory LRU, plus one on-disk
+    slot per page (DataFrame results only) that is reused while the content is unchanged"""
+
+    def __init__(self, directory: Optional[str] = None, memory_entries: int = 256, ttl_hours: float = 24 * 7):
+        self.memory: 'OrderedDict[str, Any]' = OrderedDict()
+        self.memory_entries = memory_entries
+        self.ttl_hours = ttl_hours
+        self.disk = ColumnarCache(directory) if directory else None
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def digest(job: ScrapeJob, body: bytes) -> str:
+        parser = f"{job.parse.__module__}.{job.parse.__qualname__}"
+        return hashlib.sha256(parser.encode('utf-8') + b'\0' + body).hexdigest()
+
+    @staticmethod
+    def slot(job: ScrapeJob) -> str:
+        return f"parsed_{job.parse.__name__}_{hashlib.sha256(job.url.encode('utf-8')).hexdigest()[:16]}"
+
+    def get(self, job: ScrapeJob, digest: str) -> Tuple[bool, Any]:
+        if digest in self.memory:
+            self.memory.move_to_end(digest)
+            self.hits += 1
+            return True, self.memory[digest]
+        if self.disk is not None:
+            slot = self.slot(job)
+            manifest = self.disk.manifest(slot)
+            if manifest is not None and manifest.get('metadata', {}).get('digest') == digest:
+                value = self.disk.read(slot)
+                if value is not None:
+                    self._remember(digest, value)
+                    self.hits += 1
+                    return True, value
+        self.misses += 1
+        return False, None
+
+    def put(self, job: ScrapeJob, digest: str, value: Any):
+        self._remember(digest, value)
+        if self.disk is not None and isinstance(value, pd.DataFrame):
+            try:
+                self.disk.write(self.slot(job), value, self.ttl_hours, metadata={'digest': digest, 'url': job.url})
+            except Exception as e:
+                logger.warning(f"Could not persist parsed {job.name}: {e}")
+
+    def _remember(self, digest: str, value: Any):
+        self.memory[digest] = value
+        self.memory.move_to_end(digest)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+
+class ScrapeScheduler:
+    """Fans scrape jobs out across hosts; one host's limits never hold up another"""
+
+    def __init__(self, pool: Optional[HttpClientPool] = None,
+                 policies: Optional[Dict[str, HostPolicy]] = None,
+                 default_policy: Optional[HostPolicy] = None,
+                 headers: Optional[Dict[str, str]] = None,
+                 parse_cache: Optional[ParseCache] = None,
+                 parse_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        self.pool = pool
+        self.policies = {_host_key(host): policy for host, policy in (policies or {}).items()}
+        self.default_policy = default_policy or HostPolicy()
+        self.headers = dict(headers or {})
+        self.parse_cache = parse_cache or ParseCache()
+        self.parse_workers = parse_workers or min(4, os.cpu_count() or 1)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._slots: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Semaphore] = {}
+
+    def policy(self, host: str) -> HostPolicy:
+        return self.policies.get(_host_key(host), self.default_policy)
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+        return self._executor
+
+    @asynccontextmanager
+    async def host_slot(self, url: str) -> AsyncIterator[None]:
+        """Hold one of the host's concurrency slots"""
+        host = _host_key(urlsplit(url).netloc.lower())
+        key = (asyncio.get_running_loop(), host)
+        semaphore = self._slots.get(key)
+        if semaphore is None:
+            semaphore = self._slots[key] = asyncio.Semaphore(self.policy(host).concurrency)
+        async with semaphore:
+            yield
+
+    async def fetch(self, job: ScrapeJob) -> Optional[bytes]:
+        """Page body, or None on a non-200 response or network error"""
+        pool = self.pool or get_http_pool()
+        source = f"scrape:{_host_key(job.host)}"
+        if source not in pool.sources:
+            delay = self.policy(job.host).delay
+            pool.register_source(source, rate_per_second=1.0 / delay if delay > 0 else 1000.0, burst=1.0,
+                                 headers=self.headers, timeout=job.timeout)
+        try:
+            async with self.host_slot(job.url):
+                async with pool.request(source, job.url) as response:
+                    if response.status != 200:
+                        logger.error(f"{job.name}: HTTP {response.status} for {job.url}")
+                        return None
+                    return await response.read()
+        except Exception as e:
+            logger.error(f"{job.name}: request failed: {e}")
+            return None
+
+    async def parse(self, job: ScrapeJob, body: bytes) -> Any:
+        """Parsed body from the cache, or from the worker pool when the content is new"""
+        digest = self.parse_cache.digest(job, body)
+        hit, value = self.parse_cache.get(job, digest)
+        if hit:
+            return value
+        value = await asyncio.get_running_loop().run_in_executor(self.executor, job.parse, body)
+        self.parse_cache.put(job, digest, value)
+        return value
+
+    async def run_job(self, job: ScrapeJob) -> Any:
+        body = await self.fetch(job)
+        if body is None:
+            return None
+        try:
+            return await self.parse(job, body)
+        except Exception as e:
+            logger.error(f"{job.name}: parse failed: {e}")
+            return None
+
+    async def run(self, jobs: List[ScrapeJob]) -> Dict[str, Any]:
+        """Every job concurrently; {job name: parsed result, or None when it failed}"""
+        results = await asyncio.gather(*(self.run_job(job) for job in jobs))
+        return {job.name: result for job, result in zip(jobs, results)}
+
+    def run_sync(self, jobs: List[ScrapeJob]) -> Dict[str, Any]:
+        """run() from synchronous code, closing this loop's HTTP session afterwards. Called
+        from inside a running event loop, the pass runs on its own loop in a worker thread."""
+        async def run_and_close():
+            try:
+                return await self.run(jobs)
+            finally:
+                await (self.pool or get_http_pool()).close()
+                loop = asyncio.get_running_loop()
+                self._slots = {key: slot for key, slot in self._slots.items() if key[0] is not loop}
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run_and_close())
+        with ThreadPoolExecutor(max_workers=1) as thread:
+            return thread.submit(asyncio.run, run_and_close()).result()
+
+    def close(self):
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -4,6 +4,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import pandas as pd
 
+from .scrape_scheduler import ScrapeScheduler
+
 class SlateScrapingEngine:
     """Advanced web scraping engine for DFS slate information"""
     
@@ -54,6 +56,8 @@ class SlateScrapingEngine:
         }
         
         self.scraped_data = {}
+        # Per-host concurrency limits; different hosts are scraped in parallel
+        self.scheduler = ScrapeScheduler()
         
     async def scrape_all_sources(self, sport: str = "NFL") -> Dict[str, Any]:
         """Scrape all enabled sources for slate information"""
@@ -69,21 +73,24 @@ class SlateScrapingEngine:
             "projections": {}
         }
         
-        # Scrape each source
-        for source_name, source_config in self.sources.items():
-            if source_config["enabled"]:
-                try:
-                    print(f"  🔍 Scraping {source_name}...")
-                    source_data = await self._scrape_source(source_name, source_config, sport)
-                    results["sources"][source_name] = source_data
-                    
-                    # Merge data
-                    if source_data and source_data.get("success"):
-                        self._merge_source_data(results, source_data, source_name)
-                        
-                except Exception as e:
-                    print(f"  ❌ Failed to scrape {source_name}: {e}")
-                    results["sources"][source_name] = {"success": False, "error": str(e)}
+        # Scrape all sources concurrently, then merge in source order
+        enabled = [(name, config) for name, config in self.sources.items() if config["enabled"]]
+        outcomes = await asyncio.gather(
+            *(self._scrape_source_politely(name, config, sport) for name, config in enabled),
+            return_exceptions=True
+        )
+        
+        for (source_name, _), source_data in zip(enabled, outcomes):
+            if isinstance(source_data, Exception):
+                print(f"  ❌ Failed to scrape {source_name}: {source_data}")
+                results["sources"][source_name] = {"success": False, "error": str(source_data)}
+                continue
+            
+            results["sources"][source_name] = source_data
+            
+            # Merge data
+            if source_data and source_data.get("success"):
+                self._merge_source_data(results, source_data, source_name)
         
         # Process and clean merged data
         results = self._process_merged_data(results)
@@ -91,6 +98,12 @@ class SlateScrapingEngine:
         print(f"✅ Scraping complete! Found {len(results['players'])} players, {len(results['contests'])} contests")
         return results
     
+    async def _scrape_source_politely(self, source_name: str, config: Dict, sport: str) -> Dict[str, Any]:
+        """Scrape one source inside its host's concurrency slot"""
+        async with self.scheduler.host_slot(config["url"]):
+            print(f"  🔍 Scraping {source_name}...")
+            return await self._scrape_source(source_name, config, sport)
+    
     async def _scrape_source(self, source_name: str, config: Dict, sport: str) -> Dict[str, Any]:
         """Scrape individual source using available MCP tools"""
         url = config["url"].replace("NFL", sport).replace("nfl", sport.lower())
@@ -0,0 +1,222 @@
+"""
+Live standings tracker
+Keeps live scores for our entries and a field sample as a lineup x player sparse
+product updated by point deltas, with ranks held in Fenwick trees over score
+hundredths so each player update costs O(affected lineups * log field)
+"""
+
+import asyncio
+import csv
+import json
+import numpy as np
+from dataclasses import dataclass
+from pathlib import Path
+from scipy import sparse
+from typing import AsyncIterable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+SCORE_RESOLUTION = 100   # Fantasy points are tracked to the hundredth
+MIN_SCORE = -50.0        # Lowest lineup score representable (negative DST, fumbles)
+
+
+class ScoreFenwickTree:
+    """Order-statistics counts over integer score keys"""
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.size = capacity
+        self.tree = np.zeros(capacity + 1, dtype=np.int64)
+        self.total = 0
+
+    def add(self, key: int, count: int = 1):
+        if key >= self.size:
+            self._grow(key)
+        i = key + 1
+        while i <= self.size:
+            self.tree[i] += count
+            i += i & -i
+        self.total += count
+
+    def count_at_most(self, key: int) -> int:
+        i = min(key + 1, self.size)
+        result = 0
+        while i > 0:
+            result += self.tree[i]
+            i -= i & -i
+        return int(result)
+
+    def count_above(self, key: int) -> int:
+        return self.total - self.count_at_most(key)
+
+    def _grow(self, key: int):
+        """Double capacity until `key` fits, rebuilding from the per-key counts"""
+        counts = np.array([self.count_at_most(k) for k in range(self.size)], dtype=np.int64)
+        counts = np.diff(counts, prepend=0)
+        while self.size <= key:
+            self.size *= 2
+        self.tree = np.zeros(self.size + 1, dtype=np.int64)
+        self.total = 0
+        for k in np.flatnonzero(counts):
+            self.add(int(k), int(counts[k]))
+
+
+@dataclass
+class EntryStanding:
+    """Live position of one of our entries"""
+    entry_id: str
+    score: float
+    rank: int
+    payout: float
+
+
+class LiveStandingsTracker:
+    """Incremental live ranks and payout positions for our entries against a field"""
+
+    def __init__(self, entries: Dict[str, Sequence[str]], field_lineups: Sequence[Sequence[str]],
+                 payouts: Sequence[float], contest_size: Optional[int] = None):
+        """payouts: prize per finishing place, index 0 = 1st.
+        contest_size: total entries when the field is a sample of a larger contest."""
+        self.entry_ids = list(entries)
+        self.entry_row = {entry_id: row for row, entry_id in enumerate(self.entry_ids)}
+        self.n_entries = len(self.entry_ids)
+        lineups = [list(players) for players in entries.values()] + [list(players) for players in field_lineups]
+
+        self.player_index: Dict[str, int] = {}
+        rows, cols = [], []
+        for row, players in enumerate(lineups):
+            for player_id in players:
+                rows.append(row)
+                cols.append(self.player_index.setdefault(player_id, len(self.player_index)))
+        # Column-major so each player's lineups are one contiguous slice
+        self.incidence = sparse.csc_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)),
+                                           shape=(len(lineups), len(self.player_index)))
+
+        self.player_points = np.zeros(len(self.player_index))
+        self.scores = np.zeros(len(lineups))
+        self.keys = np.full(len(lineups), self._key(0.0), dtype=np.int64)
+
+        self.entry_tree = ScoreFenwickTree()
+        self.field_tree = ScoreFenwickTree()
+        self.entry_tree.add(self._key(0.0), self.n_entries)
+        self.field_tree.add(self._key(0.0), len(lineups) - self.n_entries)
+
+        n_field = len(lineups) - self.n_entries
+        other_entries = (contest_size - self.n_entries) if contest_size else n_field
+        self.field_scale = other_entries / n_field if n_field else 0.0
+        self.payouts = np.asarray(payouts, dtype=np.float64)
+
+    @staticmethod
+    def _key(score: float) -> int:
+        return max(int(round((score - MIN_SCORE) * SCORE_RESOLUTION)), 0)
+
+    def update_player(self, player_id: str, points: float) -> np.ndarray:
+        """Set a player's cumulative points; returns the lineup rows that moved"""
+        col = self.player_index.get(player_id)
+        if col is None:
+            return np.empty(0, dtype=np.int64)
+        delta = points - self.player_points[col]
+        if delta == 0:
+            return np.empty(0, dtype=np.int64)
+        self.player_points[col] = points
+
+        start, end = self.incidence.indptr[col], self.incidence.indptr[col + 1]
+        rows = self.incidence.indices[start:end]
+        self.scores[rows] += delta
+        for row in rows:
+            tree = self.entry_tree if row < self.n_entries else self.field_tree
+            new_key = self._key(self.scores[row])
+            tree.add(int(self.keys[row]), -1)
+            tree.add(new_key, 1)
+            self.keys[row] = new_key
+        return rows
+
+    def apply_updates(self, updates: Dict[str, float]) -> int:
+        """Apply a batch of cumulative point updates; returns how many lineup scores changed"""
+        changed = 0
+        for player_id, points in updates.items():
+            changed += len(self.update_player(player_id, points))
+        return changed
+
+    def rank(self, entry_id: str) -> int:
+        """Live place of one entry (ties share the better place)"""
+        key = int(self.keys[self.entry_row[entry_id]])
+        field_above = self.field_tree.count_above(key) * self.field_scale
+        return 1 + self.entry_tree.count_above(key) + int(round(field_above))
+
+    def payout_for_rank(self, rank: int) -> float:
+        return float(self.payouts[rank - 1]) if 0 < rank <= len(self.payouts) else 0.0
+
+    def standing(self, entry_id: str) -> EntryStanding:
+        rank = self.rank(entry_id)
+        return EntryStanding(entry_id=entry_id, score=round(float(self.scores[self.entry_row[entry_id]]), 2),
+                             rank=rank, payout=self.payout_for_rank(rank))
+
+    def standings(self) -> List[EntryStanding]:
+        """All of our entries, best place first"""
+        return sorted((self.standing(entry_id) for entry_id in self.entry_ids), key=lambda s: s.rank)
+
+    async def run(self, feed: AsyncIterable[Dict[str, float]],
+                  on_update: Optional[Callable[[List[EntryStanding]], None]] = None):
+        """Consume a points feed, publishing standings after each batch that moved a score"""
+        async for updates in feed:
+            if self.apply_updates(updates) and on_update is not None:
+                on_update(self.standings())
+
+
+class FileReplayFeed:
+    """Replays recorded scoring updates (timestamp, player_id, points) from CSV or JSON lines"""
+
+    def __init__(self, file_path: str, speed: float = 0.0):
+        """speed: seconds slept between batches (0 replays as fast as possible)"""
+        self.file_path = Path(file_path)
+        self.speed = speed
+
+    def _records(self) -> Iterator[Tuple[str, str, float]]:
+        with open(self.file_path, 'r', newline='', encoding='utf-8') as f:
+            if self.file_path.suffix in ('.jsonl', '.json'):
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        yield str(record['timestamp']), str(record['player_id']), float(record['points'])
+            else:
+                for record in csv.DictReader(f):
+                    yield record['timestamp'], record['player_id'], float(record['points'])
+
+    def batches(self) -> Iterator[Dict[str, float]]:
+        """Updates grouped by consecutive timestamp"""
+        current, batch = None, {}
+        for timestamp, player_id, points in self._records():
+            if timestamp != current and batch:
+                yield batch
+                batch = {}
+            current = timestamp
+            batch[player_id] = points
+        if batch:
+            yield batch
+
+    async def __aiter__(self):
+        for batch in self.batches():
+            yield batch
+            await asyncio.sleep(self.speed)
+
+
+class PolledFeed:
+    """Polls a scoring endpoint: `fetch` returns cumulative points by player id"""
+
+    def __init__(self, fetch: Callable[[], Dict[str, float]], interval_seconds: float = 30.0,
+                 max_polls: Optional[int] = None):
+        self.fetch = fetch
+        self.interval_seconds = interval_seconds
+        self.max_polls = max_polls
+        self._last: Dict[str, float] = {}
+
+    async def __aiter__(self):
+        polls = 0
+        loop = asyncio.get_running_loop()
+        while self.max_polls is None or polls < self.max_polls:
+            points = await loop.run_in_executor(None, self.fetch)
+            # Only forward players whose totals moved since the last poll
+            changed = {pid: pts for pid, pts in points.items() if self._last.get(pid) != pts}
+            self._last.update(changed)
+            polls += 1
+            if changed:
+                yield changed
+            await asyncio.sleep(self.interval_seconds)
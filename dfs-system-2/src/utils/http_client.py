@@ -0,0 +1,297 @@
+"""
+Shared HTTP client pool
+One process-wide aiohttp layer for the ingest adapters: pooled keep-alive connections
+per host, non-blocking per-source token buckets, retry/backoff policies taken from
+each adapter's config, and cached conditional GETs through the response cache
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, FrozenSet, Optional
+
+import aiohttp
+
+from .response_cache import CachedResponse, ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryPolicy:
+    """How many times to retry a request and how long to back off between attempts"""
+    retries: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    @classmethod
+    def from_config(cls, config: Any) -> 'RetryPolicy':
+        """Adapter configs carry `retries`; everything else keeps the defaults"""
+        return cls(retries=max(1, int(getattr(config, 'retries', 3))))
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff, or the server's Retry-After when it sends one"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return min(self.backoff_base * (2 ** attempt), self.backoff_max)
+
+
+class TokenBucket:
+    """Async token bucket; waiting callers sleep instead of blocking the event loop"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate          # Tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self, tokens: float = 1.0):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Reserve first so concurrent callers queue behind each other in arrival order
+        self.tokens -= tokens
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+
+
+@dataclass
+class SourceSettings:
+    bucket: TokenBucket
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    headers: Dict[str, str] = field(default_factory=dict)
+    timeout: Optional[aiohttp.ClientTimeout] = None
+
+
+class HttpClientPool:
+    """Process-wide HTTP sessions (one per event loop) shared by every data source"""
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10,
+                 keepalive_timeout: float = 30.0, dns_cache_ttl: int = 300,
+                 cache: Optional[ResponseCache] = None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.sources: Dict[str, SourceSettings] = {}
+        self.cache = cache
+        self._revalidating: Dict[str, asyncio.Future] = {}
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = \
+            weakref.WeakKeyDictionary()
+
+    def register_source(self, source: str, rate_per_second: float = 1.0, burst: float = 1.0,
+                        retry: Optional[RetryPolicy] = None, headers: Optional[Dict[str, str]] = None,
+                        timeout: Optional[float] = None) -> SourceSettings:
+        """Add a source, or merge into an existing one
+
+        Several callers share one process-wide pool, so re-registering never loosens what
+        another caller set up: headers are combined, the stricter rate and burst win (on
+        the same bucket, so limits survive), and unset retry/timeout keep their values.
+        """
+        settings = self.sources.get(source)
+        if settings is None:
+            settings = SourceSettings(
+                bucket=TokenBucket(rate_per_second, burst),
+                retry=retry or RetryPolicy(),
+                headers=dict(headers or {}),
+                timeout=aiohttp.ClientTimeout(total=timeout) if timeout else None
+            )
+            self.sources[source] = settings
+            return settings
+
+        bucket = settings.bucket
+        bucket.rate = min(bucket.rate, rate_per_second)
+        bucket.capacity = min(bucket.capacity, burst)
+        bucket.tokens = min(bucket.tokens, bucket.capacity)
+        if retry is not None:
+            settings.retry = retry
+        if headers:
+            settings.headers = {**settings.headers, **headers}
+        if timeout:
+            settings.timeout = aiohttp.ClientTimeout(total=timeout)
+        return settings
+
+    def register_adapter(self, source: str, config: Any, headers: Optional[Dict[str, str]] = None) -> SourceSettings:
+        """Register from an adapter config (rate_limit_delay seconds between requests, retries, timeout)"""
+        delay = getattr(config, 'rate_limit_delay', 1.0) or 0.0
+        rate = 1.0 / delay if delay > 0 else 1000.0
+        return self.register_source(source, rate_per_second=rate, burst=1.0,
+                                    retry=RetryPolicy.from_config(config), headers=headers,
+                                    timeout=getattr(config, 'timeout', None))
+
+    def _settings(self, source: str) -> SourceSettings:
+        settings = self.sources.get(source)
+        if settings is None:
+            settings = self.register_source(source)
+        return settings
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Keep-alive session for the running loop, created on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout,
+                                             ttl_dns_cache=self.dns_cache_ttl)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+        return session
+
+    def _request_kwargs(self, settings: SourceSettings, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if settings.headers:
+            kwargs['headers'] = {**settings.headers, **(kwargs.get('headers') or {})}
+        if settings.timeout is not None:
+            kwargs.setdefault('timeout', settings.timeout)
+        return kwargs
+
+    @asynccontextmanager
+    async def request(self, source: str, url: str, method: str = "GET",
+                      **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Single rate-limited request; drop-in for `async with session.get(...)`"""
+        settings = self._settings(source)
+        await settings.bucket.acquire()
+        session = await self.session()
+        async with session.request(method, url, **self._request_kwargs(settings, kwargs)) as response:
+            yield response
+
+    async def fetch_json(self, source: str, url: str, method: str = "GET",
+                         cache_ttl: Optional[float] = None, **kwargs) -> Optional[Any]:
+        """JSON body of a 200 response, retrying per the source's policy; None on failure.
+        GETs with a cache_ttl go through the response cache (read-only result)."""
+        try:
+            if cache_ttl is not None and method == "GET" and self.cache is not None:
+                response = await self.get_cached(source, url, ttl=cache_ttl, **kwargs)
+                return response.json() if response.status == 200 else None
+            return await self._fetch_json(source, url, method, **kwargs)
+        except ValueError as e:
+            logger.error(f"{source}: invalid JSON from {url}: {e}")
+            return None
+
+    async def _fetch_json(self, source: str, url: str, method: str, **kwargs) -> Optional[Any]:
+        policy = self._settings(source).retry
+        for attempt in range(policy.retries):
+            status, retry_after = None, None
+            try:
+                async with self.request(source, url, method, **kwargs) as response:
+                    status = response.status
+                    if status == 200:
+                        return await response.json(content_type=None)
+                    retry_after = response.headers.get('Retry-After')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"{source}: request failed (attempt {attempt + 1}): {e}")
+
+            # Back off after the response is released so its connection goes back to the pool
+            retryable = status is None or status in policy.retry_statuses
+            if retryable and attempt < policy.retries - 1:
+                wait_time = policy.delay(attempt, retry_after)
+                if status is not None:
+                    logger.warning(f"{source}: HTTP {status}, retrying in {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)
+                continue
+            if status is not None:
+                logger.error(f"{source}: HTTP {status} for {url}")
+            return None
+        return None
+
+    async def get_cached(self, source: str, url: str, ttl: Optional[float] = None,
+                         **kwargs) -> CachedResponse:
+        """GET through the response cache.
+
+        Fresh entries are served without a request; entries inside their
+        stale-while-revalidate window are served while one background request
+        revalidates them; anything older is revalidated with If-None-Match /
+        If-Modified-Since first. A failed revalidation falls back to the stale copy."""
+        if self.cache is None:
+            self.cache = ResponseCache()
+        key = self.cache.key(source, url, kwargs.get('params'))
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return entry
+        if entry is not None and entry.is_usable_stale():
+            self._revalidation(source, url, key, entry, ttl, kwargs)
+            return entry
+        return await asyncio.shield(self._revalidation(source, url, key, entry, ttl, kwargs))
+
+    def _revalidation(self, source: str, url: str, key: str, entry: Optional[CachedResponse],
+                      ttl: Optional[float], kwargs: Dict[str, Any]) -> asyncio.Future:
+        """One in-flight request per cache key; concurrent callers share its result"""
+        pending = self._revalidating.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            return pending
+        task = asyncio.ensure_future(self._conditional_get(source, url, key, entry, ttl, kwargs))
+        self._revalidating[key] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(key, None))
+        return task
+
+    async def _conditional_get(self, source: str, url: str, key: str, entry: Optional[CachedResponse],
+                               ttl: Optional[float], kwargs: Dict[str, Any]) -> CachedResponse:
+        cache = self.cache
+        ttl = cache.default_ttl if ttl is None else ttl
+        policy = self._settings(source).retry
+        kwargs = dict(kwargs)
+        kwargs['headers'] = {**(kwargs.get('headers') or {}), **(entry.validators() if entry else {})}
+
+        status = 0
+        for attempt in range(policy.retries):
+            retry_after, failed = None, False
+            try:
+                async with self.request(source, url, **kwargs) as response:
+                    status = response.status
+                    if status == 304 and entry is not None:
+                        refreshed = entry.refreshed(response.headers, ttl, cache.stale_while_revalidate)
+                        cache.put(refreshed, body_changed=False)
+                        return refreshed
+                    if status == 200:
+                        fetched = CachedResponse.from_headers(key, url, status, await response.read(),
+                                                              response.headers, ttl, cache.stale_while_revalidate)
+                        cache.put(fetched)
+                        return fetched
+                    retry_after = response.headers.get('Retry-After')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"{source}: request failed (attempt {attempt + 1}): {e}")
+                failed = True
+
+            # Back off after the response is released so its connection goes back to the pool
+            if (failed or status in policy.retry_statuses) and attempt < policy.retries - 1:
+                await asyncio.sleep(policy.delay(attempt, retry_after))
+                continue
+            break
+
+        if entry is not None:
+            logger.warning(f"{source}: serving stale response for {url} (HTTP {status or 'error'})")
+            return entry
+        logger.error(f"{source}: HTTP {status or 'error'} for {url}")
+        return CachedResponse(key=key, url=url, status=status)
+
+    async def close(self):
+        """Close the session owned by the running loop, after in-flight revalidations land"""
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._revalidating.values() if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+_pool: Optional[HttpClientPool] = None
+
+
+def get_http_pool() -> HttpClientPool:
+    """The process-wide pool"""
+    global _pool
+    if _pool is None:
+        _pool = HttpClientPool(cache=ResponseCache())
+    return _pool
+
+
+async def close_http_pool():
+    if _pool is not None:
+        await _pool.close()
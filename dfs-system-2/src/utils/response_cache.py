@@ -0,0 +1,237 @@
+"""
+HTTP Response Cache
+Persistent cache for GET responses: ETag / Last-Modified revalidation, Cache-Control
+freshness, zlib-compressed bodies in a size-bounded SQLite LRU store, and a small
+in-memory layer that keeps parsed JSON so repeated reads skip decoding entirely
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.getenv('DFS_HTTP_CACHE_DIR',
+                                   Path(__file__).resolve().parent.parent.parent / 'cache' / 'http'))
+
+_MISSING = object()
+
+
+def parse_cache_control(header: Optional[str]) -> Dict[str, Optional[str]]:
+    """'public, max-age=60, no-cache' -> {'public': None, 'max-age': '60', 'no-cache': None}"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (header or '').split(','):
+        name, _, value = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
+
+
+@dataclass
+class CachedResponse:
+    """A stored response plus the validators and freshness window it came with"""
+    key: str
+    url: str
+    status: int
+    body: bytes = b''
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = 0.0
+    max_age: float = 0.0
+    stale_while_revalidate: float = 0.0
+    no_store: bool = False
+    from_cache: bool = False  # Loaded from the disk store rather than fetched by this process
+    _parsed: Any = field(default=_MISSING, repr=False, compare=False)
+
+    @classmethod
+    def from_headers(cls, key: str, url: str, status: int, body: bytes, headers: Mapping[str, str],
+                     default_ttl: float, default_swr: float, now: Optional[float] = None) -> 'CachedResponse':
+        entry = cls(key=key, url=url, status=status, body=body,
+                    etag=headers.get('ETag'), last_modified=headers.get('Last-Modified'))
+        return entry.refreshed(headers, default_ttl, default_swr, now)
+
+    def refreshed(self, headers: Mapping[str, str], default_ttl: float, default_swr: float,
+                  now: Optional[float] = None) -> 'CachedResponse':
+        """Copy with freshness reset from a 200 or 304 response's headers"""
+        directives = parse_cache_control(headers.get('Cache-Control'))
+        if 'no-cache' in directives:
+            max_age, swr = 0.0, 0.0
+        else:
+            max_age = _seconds(directives.get('s-maxage') or directives.get('max-age'))
+            max_age = default_ttl if max_age is None else max_age
+            swr = _seconds(directives.get('stale-while-revalidate'))
+            swr = default_swr if swr is None else swr
+            if 'must-revalidate' in directives:
+                swr = 0.0
+        return replace(self, stored_at=time.time() if now is None else now, max_age=max_age,
+                       stale_while_revalidate=swr, no_store='no-store' in directives,
+                       etag=headers.get('ETag') or self.etag,
+                       last_modified=headers.get('Last-Modified') or self.last_modified)
+
+    @property
+    def storable(self) -> bool:
+        if self.status != 200 or self.no_store:
+            return False
+        return self.max_age > 0 or bool(self.etag or self.last_modified)
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (time.time() if now is None else now) - self.stored_at
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return self.age(now) < self.max_age
+
+    def is_usable_stale(self, now: Optional[float] = None) -> bool:
+        """Past max-age but inside the stale-while-revalidate window"""
+        return self.age(now) < self.max_age + self.stale_while_revalidate
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidation"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def json(self) -> Any:
+        """Decoded body, parsed once per entry; treat the result as read-only"""
+        if self._parsed is _MISSING:
+            self._parsed = json.loads(self.body) if self.body else None
+        return self._parsed
+
+
+class ResponseCache:
+    """Two-level response store: parsed entries in memory, compressed bodies on disk"""
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 256 * 1024 * 1024,
+                 memory_entries: int = 256, default_ttl: float = 300.0,
+                 stale_while_revalidate: float = 60.0, compression_level: int = 6):
+        self.directory = Path(directory or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.compression_level = compression_level
+        self.memory: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self.hits = self.misses = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(source: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        query = '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return hashlib.sha256(f"{source}|{url}?{query}".encode('utf-8')).hexdigest()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Store opened on first use so importing the pool never touches disk"""
+        if self._db is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.directory / 'responses.sqlite'), check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute("""CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT, stored_at REAL,
+                max_age REAL, stale_while_revalidate REAL, size INTEGER, last_access REAL, body BLOB)""")
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_access)')
+            self._db.commit()
+        return self._db
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        with self._lock:
+            row = self.db.execute(
+                'SELECT url, etag, last_modified, stored_at, max_age, stale_while_revalidate, body '
+                'FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.db.execute('UPDATE responses SET last_access = ? WHERE key = ?', (time.time(), key))
+            self.db.commit()
+
+        url, etag, last_modified, stored_at, max_age, swr, body = row
+        entry = CachedResponse(key=key, url=url, status=200, body=zlib.decompress(body), etag=etag,
+                               last_modified=last_modified, stored_at=stored_at, max_age=max_age,
+                               stale_while_revalidate=swr, from_cache=True)
+        self._remember(entry)
+        self.hits += 1
+        return entry
+
+    def put(self, entry: CachedResponse, body_changed: bool = True):
+        """Store a 200 response; body_changed=False only rewrites freshness (after a 304)"""
+        if not entry.storable:
+            return
+        self._remember(entry)
+        now = time.time()
+        with self._lock:
+            if body_changed:
+                body = zlib.compress(entry.body, self.compression_level)
+                self.db.execute(
+                    'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (entry.key, entry.url.split('?')[0], entry.etag, entry.last_modified, entry.stored_at,
+                     entry.max_age, entry.stale_while_revalidate, len(body), now, body))
+                self._evict()
+            else:
+                self.db.execute(
+                    'UPDATE responses SET etag = ?, last_modified = ?, stored_at = ?, max_age = ?, '
+                    'stale_while_revalidate = ?, last_access = ? WHERE key = ?',
+                    (entry.etag, entry.last_modified, entry.stored_at, entry.max_age,
+                     entry.stale_while_revalidate, now, entry.key))
+            self.db.commit()
+
+    def _remember(self, entry: CachedResponse):
+        self.memory[entry.key] = entry
+        self.memory.move_to_end(entry.key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def _evict(self):
+        """Drop least recently used bodies until the store fits in max_bytes"""
+        total = self.db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self.db.execute('SELECT key, size FROM responses ORDER BY last_access'):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self.db.executemany('DELETE FROM responses WHERE key = ?', evicted)
+        for (key,) in evicted:
+            self.memory.pop(key, None)
+        logger.info(f"Response cache evicted {len(evicted)} entries")
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return int(self.db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0])
+
+    def clear(self):
+        self.memory.clear()
+        with self._lock:
+            self.db.execute('DELETE FROM responses')
+            self.db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
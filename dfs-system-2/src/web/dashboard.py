@@ -24,7 +24,7 @@ app.mount("/static", StaticFiles(directory="src/web/static"), name="static")
 templates = Jinja2Templates(directory="src/web/templates")
 
 # Import advanced features
-from ..advanced_optimizer.contest_simulator import AdvancedContestSimulator
+from ..advanced_optimizer.contest_simulator import AdvancedContestSimulator, AdvancedOwnershipEngine, ContestType
 from ..advanced_optimizer.next_level_features import NextLevelDFSEngine
 from ..ai.advanced_curation import AIPickCurationEngine
 from ..ai.llm_integration import LLMIntegration
@@ -43,6 +43,14 @@ dashboard_state = {
     "exposures": {}
 }
 
+# Shared so ownership is computed once per slate snapshot, not per request
+ownership_engine = AdvancedOwnershipEngine()
+
+def projected_ownership(contest_type: ContestType = ContestType.GPP) -> Dict[str, float]:
+    """Field ownership for the loaded slate (players without a projection are skipped)"""
+    players = [p for p in dashboard_state["players"] if "projection" in p]
+    return ownership_engine.project_field_ownership(players, contest_type)
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard_home(request: Request):
     """Main dashboard page - similar to SaberSim/DFS Army interface"""
@@ -186,11 +194,14 @@ async def get_players(
         # Add mock projection data if not present
         if "projection" not in player:
             player["projection"] = round(np.random.uniform(8.0, 30.0), 1)
-        if "ownership" not in player:
-            player["ownership"] = round(np.random.uniform(2.0, 40.0), 1)
         if "value" not in player:
             player["value"] = round(player["projection"] / (player["salary"] / 1000), 2)
     
+    ownership = projected_ownership()
+    for player in players:
+        if "ownership" not in player:
+            player["ownership"] = ownership.get(player["name"], 15.0)
+    
     return JSONResponse(players)
 
 @app.post("/api/players/lock")
@@ -395,9 +406,12 @@ async def update_projections():
         # Mock projection update
         for player in dashboard_state["players"]:
             player["projection"] = round(np.random.uniform(8.0, 30.0), 1)
-            player["ownership"] = round(np.random.uniform(2.0, 40.0), 1)
             player["value"] = round(player["projection"] / (player["salary"] / 1000), 2)
         
+        ownership = projected_ownership()
+        for player in dashboard_state["players"]:
+            player["ownership"] = ownership.get(player["name"], 15.0)
+        
         return JSONResponse({
             "success": True,
             "message": "Projections updated",
@@ -489,9 +503,10 @@ async def auto_set_exposures():
         if not dashboard_state["players"]:
             return JSONResponse({"error": "No players loaded"})
 
+        projected = projected_ownership()
         for player in dashboard_state["players"]:
             value = player.get("value", 1.0)
-            ownership = player.get("ownership", 15.0)
+            ownership = player.get("ownership", projected.get(player["name"], 15.0))
             leverage_score = player.get("leverage", 1.0)
 
             # Auto-set exposure based on value, leverage, and ownership
@@ -526,11 +541,12 @@ async def get_advanced_player_metrics():
         # Initialize advanced features
         engine = NextLevelDFSEngine(dashboard_state["sport"])
         advanced_players = []
+        projected = projected_ownership()
 
         for player in dashboard_state["players"]:
             # Add advanced metrics
             base_projection = player.get("projection", 10.0)
-            ownership = player.get("ownership", 15.0)
+            ownership = player.get("ownership", projected.get(player["name"], 15.0))
             leverage = player.get("leverage", 2.0)
 
             # Calculate advanced metrics
@@ -786,7 +802,7 @@ async def get_advanced_lineup_analysis():
         # Portfolio analysis
         from ..advanced_optimizer.next_level_features import LineupSimilarityAnalyzer
         analyzer = LineupSimilarityAnalyzer()
-        portfolio_analysis = analyzer.analyze_portfolio_similarity(results)
+        portfolio_analysis = analyzer.analyze_portfolio_similarity(results, include_matrix=False, top_k=5)
 
         return JSONResponse({
             "lineups": results,
@@ -0,0 +1,62 @@
+"""Import dfs-optimizer service modules in tests.
+
+The services import their records from packages.shared.types, which only exists as
+TypeScript; a stand-in module hands out plain keyword-argument record classes instead.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+DFS_OPTIMIZER = Path(__file__).resolve().parents[1] / 'dfs-optimizer'
+PACKAGE = 'dfs_optimizer'
+
+
+class Record:
+    """Stand-in for a shared type: attributes from keyword arguments"""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.__dict__})"
+
+
+def _shared_types() -> types.ModuleType:
+    module = types.ModuleType(f"{PACKAGE}.packages.shared.types")
+    classes = {}
+
+    def record_class(name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if name not in classes:
+            classes[name] = type(name, (Record,), {})
+        return classes[name]
+
+    module.__getattr__ = record_class
+    return module
+
+
+def _install():
+    if PACKAGE in sys.modules:
+        return
+    for name, path in ((PACKAGE, DFS_OPTIMIZER),
+                       (f"{PACKAGE}.packages", DFS_OPTIMIZER / 'packages'),
+                       (f"{PACKAGE}.packages.shared", DFS_OPTIMIZER / 'packages' / 'shared')):
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
+    sys.modules[f"{PACKAGE}.packages.shared.types"] = _shared_types()
+
+
+def load_service(name: str) -> types.ModuleType:
+    """Service module by dotted path under services, e.g. 'ingest.player_index'"""
+    _install()
+    return importlib.import_module(f"{PACKAGE}.services.{name}")
+
+
+def shared_type(name: str) -> type:
+    """The record class the services received for a shared type"""
+    _install()
+    return getattr(sys.modules[f"{PACKAGE}.packages.shared.types"], name)
@@ -0,0 +1,79 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.ingest.base import BaseIngestor
+from src.ingest.columnar_cache import ColumnarCache
+
+
+def weekly_stats(n=5000, seed=2):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'player_id': [f"p{i % 400}" for i in range(n)],
+        'week': np.repeat(np.arange(1, 19), n // 18 + 1)[:n],
+        'position': rng.choice(['QB', 'RB', 'WR', 'TE'], n),
+        'fantasy_points': rng.gamma(2.0, 6.0, n).round(2),
+        'targets': rng.integers(0, 14, n),
+    })
+
+
+class StubIngestor(BaseIngestor):
+    def __init__(self, cache_dir):
+        super().__init__({'enabled': True, 'url': ''})
+        self.cache_dir = str(cache_dir)
+        self.cache = ColumnarCache(self.cache_dir)
+        self.calls = 0
+
+    def fetch_data(self):
+        return {}
+
+    def fetch_stats(self):
+        self.calls += 1
+        return weekly_stats()
+
+
+@pytest.mark.parametrize('fmt,memory_map', [('parquet', False), ('arrow', False), ('arrow', True)])
+def test_projection_and_filters_match_pandas(tmp_path, fmt, memory_map):
+    cache = ColumnarCache(str(tmp_path))
+    frame = weekly_stats()
+    cache.write('weekly', frame, ttl_hours=1, format=fmt)
+
+    loaded = cache.read('weekly', columns=['player_id', 'fantasy_points', 'week'],
+                        filters=[('week', '>=', 10), ('position', 'in', ['QB', 'WR'])], memory_map=memory_map)
+    expected = frame[(frame.week >= 10) & frame.position.isin(['QB', 'WR'])][['player_id', 'fantasy_points', 'week']]
+    pd.testing.assert_frame_equal(loaded.reset_index(drop=True), expected.reset_index(drop=True))
+    pd.testing.assert_frame_equal(cache.read('weekly', memory_map=memory_map), frame)
+
+
+def test_manifest_ttl_and_legacy_names(tmp_path):
+    cache = ColumnarCache(str(tmp_path))
+    cache.write('players.json', weekly_stats(50), ttl_hours=1)
+    manifest = cache.manifest('players')
+    assert manifest['file'] == 'players.parquet' and manifest['rows'] == 50
+    assert cache.is_valid('players.json')
+
+    manifest['timestamp'] = '2000-01-01T00:00:00'
+    with open(tmp_path / 'players.manifest.json', 'w') as f:
+        json.dump(manifest, f)
+    assert cache.read('players') is None
+    assert len(cache.read('players', ignore_ttl=True)) == 50
+
+
+def test_mixed_object_columns_are_stored_as_strings(tmp_path):
+    cache = ColumnarCache(str(tmp_path))
+    frame = pd.DataFrame({'name': ['A', 'B', 'C'], 'note': [1, 'questionable', None]})
+    cache.write('scraped', frame)
+    note = cache.read('scraped')['note']
+    assert note[:2].tolist() == ['1', 'questionable'] and pd.isna(note[2])
+
+
+def test_cached_fetch_hits_source_once(tmp_path):
+    ingestor = StubIngestor(tmp_path)
+    first = ingestor.cached_fetch('stats_2025', ingestor.fetch_stats, columns=['player_id', 'targets'],
+                                  filters=[('targets', '>', 10)])
+    second = ingestor.cached_fetch('stats_2025', ingestor.fetch_stats, columns=['player_id', 'targets'],
+                                   filters=[('targets', '>', 10)])
+    assert ingestor.calls == 1
+    assert list(first.columns) == ['player_id', 'targets'] and (first.targets > 10).all()
+    pd.testing.assert_frame_equal(first, second)
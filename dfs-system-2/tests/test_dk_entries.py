@@ -0,0 +1,45 @@
+import csv
+
+from src.io.dk_entries import DKEntriesParser
+
+SLOTS = ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "FLEX", "DST"]
+POOL_HEADER = ["Position", "Name + ID", "Name", "ID", "Roster Position", "Salary", "Game Info", "TeamAbbrev",
+               "AvgPointsPerGame"]
+
+
+def write_entries(path, n_entries=3000):
+    pool = [["QB", "Josh Allen (101)", "Josh Allen", "101", "QB", "7100", "MIA@BUF 09/14/2025 01:00PM ET", "BUF", "25.5"],
+            ["WR", "Injured Guy (102)", "Injured Guy", "102", "WR/FLEX", "5000", "PHI@KC 09/14/2025 04:25PM ET", "KC", "0"]]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Entry ID", "Contest Name", "Contest ID", "Entry Fee"] + SLOTS + ["", "Instructions"])
+        for k in range(n_entries):
+            slots = [f"P{j} ({200 + j})" for j in range(9)]
+            slots[0] = "Josh Allen (101) (LOCKED)"
+            right = [""] * 2 + (POOL_HEADER if k == 1 else pool[k - 2] if 2 <= k < 4 else [])
+            writer.writerow([str(5000 + k), "NFL GPP", "999", "$5"] + slots + right)
+
+
+def test_single_pass_parse(tmp_path):
+    path = tmp_path / "DKEntries.csv"
+    write_entries(path)
+
+    parsed = DKEntriesParser().parse(str(path))
+
+    assert parsed.entries.slot_names == SLOTS
+    assert len(parsed.entries) == 3000
+    assert parsed.entries.slot_ids.shape == (3000, 9)
+    assert parsed.entries.slot_ids[0, 0] == 101 and parsed.entries.slot_ids[0, 8] == 208
+    assert parsed.entries.locked[:, 0].all() and not parsed.entries.locked[:, 1:].any()
+
+    pool = parsed.pool
+    assert pool.ids.tolist() == [101, 102]
+    assert pool.salaries.tolist() == [7100, 5000]
+    assert pool.active.tolist() == [True, False]
+    assert pool.game_ids == ["MIA@BUF", "PHI@KC"]
+
+
+def test_parse_slot_variants():
+    assert DKEntriesParser.parse_slot("Josh Allen (101) (LOCKED)") == (101, True)
+    assert DKEntriesParser.parse_slot("A.J. Brown (39971) ") == (39971, False)
+    assert DKEntriesParser.parse_slot("") == (0, False)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from src.ai.feature_store import FeatureStore, rolling_features, weekly_usage
+from src.ai.projection_engine import AIProjectionEngine
+from src.data.schemas import SportType
+
+RECEIVERS = {'KC': ['kc_wr1', 'kc_wr2', 'kc_te'], 'BUF': ['buf_wr1', 'buf_wr2', 'buf_te']}
+
+
+def synthetic_pbp(weeks=range(1, 7), plays_per_team=60, seed=4):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for week in weeks:
+        for team, receivers in RECEIVERS.items():
+            for _ in range(plays_per_team):
+                is_pass = rng.random() < 0.6
+                # buf_wr2 is on bye in week 4
+                targets = [r for r in receivers if not (week == 4 and r == 'buf_wr2')]
+                rows.append({
+                    'season': 2025, 'week': week, 'posteam': team,
+                    'play_type': 'pass' if is_pass else 'run',
+                    'pass_attempt': float(is_pass),
+                    'complete_pass': float(is_pass and rng.random() < 0.65),
+                    'passer_player_id': f"{team.lower()}_qb" if is_pass else None,
+                    'receiver_player_id': rng.choice(targets) if is_pass else None,
+                    'rusher_player_id': None if is_pass else f"{team.lower()}_rb",
+                    'air_yards': float(rng.integers(-2, 30)) if is_pass else np.nan,
+                    'passing_yards': float(rng.integers(0, 35)) if is_pass else np.nan,
+                    'yardline_100': float(rng.integers(1, 99)),
+                    'epa': float(rng.normal(0, 1)),
+                })
+    return pd.DataFrame(rows)
+
+
+def test_rolling_shares_match_direct_computation():
+    pbp = synthetic_pbp()
+    features = rolling_features(weekly_usage(pbp), windows=(3,))
+    row = features[(features.player_id == 'kc_wr1') & (features.week == 5)].iloc[0]
+
+    window = pbp[(pbp.week >= 3) & (pbp.week <= 5) & (pbp.posteam == 'KC')]
+    targets = window.receiver_player_id.eq('kc_wr1')
+    assert np.isclose(row['target_share_l3'], targets.sum() / window.receiver_player_id.notna().sum())
+    assert np.isclose(row['air_yards_l3'], window.loc[targets, 'air_yards'].sum() / 3)
+    red_zone = window.yardline_100 <= 20
+    assert np.isclose(row['red_zone_share_l3'], (targets & red_zone).sum() / red_zone.sum())
+
+    qb = features[(features.player_id == 'kc_qb') & (features.week == 5)].iloc[0]
+    passes = window[window.passer_player_id == 'kc_qb']
+    assert np.isclose(qb['completion_rate_l3'], passes.complete_pass.sum() / passes.pass_attempt.sum())
+    assert np.isclose(qb['yards_per_attempt_l3'], passes.passing_yards.sum() / passes.pass_attempt.sum())
+
+
+def test_lookup_returns_latest_row_entering_week(tmp_path):
+    store = FeatureStore(tmp_path)
+    assert store.materialize(synthetic_pbp(weeks=range(1, 5))) == {2025: [1, 2, 3, 4]}
+    # Only the still-open week 4 and the new weeks are rewritten
+    assert store.materialize(synthetic_pbp()) == {2025: [4, 5, 6]}
+
+    rows = store.lookup(['kc_wr1', 'buf_wr2', 'nobody'], season=2025, week=5).set_index('player_id')
+    assert rows.loc['kc_wr1', 'week'] == 4
+    assert rows.loc['buf_wr2', 'week'] == 3  # bye in week 4
+    assert 'nobody' not in rows.index
+
+
+def test_projection_engine_reads_stored_features(tmp_path):
+    store = FeatureStore(tmp_path)
+    store.materialize(synthetic_pbp())
+    engine = AIProjectionEngine(SportType.NFL, feature_store=store)
+    players = pd.DataFrame({'player_id': ['kc_wr1', 'buf_te'], 'salary': [7000, 4500], 'week': [6, 6]})
+
+    features = engine.create_features(players, {})
+    expected = store.lookup(['kc_wr1', 'buf_te'], 2025, 6).set_index('player_id')
+    assert features['target_share'].tolist() == expected.loc[['kc_wr1', 'buf_te'], 'target_share_l5'].tolist()
+    assert features['red_zone_share'].tolist() == expected.loc[['kc_wr1', 'buf_te'], 'red_zone_share_l5'].tolist()
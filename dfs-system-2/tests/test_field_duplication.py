@@ -0,0 +1,108 @@
+import numpy as np
+from service_modules import load_service, shared_type
+from src.advanced_optimizer.next_level_features import FieldDuplicationDetector, FieldOwnershipEquilibrium
+
+
+def make_players():
+    counts = {"QB": 12, "RB": 24, "WR": 36, "TE": 12, "DST": 10}
+    players = []
+    for pos, count in counts.items():
+        for i in range(count):
+            players.append({"name": f"{pos} {i}", "position": pos, "salary": 3000 + 400 * (i % 10)})
+    return players
+
+
+def test_field_lineups_are_valid_rosters():
+    players = make_players()
+    detector = FieldDuplicationDetector()
+    field = detector.simulate_field_lineups(players, {}, field_size=2000, seed=7)
+
+    assert field.shape == (2000, 9)
+    positions = np.array([p["position"] for p in players])
+    salaries = np.array([p["salary"] for p in players])
+    assert (salaries[field].sum(axis=1) <= 50000).all()
+    assert all(len(set(row)) == 9 for row in field)
+    assert ((positions[field] == "QB").sum(axis=1) == 1).all()
+    assert ((positions[field] == "DST").sum(axis=1) == 1).all()
+
+
+def test_uniqueness_matches_brute_force():
+    players = make_players()
+    ownership = {"QB 0": 60.0, "RB 0": 50.0, "RB 1": 45.0, "WR 0": 40.0, "TE 0": 50.0, "DST 0": 40.0}
+    detector = FieldDuplicationDetector()
+    detector.simulate_field_lineups(players, ownership, field_size=3000, seed=1)
+
+    chalk = [detector.field_players[i] for i in detector.field_matrix[0]]
+    result = detector.calculate_lineup_uniqueness([{"name": name} for name in chalk])
+
+    user = set(chalk)
+    field_sets = [set(row) for row in detector.field_lineup_database]
+    exact = sum(s == user for s in field_sets)
+    similar = sum(len(user & s) / len(user | s) >= 0.8 for s in field_sets)
+    assert result["field_duplicate_rate"] == exact / 3000
+    assert result["similar_lineups_count"] == similar
+    assert exact >= 1
+
+
+def test_portfolio_against_large_field_matches_pairwise_reference():
+    players = make_players()
+    detector = FieldDuplicationDetector()
+    field = detector.simulate_field_lineups(players, {}, field_size=100000, seed=3)
+
+    # Field lineups, plus copies with one player changed so some have no exact match
+    rows = [row for row in field[:150]] + [np.append(row[:8], (row[8] + 1) % len(players)) for row in field[:30]]
+    lineups = [{"id": f"l{i}", "players": [{"name": detector.field_players[j]} for j in row]}
+               for i, row in enumerate(rows)]
+    results = detector.calculate_portfolio_uniqueness(lineups)
+
+    assert len(results) == len(rows)
+    for i, row in enumerate(rows):
+        # Pairwise reference: compare the lineup with every field lineup
+        overlap = np.isin(field, row).sum(axis=1)
+        exact = int(np.count_nonzero((overlap == 9) & (len(set(row)) == 9)))
+        similar = int(np.count_nonzero(overlap >= 0.8 * (len(set(row)) + 9 - overlap)))
+        result = results[f"l{i}"]
+        assert result["field_duplicate_rate"] == exact / len(field)
+        assert result["similar_lineups_count"] == similar
+        assert (exact > 0) == (i < 150)
+
+
+def test_equilibrium_field_reproduces_target_ownership():
+    players = make_players()
+    target = {p["name"]: 8.0 for p in players}
+    target.update({"QB 0": 30.0, "QB 1": 15.0, "RB 0": 40.0, "RB 1": 25.0, "WR 0": 35.0, "TE 0": 30.0, "DST 0": 25.0})
+    solver = FieldOwnershipEquilibrium(lineups_per_round=10000)
+
+    result = solver.solve(players, target, seed=3)
+
+    assert result.converged and result.rounds <= solver.max_rounds
+    for name in ["QB 0", "QB 1", "RB 0", "RB 1", "WR 0", "TE 0", "DST 0"]:
+        assert abs(result.realized_ownership[name] - result.target_ownership[name]) < 2.0
+
+    # Naive weights under-shoot the chalk; the fitted weights hit it in a fresh field
+    detector = FieldDuplicationDetector()
+    field = detector.simulate_field_lineups(players, result.selection_weights, field_size=10000, seed=4)
+    qb0 = detector.field_players.index("QB 0")
+    assert abs(np.mean((field == qb0).any(axis=1)) * 100 - result.target_ownership["QB 0"]) < 2.0
+
+
+def test_contest_sims_field_plays_equilibrium_ownership():
+    players = make_players()
+    chalk = {"QB 0": 0.45, "RB 0": 0.5, "WR 0": 0.4}
+    Player = shared_type("Player")
+    pool = [Player(playerId=p["name"], name=p["name"], team=f"T{i % 10}", opp=None, pos=[p["position"]],
+                   salary=p["salary"], projection=10.0, ownership=chalk.get(p["name"]), status="ACTIVE")
+            for i, p in enumerate(players)]
+    simulator = load_service("sim.model").MonteCarloSimulator(
+        pool, enhancements={"ownership_equilibrium": FieldOwnershipEquilibrium(lineups_per_round=5000)})
+
+    # Fitted to a cap-legal field: each position's ownership adds up to the slots it fills
+    ownership = simulator.ownership_data
+    by_position = {}
+    for p in players:
+        by_position[p["position"]] = by_position.get(p["position"], 0.0) + ownership[p["name"]]
+    assert abs(by_position["QB"] - 1.0) < 0.02 and abs(by_position["DST"] - 1.0) < 0.02
+    assert abs(by_position["RB"] + by_position["WR"] + by_position["TE"] - 7.0) < 0.05
+    # Projected 45% vs 15% keeps its shape within the QBs
+    assert ownership["QB 0"] > 2 * ownership["QB 1"]
+    assert simulator.field_model.ownership_data is ownership
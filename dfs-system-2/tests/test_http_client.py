@@ -0,0 +1,146 @@
+import asyncio
+import time
+
+from aiohttp import web
+from service_modules import load_service
+from src.utils.http_client import HttpClientPool, RetryPolicy, TokenBucket, get_http_pool
+
+
+async def start_server(handler):
+    app = web.Application()
+    app.router.add_get('/data', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/data"
+
+
+def test_token_bucket_spaces_concurrent_callers():
+    async def run():
+        bucket = TokenBucket(rate=20.0, capacity=1.0)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        return time.monotonic() - start
+
+    # First token is free, the next four wait 1/20s each
+    assert 0.18 <= asyncio.run(run()) < 1.0
+
+
+def test_fetch_json_retries_then_succeeds():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.headers.get('X-Api-Key'))
+        if len(calls) < 3:
+            return web.Response(status=503 if len(calls) == 1 else 429, headers={'Retry-After': '0'})
+        return web.json_response({'ok': True})
+
+    async def run():
+        runner, url = await start_server(handler)
+        pool = HttpClientPool()
+        pool.register_source('test', rate_per_second=1000.0, burst=10,
+                             retry=RetryPolicy(retries=3, backoff_base=0.0), headers={'X-Api-Key': 'k'})
+        try:
+            return await pool.fetch_json('test', url)
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == {'ok': True}
+    assert calls == ['k', 'k', 'k']
+
+
+def test_backoff_releases_the_connection():
+    attempts = {}
+
+    async def handler(request):
+        name = request.query['name']
+        attempts[name] = attempts.get(name, 0) + 1
+        if name == 'busy' and attempts[name] == 1:
+            # Body still streaming, so the connection stays checked out until the response is released
+            response = web.StreamResponse(status=503, headers={'Retry-After': '0.5'})
+            await response.prepare(request)
+            await response.write(b'overloaded')
+            await asyncio.sleep(1)
+            return response
+        return web.json_response({'name': name})
+
+    async def run():
+        runner, url = await start_server(handler)
+        # One connection in total: a retry sleeping on it would block every other request
+        pool = HttpClientPool(limit=1)
+        pool.register_source('test', rate_per_second=1000.0, burst=10, retry=RetryPolicy(retries=2))
+        try:
+            busy = asyncio.ensure_future(pool.fetch_json('test', f"{url}?name=busy"))
+            await asyncio.sleep(0.1)
+            start = time.monotonic()
+            free = await pool.fetch_json('test', f"{url}?name=free")
+            return free, time.monotonic() - start, await busy
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    free, elapsed, busy = asyncio.run(run())
+    assert free == {'name': 'free'} and elapsed < 0.3
+    assert busy == {'name': 'busy'} and attempts['busy'] == 2
+
+
+def test_malformed_json_returns_none():
+    async def handler(request):
+        return web.Response(text='<html>maintenance</html>')
+
+    async def run():
+        runner, url = await start_server(handler)
+        pool = HttpClientPool()
+        try:
+            return await pool.fetch_json('test', url)
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    assert asyncio.run(run()) is None
+
+
+def test_sources_share_one_session_per_loop():
+    async def handler(request):
+        return web.json_response({'source': request.query.get('s')})
+
+    async def run():
+        runner, url = await start_server(handler)
+        pool = HttpClientPool()
+        try:
+            results = await asyncio.gather(*(pool.fetch_json(f"src{i}", f"{url}?s={i}") for i in range(4)))
+            first = await pool.session()
+            assert first is await pool.session()
+            assert len(pool._sessions) == 1
+            return results
+        finally:
+            await pool.close()
+            await runner.cleanup()
+
+    assert [r['source'] for r in asyncio.run(run())] == ['0', '1', '2', '3']
+
+
+def test_services_share_the_pool():
+    assert load_service('ingest.http_client').get_http_pool is get_http_pool
+
+
+def test_reregistering_a_source_merges_settings():
+    pool = HttpClientPool()
+    adapter = pool.register_source('draftkings', rate_per_second=0.5, burst=1, retry=RetryPolicy(retries=5),
+                                   headers={'User-Agent': 'dfs', 'Authorization': 'key'}, timeout=10)
+    adapter.bucket.tokens = 0.0
+    # A second caller with no headers and a looser rate keeps what the first one set up
+    settings = pool.register_source('draftkings', rate_per_second=2.0, burst=5)
+
+    assert settings is adapter and pool.sources['draftkings'] is adapter
+    assert settings.headers == {'User-Agent': 'dfs', 'Authorization': 'key'}
+    assert settings.bucket.rate == 0.5 and settings.bucket.capacity == 1 and settings.bucket.tokens == 0.0
+    assert settings.retry.retries == 5 and settings.timeout.total == 10
+
+    # A stricter rate and extra headers still apply
+    pool.register_source('draftkings', rate_per_second=0.25, headers={'Accept': 'application/json'})
+    assert settings.bucket.rate == 0.25
+    assert settings.headers == {'User-Agent': 'dfs', 'Authorization': 'key', 'Accept': 'application/json'}
@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+from src.optimize.late_swap import LateSwapEntry, LateSwapOptimizer, SwapPlayer, load_dk_entries
+
+RULES = json.loads((Path(__file__).resolve().parents[1] / "src" / "config" / "rules" / "dk_nfl.json").read_text())
+
+
+def make_pool():
+    counts = {"QB": 4, "RB": 8, "WR": 10, "TE": 4, "DST": 4}
+    pool = []
+    for pos, count in counts.items():
+        for i in range(count):
+            pool.append(SwapPlayer(
+                player_id=f"{pos}{i}",
+                name=f"{pos} Player {i}",
+                position=pos,
+                salary=4000 + 300 * i,
+                projection=10.0 + 2 * i,
+                game_id="EARLY" if i % 2 == 0 else "LATE",
+            ))
+    return pool
+
+
+def make_entries(n, contest_ids):
+    base = ["QB0", "RB0", "RB2", "WR0", "WR2", "WR4", "TE0", "RB4", "DST0"]
+    return [LateSwapEntry(entry_id=str(1000 + k), contest_id=contest_ids[k % len(contest_ids)],
+                          player_ids=list(base), locked_slots={0, 1, 3})
+            for k in range(n)]
+
+
+def test_locked_slots_fixed_and_no_duplicates():
+    pool = make_pool()
+    optimizer = LateSwapOptimizer.from_rules(pool, RULES, max_exposure=0.5)
+    entries = make_entries(12, ["A", "B"])
+    early = {p.player_id for p in pool if p.game_id == "EARLY"}
+
+    results = optimizer.optimize_entries(entries, locked_player_ids=early, max_workers=2)
+
+    assert [r.entry_id for r in results] == [e.entry_id for e in entries]
+    for entry, result in zip(entries, results):
+        assert result.total_salary <= 50000
+        for slot in entry.locked_slots:
+            assert result.player_ids[slot] == entry.player_ids[slot]
+        for slot in result.swapped_slots:
+            assert result.player_ids[slot] not in early
+    for contest in ("A", "B"):
+        lineups = [frozenset(r.player_ids) for r in results if r.contest_id == contest]
+        assert len(set(lineups)) == len(lineups)
+
+    # Unlocked players never exceed 50% of the 12 entries
+    usage = {}
+    for entry, result in zip(entries, results):
+        for slot, pid in enumerate(result.player_ids):
+            if slot not in entry.locked_slots:
+                usage[pid] = usage.get(pid, 0) + 1
+    assert max(usage.values()) <= 6
+
+
+def test_load_dk_entries(tmp_path):
+    header = ["Entry ID", "Contest Name", "Contest ID", "Entry Fee", "QB", "RB", "RB", "WR", "WR", "WR",
+              "TE", "FLEX", "DST", "", "Instructions", "Position", "Name + ID", "Name", "ID",
+              "Roster Position", "Salary", "Game Info", "TeamAbbrev", "AvgPointsPerGame"]
+    entry = ["111", "NFL GPP", "999", "$5", "Josh Allen (1) (LOCKED)", "A (2)", "B (3)", "C (4)", "D (5)",
+             "E (6)", "F (7)", "G (8)", "Bills (9)", "", ""]
+    pool_row = [""] * 15 + ["QB", "Josh Allen (1)", "Josh Allen", "1", "QB", "7100", "MIA@BUF 09/14/2025 01:00PM ET",
+                            "BUF", "25.5"]
+    path = tmp_path / "DKEntries.csv"
+    path.write_text("\n".join(",".join(row) for row in [header, entry + pool_row[15:], pool_row]) + "\n")
+
+    entries, pool = load_dk_entries(str(path))
+
+    assert len(entries) == 1
+    assert entries[0].player_ids[0] == "1" and entries[0].locked_slots == {0}
+    assert pool[0].salary == 7100 and pool[0].game_id == "MIA@BUF" and pool[0].active
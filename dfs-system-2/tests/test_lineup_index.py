@@ -0,0 +1,38 @@
+from service_modules import load_service
+from src.optimize.lineup_index import LineupIndex, MinHashLineupIndex
+
+PLAYER_IDS = [f"p{i}" for i in range(150)]
+
+
+def test_max_overlap_and_duplicates():
+    index = LineupIndex(PLAYER_IDS)
+    index.add(["p0", "p1", "p2", "p3", "p100"])
+    index.add(["p10", "p11", "p12", "p70", "p149"])
+
+    assert index.max_overlap(["p0", "p1", "p2", "p70", "p149"]) == 3
+    assert index.contains(["p149", "p70", "p12", "p11", "p10"])
+    assert not index.contains(["p0", "p1", "p2", "p3", "p4"])
+    assert index.is_too_similar(["p0", "p1", "p2", "p3", "p4"], max_overlap=3)
+
+
+def test_index_grows_past_capacity():
+    index = LineupIndex(PLAYER_IDS, capacity=2)
+    for i in range(10):
+        index.add([f"p{i}", f"p{i + 50}", f"p{i + 100}"])
+
+    assert len(index) == 10
+    assert list(index.member_indices(7)) == [7, 57, 107]
+    assert index.exposure_counts()[:12].tolist() == [1] * 10 + [0, 0]
+
+
+def test_minhash_index_finds_near_duplicates():
+    index = MinHashLineupIndex(num_perm=64, bands=32)
+    lineup = [f"p{i}" for i in range(9)]
+    index.add(lineup)
+
+    assert index.contains(lineup)
+    assert index.max_overlap(lineup[:8] + ["p120"]) == 8
+
+
+def test_services_share_the_implementation():
+    assert load_service('sim.lineup_index').LineupIndex is LineupIndex
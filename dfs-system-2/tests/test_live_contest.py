@@ -0,0 +1,220 @@
+import json
+import random
+from functools import lru_cache
+from itertools import permutations, product
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from service_modules import load_service
+from src.optimize.slot_assignment import SlotAssigner
+
+live_contest = load_service('sim.live_contest')
+LateSwapEvaluator, LiveContestSimulator = live_contest.LateSwapEvaluator, live_contest.LiveContestSimulator
+
+RULES = json.loads((Path(__file__).resolve().parents[1] / "src" / "config" / "rules" / "dk_nfl.json").read_text())
+
+GAMES = [('AAA', 'BBB'), ('CCC', 'DDD'), ('EEE', 'FFF')]
+POSITIONS = ['QB', 'RB', 'WR', 'WR', 'TE', 'DST']
+
+
+def make_player(player_id, team, opp, pos, projection, salary):
+    return SimpleNamespace(playerId=player_id, team=team, opp=opp, pos=[pos], projection=projection,
+                           salary=salary, status='ACTIVE', stdev=None, floor=None, ceiling=None)
+
+
+def make_slate(seed=5, n_entries=4, n_field=60):
+    rng = random.Random(seed)
+    players = [make_player(f"{team}_{pos}{k}", team, opp, pos, rng.uniform(5, 25), rng.randrange(3000, 9000, 100))
+               for home, away in GAMES for team, opp in ((home, away), (away, home))
+               for k, pos in enumerate(POSITIONS)]
+    ids = [p.playerId for p in players]
+    entries = {f"e{k}": rng.sample(ids, 8) for k in range(n_entries)}
+    field = [rng.sample(ids, 8) for _ in range(n_field)]
+    contest = SimpleNamespace(entries=500, entryFee=20.0,
+                              payoutCurve=[SimpleNamespace(place=1, pct=0.2), SimpleNamespace(place=10, pct=0.03),
+                                           SimpleNamespace(place=100, pct=0.005)])
+    return players, entries, field, contest
+
+
+def simulator(seed, **kwargs):
+    players, entries, field, contest = make_slate()
+    # Teammates move together
+    same_team = lambda group: np.array([[0.3 if a.team == b.team else 0.0 for b in group] for a in group])
+    return LiveContestSimulator(players, contest, entries, field, n_simulations=300, seed=seed,
+                                correlation=same_team, **kwargs)
+
+
+def box_score(sim, game, scale):
+    cols = sim.game_columns[game]
+    # Distinct values, so lineup scores do not tie
+    return {sim.players[c].playerId: scale * (1 + 0.713 * c + 0.0137 * c * c) for c in cols}
+
+
+def test_game_updates_match_full_rescore():
+    sim = simulator(seed=1)
+    game_ids = list(sim.game_columns)
+    sim.update_game(game_ids[0], box_score(sim, game_ids[0], 1.0), fraction_remaining=0.6)
+    sim.update_game(game_ids[1], box_score(sim, game_ids[1], 2.0), fraction_remaining=0.0)
+    sim.update_game(game_ids[0], box_score(sim, game_ids[0], 1.5), fraction_remaining=0.2,
+                    team_factors={'AAA': 1.3})
+
+    # Block-delta scores equal scoring every lineup from the current outcome matrix
+    full = np.asarray(sim.lineups @ sim.outcomes.T)
+    assert np.allclose(sim.scores, full, atol=1e-3)
+    final_cols = sim.game_columns[game_ids[1]]
+    assert np.allclose(sim.outcomes[:, final_cols], sim.actual_points[final_cols])
+    assert sim.remaining_games == [game_ids[0], game_ids[2]]
+
+
+def test_finished_slate_matches_a_fresh_simulation():
+    updated = simulator(seed=1)
+    fresh = simulator(seed=99)
+    for sim in (updated, fresh):
+        if sim is updated:
+            # Partial updates first: the final state must not depend on the path taken
+            for game in sim.game_columns:
+                sim.update_game(game, box_score(sim, game, 0.5), fraction_remaining=0.5)
+        for game in reversed(list(sim.game_columns)):
+            sim.update_game(game, box_score(sim, game, 1.0), fraction_remaining=0.0)
+
+    assert np.allclose(updated.scores, fresh.scores, atol=1e-3)
+    assert np.array_equal(updated.finish_distribution(), fresh.finish_distribution())
+    assert updated.results()['e0'] == fresh.results()['e0']
+
+
+def test_finish_distribution_matches_brute_force_ranking():
+    sim = simulator(seed=3)
+    game = next(iter(sim.game_columns))
+    sim.update_game(game, box_score(sim, game, 1.0), fraction_remaining=0.5)
+
+    places = sim.finish_distribution()
+    entry_scores, field_scores = sim.scores[:sim.n_entries], sim.scores[sim.n_entries:]
+    for row in range(sim.n_entries):
+        for s in range(0, sim.n_simulations, 37):
+            score = entry_scores[row, s]
+            expected = 1 + np.sum(entry_scores[:, s] > score) + np.sum(field_scores[:, s] > score) * sim.field_scale
+            assert places[row, s] == expected
+
+
+def nfl_contest(seed=11, n_entries=5, n_field=80):
+    """DK NFL slate: every team has QB, 3 RB, 4 WR, 2 TE and a DST; lineups fill the real roster"""
+    rng = random.Random(seed)
+    depth = {'QB': 1, 'RB': 3, 'WR': 4, 'TE': 2, 'DST': 1}
+    players = [make_player(f"{team}_{pos}{k}", team, opp, pos, rng.uniform(4, 24), rng.randrange(3000, 8000, 100))
+               for home, away in GAMES for team, opp in ((home, away), (away, home))
+               for pos, count in depth.items() for k in range(count)]
+    by_pos = {pos: [p.playerId for p in players if p.pos[0] == pos] for pos in depth}
+
+    def lineup():
+        flex_pos = rng.choice(['RB', 'WR', 'TE'])
+        counts = {'QB': 1, 'RB': 2, 'WR': 3, 'TE': 1, 'DST': 1}
+        counts[flex_pos] += 1
+        return [pid for pos, count in counts.items() for pid in rng.sample(by_pos[pos], count)]
+
+    entries = {f"e{k}": lineup() for k in range(n_entries)}
+    contest = SimpleNamespace(entries=800, entryFee=10.0,
+                              payoutCurve=[SimpleNamespace(place=1, pct=0.15), SimpleNamespace(place=20, pct=0.01),
+                                           SimpleNamespace(place=200, pct=0.002)])
+    sim = LiveContestSimulator(players, contest, entries, [lineup() for _ in range(n_field)],
+                               n_simulations=400, seed=seed)
+    first_game = next(iter(sim.game_columns))
+    sim.update_game(first_game, box_score(sim, first_game, 1.0), fraction_remaining=0.5)
+    return sim
+
+
+def brute_force_payout(sim, row, player_ids):
+    """Mean payout of entry `row` playing player_ids, ranked against every other lineup from scratch"""
+    cols = [sim.player_index[pid] for pid in player_ids]
+    score = sim.outcomes[:, cols].sum(axis=1)
+    others = np.asarray(sim.lineups @ sim.outcomes.T)
+    own = np.delete(others[:sim.n_entries], row, axis=0)
+    field = others[sim.n_entries:]
+    places = 1 + (own > score).sum(axis=0) + (field > score).sum(axis=0) * sim.field_scale
+    return sim.payouts[np.minimum(places.astype(np.int64) - 1, len(sim.payouts) - 1)].mean()
+
+
+def test_swap_values_match_brute_force_rescoring():
+    sim = nfl_contest()
+    evaluator = LateSwapEvaluator(sim, slot_assigner=SlotAssigner.from_rules(RULES))
+    rng = random.Random(4)
+    swaps = rng.sample(evaluator.candidate_swaps(), 40)
+
+    entries = dict(zip(sim.entry_ids, (sim.lineups[row].indices.tolist() for row in range(sim.n_entries))))
+    for evaluation in evaluator.evaluate(swaps):
+        row = sim.entry_ids.index(evaluation.entry_id)
+        before = [sim.players[c].playerId for c in entries[evaluation.entry_id]]
+        after = [evaluation.in_player_id if pid == evaluation.out_player_id else pid for pid in before]
+        expected = brute_force_payout(sim, row, after) - brute_force_payout(sim, row, before)
+        assert abs(evaluation.expected_payout_diff - expected) < 0.011
+
+
+def test_flex_swaps_cross_positions_only_around_locked_slots():
+    sim = nfl_contest()
+    assigner = SlotAssigner.from_rules(RULES)
+    started = {int(c) for game, cols in sim.game_columns.items() if sim.fraction_remaining[game] < 1.0 for c in cols}
+    position = {p.playerId: p.pos[0] for p in sim.players}
+    # e0 plays three RBs: one already started, one locked here, one still open
+    lineup = [sim.players[c].playerId for c in sim.lineups[0].indices]
+    started_rb, locked_rb, open_rb = sorted((pid for pid in lineup if position[pid] == 'RB'),
+                                            key=lambda pid: sim.player_index[pid] not in started)
+    assert sim.player_index[started_rb] in started and sim.player_index[open_rb] not in started
+    locked = {locked_rb}
+
+    def swaps_out_of_open_rb(flex_player):
+        slots = {pid: position[pid] for pid in lineup}
+        slots[flex_player] = 'FLEX'
+        evaluator = LateSwapEvaluator(sim, slot_assigner=assigner, entry_slots={'e0': slots})
+        return {inn for entry_id, out, inn in evaluator.candidate_swaps(locked) if (entry_id, out) == ('e0', open_rb)}
+
+    # The started RB sits in FLEX, so the open RB's slot takes only another RB
+    in_rb_slot = swaps_out_of_open_rb(started_rb)
+    assert in_rb_slot and {position[pid] for pid in in_rb_slot} == {'RB'}
+    # Same players with the open RB in FLEX: WRs and TEs can come in
+    in_flex = swaps_out_of_open_rb(open_rb)
+    assert in_rb_slot < in_flex and {position[pid] for pid in in_flex} == {'RB', 'WR', 'TE'}
+
+
+def test_candidate_swaps_match_brute_force_with_pinned_slots():
+    sim = nfl_contest()
+    assigner = SlotAssigner.from_rules(RULES)
+    locked = {sim.players[0].playerId}
+    started = {int(c) for game, cols in sim.game_columns.items() if sim.fraction_remaining[game] < 1.0 for c in cols}
+    # Entries were submitted with the later games in FLEX
+    entry_slots = {}
+    for row, entry_id in enumerate(sim.entry_ids):
+        lineup = sim.lineups[row].indices.tolist()
+        slots = assigner.assign([sim.players[c].pos[0] for c in lineup], [int(c not in started) for c in lineup])
+        entry_slots[entry_id] = {sim.players[c].playerId: slot for c, slot in zip(lineup, slots)}
+    swaps = set(LateSwapEvaluator(sim, slot_assigner=assigner, entry_slots=entry_slots).candidate_swaps(locked))
+
+    @lru_cache(maxsize=None)
+    def fills(open_positions, open_slots):
+        # Every ordering of the open slots over the unlocked players
+        return any(all(pos in RULES['positions'][slot]['eligible_positions'] for pos, slot in zip(open_positions, order))
+                   for order in permutations(open_slots))
+
+    # Brute force: locked and started players stay in their slots, everyone else is re-seated
+    salaries = np.array([p.salary for p in sim.players])
+    expected = set()
+    for row, entry_id in enumerate(sim.entry_ids):
+        lineup = sim.lineups[row].indices.tolist()
+        frozen = {c for c in lineup if c in started or sim.players[c].playerId in locked}
+        for out_col, in_col in product(lineup, range(len(sim.players))):
+            new_lineup = [in_col if c == out_col else c for c in lineup]
+            if (out_col in frozen or in_col in started or in_col in lineup
+                    or sim.players[in_col].playerId in locked
+                    or salaries[new_lineup].sum() > 50000):
+                continue
+            open_positions = tuple(sim.players[c].pos[0] for c in new_lineup if c not in frozen)
+            open_slots = tuple(entry_slots[entry_id][sim.players[c].playerId] for c in lineup if c not in frozen)
+            if fills(open_positions, open_slots):
+                expected.add((entry_id, sim.players[out_col].playerId, sim.players[in_col].playerId))
+    assert swaps == expected
+
+    # Some swaps change position through FLEX; same-position mode finds a strict subset
+    position = {p.playerId: p.pos[0] for p in sim.players}
+    assert any(position[out] != position[inn] for _, out, inn in swaps)
+    same_position = set(LateSwapEvaluator(sim).candidate_swaps(locked))
+    assert same_position < swaps
+    assert all(position[out] == position[inn] for _, out, inn in same_position)
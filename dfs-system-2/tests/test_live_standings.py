@@ -0,0 +1,61 @@
+import asyncio
+import random
+
+import numpy as np
+from src.simulation.live_standings import FileReplayFeed, LiveStandingsTracker, ScoreFenwickTree
+
+
+def make_contest(seed=3, n_players=60, n_entries=10, n_field=400):
+    rng = random.Random(seed)
+    players = [f"p{i}" for i in range(n_players)]
+    entries = {f"e{i}": rng.sample(players, 9) for i in range(n_entries)}
+    field = [rng.sample(players, 9) for _ in range(n_field)]
+    return rng, players, entries, field
+
+
+def brute_force_rank(tracker, entry_id, entries, field, points):
+    score = round(sum(points.get(p, 0.0) for p in entries[entry_id]), 2)
+    others = [round(sum(points.get(p, 0.0) for p in lineup), 2) for lineup in list(entries.values()) + field]
+    return 1 + sum(s > score for s in others)
+
+
+def test_incremental_ranks_match_full_sort():
+    rng, players, entries, field = make_contest()
+    tracker = LiveStandingsTracker(entries, field, payouts=[100, 50, 25] + [5] * 47)
+    points = {}
+
+    for _ in range(300):
+        player = rng.choice(players)
+        points[player] = round(points.get(player, 0.0) + rng.choice([0.1, 0.5, 1, 3.4, 6, -2]), 2)
+        tracker.update_player(player, points[player])
+
+    for entry_id in entries:
+        assert tracker.rank(entry_id) == brute_force_rank(tracker, entry_id, entries, field, points)
+    standings = tracker.standings()
+    assert [s.rank for s in standings] == sorted(s.rank for s in standings)
+    assert all(s.payout == tracker.payout_for_rank(s.rank) for s in standings)
+
+
+def test_fenwick_grows_past_capacity():
+    tree = ScoreFenwickTree(capacity=8)
+    for key in [1, 5, 20, 20, 100]:
+        tree.add(key)
+    assert tree.count_above(5) == 3
+    assert tree.count_at_most(20) == 4
+
+
+def test_file_replay_feed(tmp_path):
+    _, _, entries, field = make_contest(n_field=50)
+    first = entries["e0"]
+    replay = tmp_path / "scoring.csv"
+    replay.write_text("timestamp,player_id,points\n"
+                      f"1,{first[0]},4.5\n1,{first[1]},2.0\n"
+                      f"2,{first[0]},11.5\n")
+    tracker = LiveStandingsTracker(entries, field, payouts=[10])
+    published = []
+
+    asyncio.run(tracker.run(FileReplayFeed(str(replay)), published.append))
+
+    assert len(published) == 2
+    assert tracker.standing("e0").score == 13.5
+    assert np.isclose(tracker.player_points[tracker.player_index[first[0]]], 11.5)
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.optimize.late_swap import LateSwapEntry, LateSwapOptimizer, SwapPlayer, parse_game_start
+from src.optimize.lock_schedule import GameLockIndex, LateSwapLockService
+
+RULES = json.loads((Path(__file__).resolve().parents[1] / "src" / "config" / "rules" / "dk_nfl.json").read_text())
+KICKOFF = datetime(2025, 9, 14, 17, 0, tzinfo=timezone.utc)
+GAMES = {"G1": KICKOFF, "G2": KICKOFF + timedelta(hours=3), "G3": KICKOFF + timedelta(hours=3, minutes=20)}
+
+
+def make_pool():
+    counts = {"QB": 6, "RB": 9, "WR": 12, "TE": 6, "DST": 6}
+    pool = []
+    for pos, count in counts.items():
+        for i in range(count):
+            game_id = f"G{i % 3 + 1}"
+            pool.append(SwapPlayer(f"{pos}{i}", f"{pos} {i}", pos, 4000 + 250 * i, 8.0 + 1.5 * i,
+                                   game_id=game_id, start_time=GAMES[game_id]))
+    return pool
+
+
+def test_lock_index_pops_games_in_start_order():
+    index = GameLockIndex.from_pool(make_pool())
+
+    assert index.next_lock_time() == KICKOFF
+    assert index.advance(KICKOFF - timedelta(minutes=1)) == []
+    events = index.advance(KICKOFF + timedelta(hours=3, minutes=5))
+
+    assert [e.game_id for e in events] == ["G1", "G2"]
+    assert index.next_lock_time() == GAMES["G3"]
+    assert index.locked.sum() == sum(len(e.player_indexes) for e in events)
+
+
+def test_parse_game_start():
+    start = parse_game_start("PHI@KC 09/14/2025 04:25PM ET")
+    assert start.astimezone(timezone.utc) == datetime(2025, 9, 14, 20, 25, tzinfo=timezone.utc)
+
+
+def test_lock_event_reoptimizes_only_affected_entries():
+    pool = make_pool()
+    optimizer = LateSwapOptimizer.from_rules(pool, RULES)
+    base = ["QB0", "RB0", "RB3", "WR0", "WR3", "WR6", "TE0", "RB6", "DST0"]  # all G1
+    late = ["QB1", "RB1", "RB4", "WR1", "WR4", "WR7", "TE1", "RB7", "DST1"]  # all G2
+    entries = [LateSwapEntry("1", "A", player_ids=list(base), locked_slots=set(range(9))),
+               LateSwapEntry("2", "A", player_ids=list(late)),
+               LateSwapEntry("3", "A", player_ids=list(late))]
+    service = LateSwapLockService(optimizer, entries, max_workers=1)
+
+    service.run_initial(KICKOFF + timedelta(minutes=1))
+    before = dict(service.results)
+    # Everything in G2 locks; entries holding G2 players in open slots are re-solved
+    updated = service.poll(GAMES["G2"] + timedelta(minutes=1))
+
+    touched = {r.entry_id for r in updated}
+    assert "1" not in touched and touched
+    assert service.results["1"] is before["1"]
+    g2 = {p.player_id for p in pool if p.game_id == "G2"}
+    for result in updated:
+        entry = next(e for e in service.entries if e.entry_id == result.entry_id)
+        assert all(result.player_ids[s] in g2 for s in entry.locked_slots)
+        assert all(result.player_ids[s] not in g2 for s in result.swapped_slots)
+
+
+def test_run_solves_off_the_event_loop():
+    pool = make_pool()
+    service = LateSwapLockService(LateSwapOptimizer.from_rules(pool, RULES), [], max_workers=1)
+    threads = []
+
+    def run_initial():
+        threads.append(threading.current_thread())
+        # Every game has kicked off: nothing left to wait for
+        service.lock_index.advance(GAMES["G3"])
+        return []
+
+    service.run_initial = run_initial
+    asyncio.run(service.run())
+    assert threads and threads[0] is not threading.main_thread()
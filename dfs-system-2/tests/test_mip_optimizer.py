@@ -0,0 +1,73 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from src.data.schemas import Player, OptimizationConfig, SportType, SiteType
+from src.optimize.mip_solver import MIPOptimizer
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / "src" / "config"
+
+
+def make_nfl_pool():
+    counts = {"QB": 3, "RB": 5, "WR": 7, "TE": 3, "DST": 3}
+    players = []
+    for pos, count in counts.items():
+        for i in range(count):
+            players.append(Player(
+                id=f"{pos.lower()}_{i}",
+                name=f"{pos} Player {i}",
+                position=pos,
+                team=f"T{i % 4}",
+                salary=5000 + 800 * i,
+                dk_position=pos,
+                dk_salary=5000 + 800 * i,
+            ))
+    return players
+
+
+@pytest.fixture
+def optimizer():
+    return MIPOptimizer(SportType.NFL, SiteType.DRAFTKINGS, config_dir=str(CONFIG_DIR))
+
+
+def make_config(**kwargs):
+    return OptimizationConfig(sport=SportType.NFL, site=SiteType.DRAFTKINGS, **kwargs)
+
+
+def test_iter_lineups_respects_num_lineups(optimizer):
+    lineups = list(optimizer.iter_lineups(make_nfl_pool(), make_config(num_lineups=3, max_overlap=0.8)))
+
+    assert 0 < len(lineups) <= 3
+    for lineup in lineups:
+        assert len(lineup.players) == 9
+        assert lineup.total_salary <= 50000
+        assert sorted(p.roster_position for p in lineup.players) == sorted(
+            ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "FLEX", "DST"])
+
+
+def test_time_limit_returns_partial_portfolio(optimizer):
+    config = make_config(num_lineups=500, max_overlap=0.8, time_limit_seconds=0.5, gap_target=0.05)
+
+    lineups = optimizer.optimize_lineups(make_nfl_pool(), config)
+
+    assert 0 < len(lineups) < 500
+
+
+def test_stream_lineups_yields_incrementally(optimizer):
+    config = make_config(num_lineups=2, max_overlap=0.8)
+
+    async def collect():
+        return [lineup async for lineup in optimizer.stream_lineups(make_nfl_pool(), config)]
+
+    lineups = asyncio.run(collect())
+    assert 0 < len(lineups) <= 2
+
+
+def test_players_without_site_fields_use_generic_position_and_salary(optimizer):
+    pool = [player.model_copy(update={"dk_position": None, "dk_salary": None}) for player in make_nfl_pool()]
+
+    lineups = optimizer.optimize_lineups(pool, make_config(num_lineups=1))
+
+    assert len(lineups) == 1
+    assert sorted(p.roster_position for p in lineups[0].players) == sorted(
+        ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "FLEX", "DST"])
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+from service_modules import load_service
+from src.ai.model_store import ModelStore, fit_parallel
+from src.ai.projection_engine import AIProjectionEngine
+from src.data.schemas import SportType
+
+
+def fit_forest(X, y, seed):
+    return RandomForestRegressor(n_estimators=5, random_state=seed).fit(X, y)
+
+
+def history(n=150, seed=3):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({'player_id': [f"p{i}" for i in range(n)],
+                         'salary': rng.integers(3000, 9000, n).astype(float),
+                         'target_share': rng.random(n)})
+    data['actual_points'] = data['salary'] / 500 + 8 * data['target_share'] + rng.normal(0, 1, n)
+    return data
+
+
+def test_parallel_fits_match_in_process_fits():
+    data = history()
+    X, y = data[['salary', 'target_share']].to_numpy(), data['actual_points'].to_numpy()
+    tasks = {'a': (X, y, 0), 'b': (X, y, 1)}
+
+    parallel = fit_parallel(fit_forest, tasks, n_jobs=2)
+    serial = fit_parallel(fit_forest, tasks, n_jobs=1)
+    for name in tasks:
+        assert np.array_equal(parallel[name].predict(X), serial[name].predict(X))
+
+
+def test_store_memory_maps_and_memoizes(tmp_path):
+    data = history()
+    X, y = data[['salary', 'target_share']].to_numpy(), data['actual_points'].to_numpy()
+    store = ModelStore(tmp_path)
+    scaler = StandardScaler().fit(X)
+    store.save('forest', {'scaler': scaler, 'forest': fit_forest(X, y, 0)}, metadata={'rows': len(X)})
+
+    loaded = store.load('forest')
+    assert isinstance(loaded['scaler'].mean_, np.memmap) and not loaded['scaler'].mean_.flags.writeable
+    assert store.load('forest') is loaded
+    assert store.metadata('forest') == {'rows': len(X)}
+    assert np.array_equal(loaded['forest'].predict(loaded['scaler'].transform(X)),
+                          fit_forest(X, y, 0).predict(scaler.transform(X)))
+    assert store.load('missing') is None
+
+
+def test_engine_saves_and_loads_trained_ensemble(tmp_path):
+    engine = AIProjectionEngine(SportType.NFL)
+    engine.models = {'ridge': Ridge(alpha=1.0), 'random_forest': RandomForestRegressor(n_estimators=5, random_state=0)}
+    engine.scalers = {name: StandardScaler() for name in engine.models}
+    data = history()
+    scores = engine.train_models(data)
+    assert set(scores) == {'ridge', 'random_forest'} and all('rmse' in s for s in scores.values())
+    engine.save_models(str(tmp_path))
+
+    restored = AIProjectionEngine(SportType.NFL)
+    assert restored.load_models(str(tmp_path))
+    slate = data.drop(columns='actual_points').head(20)
+    expected = engine._generate_ml_predictions(slate)
+    actual = restored._generate_ml_predictions(slate)
+    for name in engine.models:
+        assert np.allclose(expected[name], actual[name])
+    assert restored.feature_importance.keys() == engine.feature_importance.keys()
+    assert not AIProjectionEngine(SportType.NBA).load_models(str(tmp_path))
+
+
+def test_services_share_the_store():
+    assert load_service('sim.model_store').ModelStore is ModelStore
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from src.ingest.partitioned_store import PartitionedPlayStore
+
+
+def plays(season, weeks, per_week=50, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for week in weeks:
+        frames.append(pd.DataFrame({
+            'game_id': [f"{season}_{week:02d}_{i % 8}" for i in range(per_week)],
+            'season': season,
+            'week': week,
+            'play_type': rng.choice(['pass', 'run'], per_week),
+            'yards_gained': rng.integers(-5, 40, per_week),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_only_open_weeks_are_reprocessed(tmp_path):
+    store = PartitionedPlayStore(tmp_path)
+    assert store.first_open_week(2025) == 1
+
+    assert store.write_weeks(2025, plays(2025, [1, 2, 3])) == [1, 2, 3]
+    # The newest week may still be in progress (Monday night, stat corrections)
+    assert store.first_open_week(2025) == 3
+
+    store.write_weeks(2025, plays(2025, [3, 4], per_week=70, seed=1))
+    assert store.first_open_week(2025) == 4
+    assert store.stored_weeks(2025) == [1, 2, 3, 4]
+
+    reopened = PartitionedPlayStore(tmp_path)
+    assert reopened.manifest['2025']['3'] == {**reopened.manifest['2025']['3'], 'rows': 70, 'final': True}
+
+
+def test_load_prunes_partitions_and_columns(tmp_path):
+    store = PartitionedPlayStore(tmp_path)
+    store.write_weeks(2024, plays(2024, [17, 18]))
+    store.write_weeks(2025, plays(2025, [1, 2, 3]))
+
+    week2 = store.load(seasons=[2025], weeks=[2], columns=['game_id', 'yards_gained', 'week'])
+    expected = plays(2025, [1, 2, 3])
+    expected = expected[expected.week == 2]
+    assert sorted(week2.columns) == ['game_id', 'week', 'yards_gained']
+    assert len(week2) == 50 and set(week2['week']) == {2}
+    assert week2['yards_gained'].tolist() == expected['yards_gained'].tolist()
+
+    everything = store.load()
+    assert len(everything) == 250 and set(everything['season']) == {2024, 2025}
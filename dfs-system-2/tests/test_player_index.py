@@ -0,0 +1,57 @@
+from service_modules import load_service
+
+player_index = load_service('ingest.player_index')
+PlayerIdentityIndex = player_index.PlayerIdentityIndex
+
+
+def test_name_derived_ids_do_not_merge_players_on_different_teams():
+    index = PlayerIdentityIndex(season='test-source-ids')
+    chargers = index.resolve('Mike Williams', 'LAC', 'WR', 'dk_mike_williams')
+    jets = index.resolve('Mike Williams', 'NYJ', 'WR', 'dk_mike_williams')
+
+    assert chargers != jets
+    assert index.resolve('Mike Williams', 'LAC', 'WR', 'dk_mike_williams') == chargers
+    assert index.resolve('Mike Williams', 'NYJ', 'WR', 'dk_mike_williams') == jets
+
+
+def test_sources_resolve_to_one_identity():
+    index = PlayerIdentityIndex(season='test-sources')
+    dk = index.resolve('Patrick Mahomes II', 'KC', 'QB', 'dk_patrick_mahomes')
+    assert index.resolve('Patrick Mahomes', 'KAN', 'QB', 'fn_1234') == dk
+    assert index.resolve('Pat Mahomes', 'KC', 'QB', 'sdi_99') == dk
+    # A source id seen once resolves without a name
+    assert index.resolve('', 'KC', 'QB', 'sdi_99') == dk
+    assert index.resolve('Kansas City Chiefs', 'KC', 'DST') == index.resolve('Chiefs', 'KC', 'D/ST')
+
+
+def test_ambiguous_short_names_do_not_merge():
+    index = PlayerIdentityIndex(season='test-ambiguous')
+    jamaal = index.resolve('Jamaal Williams', 'DET', 'RB')
+    javonte = index.resolve('Javonte Williams', 'DET', 'RB')
+
+    # 'J. Williams' fits both equally well: neither gets it
+    assert index.lookup('J. Williams', 'DET', 'RB') is None
+    assert index.resolve('J. Williams', 'DET', 'RB') not in (jamaal, javonte)
+    assert index.resolve('Jamaal Williams', 'DET', 'RB') == jamaal
+
+
+def test_generational_suffixes_keep_relatives_apart():
+    index = PlayerIdentityIndex(season='test-generations')
+    junior = index.resolve('Odell Beckham Jr.', 'NYG', 'WR', 'dk_1')
+    senior = index.resolve('Odell Beckham Sr.', 'NYG', 'WR', 'dk_2')
+
+    assert junior != senior
+    assert index.resolve('Odell Beckham Jr', 'NYG', 'WR', 'fn_1') == junior
+    assert index.resolve('Odell Beckham Sr', 'NYG', 'WR', 'fn_2') == senior
+    assert index.lookup('Odell Beckham Jr.', 'NYG', 'WR') == junior
+
+
+def test_lookup_uses_the_season_cache():
+    first = PlayerIdentityIndex(season='test-season-cache')
+    mahomes = first.resolve('Patrick Mahomes', 'KC', 'QB')
+    assert first.resolve('Pat Mahomes', 'KC', 'QB') == mahomes
+
+    second = PlayerIdentityIndex(season='test-season-cache')
+    second.resolve('Patrick Mahomes', 'KC', 'QB')
+    second._fuzzy_match = None  # The cached resolution answers without re-matching
+    assert second.lookup('Pat Mahomes', 'KC', 'QB') == mahomes
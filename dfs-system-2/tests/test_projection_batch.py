@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Ridge
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+from src.ai.projection_engine import AIProjectionEngine
+from src.data.schemas import SportType
+
+
+class CountingModel:
+    """Wraps a regressor and counts the rows it is asked to predict"""
+
+    def __init__(self, model):
+        self.model = model
+        self.rows = 0
+
+    def fit(self, X, y):
+        self.model.fit(X, y)
+        return self
+
+    def predict(self, X):
+        self.rows += len(X)
+        return self.model.predict(X)
+
+
+def trained_engine(seed=7):
+    rng = np.random.default_rng(seed)
+    engine = AIProjectionEngine(SportType.NFL)
+    engine.models = {'ridge': CountingModel(Ridge(alpha=1.0)),
+                     'random_forest': CountingModel(RandomForestRegressor(n_estimators=10, random_state=0))}
+    engine.scalers = {name: StandardScaler() for name in engine.models}
+    history = pd.DataFrame({
+        'player_id': [f"p{i}" for i in range(200)],
+        'position': rng.choice(['QB', 'RB', 'WR'], 200),
+        'salary': rng.integers(3000, 9000, 200).astype(float),
+        'target_share': rng.random(200),
+        'snap_share': rng.random(200),
+    })
+    history['actual_points'] = history['salary'] / 500 + 10 * history['target_share'] + rng.normal(0, 1, 200)
+    engine.train_models(history)
+    return engine, history.drop(columns='actual_points')
+
+
+def test_batch_predictions_match_per_row_predictions():
+    engine, players = trained_engine()
+    slate = players.head(25).copy()
+    slate.loc[3, 'snap_share'] = np.nan
+
+    batch = engine._generate_ml_predictions(slate)
+    matrix = slate[['salary', 'target_share', 'snap_share']].fillna(0)
+    for name, model in engine.models.items():
+        expected = [model.model.predict(engine.scalers[name].transform(matrix.iloc[[i]]))[0]
+                    for i in range(len(matrix))]
+        assert np.allclose(batch[name], expected)
+
+    projections = engine.generate_projections(slate, {})
+    assert [p.player_id for p in projections] == slate['player_id'].tolist()
+    assert all(p.ml_projection is not None and p.mean >= 0 for p in projections)
+
+
+def test_unchanged_rows_are_served_from_cache():
+    engine, players = trained_engine()
+    slate = players.head(40).copy()
+    first = engine._generate_ml_predictions(slate)
+    rows = {name: model.rows for name, model in engine.models.items()}
+
+    # Two players change; only they are predicted again
+    slate.loc[[5, 9], 'salary'] += 300
+    second = engine._generate_ml_predictions(slate)
+    for name, model in engine.models.items():
+        assert model.rows - rows[name] == 2
+        unchanged = np.ones(len(slate), dtype=bool)
+        unchanged[[5, 9]] = False
+        assert np.array_equal(first[name][unchanged], second[name][unchanged])
+
+    # Retraining invalidates the cache
+    engine.train_models(players.assign(actual_points=players['salary'] / 400))
+    assert engine._prediction_cache == {}
+
+
+def test_generated_features_keep_the_cache_warm():
+    # Train on the engine's own feature set, placeholder inputs included
+    engine, players = trained_engine()
+    history = engine.create_features(players, {})
+    engine.train_models(history.assign(actual_points=players['salary'] / 500 + 10 * players['target_share']))
+    assert 'weather_impact' in engine.scalers['ridge'].feature_names_in_
+
+    slate = players.head(30).copy()
+    engine.generate_projections(slate, {})
+    rows = {name: model.rows for name, model in engine.models.items()}
+
+    # Same slate again: every row is a cache hit
+    engine.generate_projections(slate, {})
+    assert all(model.rows == rows[name] for name, model in engine.models.items())
+
+    # One salary change re-predicts one player
+    slate.loc[4, 'salary'] += 500
+    engine.generate_projections(slate, {})
+    assert all(model.rows - rows[name] == 1 for name, model in engine.models.items())
@@ -0,0 +1,96 @@
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+from service_modules import load_service
+
+projection_blender = load_service('ingest.projection_blender')
+BlendConfig, ProjectionBlender = projection_blender.BlendConfig, projection_blender.ProjectionBlender
+
+
+def reference_blend(blender, player_id):
+    """One player blended straight from the source dicts, as the per-player loop did"""
+    projections, weights = {}, {}
+    for name, source in blender.sources.items():
+        if player_id not in source.projections:
+            continue
+        weight = blender.config.player_overrides.get(player_id, {}).get(name)
+        if weight is None:
+            weight = source.weight
+        hours_old = (datetime.now() - source.last_updated).total_seconds() / 3600
+        recency = 1.0 + blender.config.recency_bonus * max(0, 1 - hours_old / 24)
+        projections[name] = source.projections[player_id]
+        weights[name] = weight * recency * source.reliability_score / 80.0
+
+    total = sum(weights.values())
+    if len(projections) < blender.config.min_sources or not projections or total == 0:
+        return None
+    values = list(projections.values())
+    confidence = min(100, len(values) * 20)
+    if len(values) > 1 and np.mean(values) > 0:
+        confidence *= max(0.5, 1 - np.std(values) / np.mean(values))
+    return {
+        'blended_projection': sum(projections[name] * weights[name] / total for name in projections),
+        'confidence_score': confidence,
+        'sources_used': len(values),
+        'source_breakdown': {name: weights[name] / total * 100 for name in projections},
+        'standard_deviation': np.std(values),
+        'range': (min(values), max(values)),
+    }
+
+
+def assert_matches_reference(blender):
+    blended = blender.blend_projections()
+    player_ids = {pid for source in blender.sources.values() for pid in source.projections}
+    expected = {pid: reference_blend(blender, pid) for pid in player_ids}
+    assert set(blended) == {pid for pid, result in expected.items() if result is not None}
+
+    for pid, result in blended.items():
+        ref = expected[pid]
+        assert result.blended_projection == pytest.approx(ref['blended_projection'], abs=0.051)
+        assert result.confidence_score == pytest.approx(ref['confidence_score'], abs=0.051)
+        assert result.standard_deviation == pytest.approx(ref['standard_deviation'], abs=0.0051)
+        assert result.sources_used == ref['sources_used'] and result.range == ref['range']
+        assert result.source_breakdown.keys() == ref['source_breakdown'].keys()
+        for name, share in ref['source_breakdown'].items():
+            assert result.source_breakdown[name] == pytest.approx(share, rel=1e-9)
+
+
+def random_source(rng, n_players=60, coverage=0.7):
+    return {f"p{i}": round(rng.uniform(2, 30), 2) for i in range(n_players) if rng.random() < coverage}
+
+
+def test_matrix_blend_matches_per_player_blend_through_updates(tmp_path):
+    rng = random.Random(9)
+    blender = ProjectionBlender(BlendConfig(global_weights={'fantasynerds': 0.5, 'sportsdataio': 0.3,
+                                                            'draftkings': 0.2}, min_sources=2))
+    for name, reliability in (('fantasynerds', 90.0), ('sportsdataio', 70.0), ('draftkings', 80.0)):
+        blender.add_source(name, random_source(rng), reliability_score=reliability)
+    assert_matches_reference(blender)
+
+    # Overrides for a covered player, a player one source lacks and a player nobody has yet
+    blender.set_player_override('p1', {'fantasynerds': 0.9, 'draftkings': 0.0})
+    blender.set_player_override('p2', {'sportsdataio': 1.5, 'unknown_source': 2.0})
+    blender.set_player_override('p75', {'draftkings': 3.0})
+    assert_matches_reference(blender)
+
+    # A source update drops some players and brings in new ones; overrides follow the new column
+    blender.update_source('draftkings', random_source(rng, n_players=80))
+    assert_matches_reference(blender)
+    blender.update_source('sportsdataio', {'p1': 12.0, 'p75': 0.0})
+    assert_matches_reference(blender)
+
+    # Zero total weight drops the player, as before
+    blender.set_player_override('p1', {'sportsdataio': 0.0, 'fantasynerds': 0.0})
+    assert_matches_reference(blender)
+
+    path = tmp_path / 'blend.json'
+    blender.config.player_overrides['p3'] = {'fantasynerds': 4.0}
+    blender.save_blend_config(str(path))
+    blender.config.player_overrides.clear()
+    blender.load_blend_config(str(path))
+    assert_matches_reference(blender)
+
+    blender.config.min_sources = 1
+    assert_matches_reference(blender)
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import time
+
+from aiohttp import web
+from service_modules import load_service
+from src.utils.http_client import HttpClientPool, RetryPolicy
+from src.utils.response_cache import CachedResponse, ResponseCache, parse_cache_control
+
+
+class Upstream:
+    """Test server with an ETag'd JSON body and a request log"""
+
+    def __init__(self, cache_control='max-age=60'):
+        self.cache_control = cache_control
+        self.version = 1
+        self.requests = []
+
+    async def handler(self, request):
+        etag = f'"v{self.version}"'
+        self.requests.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag, 'Cache-Control': self.cache_control})
+        return web.json_response({'version': self.version},
+                                 headers={'ETag': etag, 'Cache-Control': self.cache_control})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/players', self.handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/players"
+
+
+def make_pool(cache):
+    pool = HttpClientPool(cache=cache)
+    pool.register_source('dk', rate_per_second=1000.0, burst=50, retry=RetryPolicy(retries=1))
+    return pool
+
+
+def test_fresh_hits_skip_network_and_304_reuses_body(tmp_path):
+    upstream = Upstream()
+
+    async def run():
+        url = await upstream.start()
+        cache = ResponseCache(tmp_path)
+        pool = make_pool(cache)
+        try:
+            first = await pool.get_cached('dk', url)
+            second = await pool.get_cached('dk', url)
+            assert second.json() is first.json()  # parsed once, served from memory
+            assert len(upstream.requests) == 1
+
+            # Expire it: the next call revalidates with the ETag and keeps the body
+            cache.get(first.key).stored_at -= 3600
+            cache.memory[first.key].stored_at -= 3600
+            third = await pool.get_cached('dk', url)
+            assert upstream.requests[-1] == '"v1"'
+            assert third.json() == {'version': 1} and third.is_fresh()
+        finally:
+            await pool.close()
+            await upstream.runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_disk_store_survives_restart(tmp_path):
+    upstream = Upstream()
+
+    async def run():
+        url = await upstream.start()
+        try:
+            pool = make_pool(ResponseCache(tmp_path))
+            await pool.get_cached('dk', url)
+            await pool.close()
+            pool.cache.close()
+
+            restarted = make_pool(ResponseCache(tmp_path))
+            response = await restarted.get_cached('dk', url)
+            await restarted.close()
+            return response
+        finally:
+            await upstream.runner.cleanup()
+
+    response = asyncio.run(run())
+    assert response.from_cache and response.json() == {'version': 1}
+    assert len(upstream.requests) == 1
+
+
+def test_stale_burst_served_while_one_request_revalidates(tmp_path):
+    upstream = Upstream(cache_control='max-age=0, stale-while-revalidate=120')
+
+    async def run():
+        url = await upstream.start()
+        pool = make_pool(ResponseCache(tmp_path))
+        try:
+            await pool.get_cached('dk', url)
+            upstream.version = 2
+            burst = await asyncio.gather(*(pool.get_cached('dk', url) for _ in range(20)))
+            await asyncio.sleep(0.2)  # let the background revalidation land
+            latest = await pool.get_cached('dk', url)
+            return burst, latest
+        finally:
+            await pool.close()
+            await upstream.runner.cleanup()
+
+    burst, latest = asyncio.run(run())
+    assert all(r.json() == {'version': 1} for r in burst)
+    assert latest.json() == {'version': 2}
+    # Initial fetch, one revalidation for the whole burst, one for the final read
+    assert len(upstream.requests) <= 3
+
+
+def test_disk_store_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=3500, memory_entries=1)
+    for i in range(4):
+        # Incompressible ~1KB bodies so three fit under the byte budget
+        cache.put(CachedResponse(key=f"k{i}", url=f"http://x/{i}", status=200, body=os.urandom(1000),
+                                 etag=f'"{i}"', stored_at=time.time(), max_age=60))
+        time.sleep(0.01)
+        if i == 2:
+            cache.memory.clear()
+            assert cache.get('k0') is not None  # touch k0 so k1 is the oldest
+            time.sleep(0.01)
+
+    assert cache.size_bytes() <= 3500
+    cache.memory.clear()
+    assert cache.get('k1') is None
+    assert all(cache.get(key) is not None for key in ('k0', 'k2', 'k3'))
+
+
+def test_cache_control_directives():
+    assert parse_cache_control('public, max-age=60, stale-while-revalidate="30"') == {
+        'public': None, 'max-age': '60', 'stale-while-revalidate': '30'}
+    entry = CachedResponse.from_headers('k', 'u', 200, b'{}', {'Cache-Control': 'no-store'}, 300, 60)
+    assert not entry.storable
+    entry = CachedResponse.from_headers('k', 'u', 200, b'{}', {'Cache-Control': 'no-cache', 'ETag': '"a"'}, 300, 60)
+    assert entry.storable and not entry.is_fresh() and not entry.is_usable_stale()
+
+
+def test_services_share_the_implementation():
+    assert load_service('ingest.response_cache').ResponseCache is ResponseCache
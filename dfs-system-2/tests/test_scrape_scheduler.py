@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from aiohttp import web
+from src.scraping.scrape_scheduler import HostPolicy, ParseCache, ScrapeJob, ScrapeScheduler
+from src.utils.http_client import HttpClientPool
+
+PARSED = []
+
+
+def parse_rows(content: bytes) -> pd.DataFrame:
+    PARSED.append(content)
+    return pd.DataFrame({'row': content.decode().split(',')})
+
+
+async def start_server(handler):
+    app = web.Application()
+    app.router.add_get('/{page}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+def serve(handler, scenario):
+    """Run scenario(port) against a local server"""
+    async def run():
+        runner, port = await start_server(handler)
+        try:
+            return await scenario(port)
+        finally:
+            await runner.cleanup()
+    return asyncio.run(run())
+
+
+async def timed_run(scheduler, jobs):
+    start = time.monotonic()
+    try:
+        results = await scheduler.run(jobs)
+    finally:
+        await scheduler.pool.close()
+    return results, time.monotonic() - start
+
+
+def test_hosts_run_in_parallel_and_each_host_in_series():
+    active = {}
+    peak = {}
+
+    async def handler(request):
+        host = request.host.split(':')[0]
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.2)
+        active[host] -= 1
+        return web.Response(text=f"{host},{request.match_info['page']}")
+
+    scheduler = ScrapeScheduler(pool=HttpClientPool(), default_policy=HostPolicy(delay=0.0, concurrency=1))
+    results, elapsed = serve(handler, lambda port: timed_run(scheduler, [
+        ScrapeJob(f"{host}-{page}", f"http://{host}:{port}/{page}", parse_rows)
+        for host in ('127.0.0.1', 'localhost') for page in ('a', 'b', 'c')]))
+    scheduler.close()
+
+    # Three 0.2s pages per host, one at a time per host, hosts side by side (parsed in worker processes)
+    assert peak == {'127.0.0.1': 1, 'localhost': 1}
+    assert 0.6 <= elapsed < 1.1
+    assert results['localhost-b']['row'].tolist() == ['localhost', 'b']
+
+
+def test_host_delay_spaces_requests():
+    async def handler(request):
+        return web.Response(text='x')
+
+    async def scenario(port):
+        # Policies are keyed by host (with the port when it is not the default)
+        scheduler = ScrapeScheduler(pool=HttpClientPool(),
+                                    policies={f"127.0.0.1:{port}": HostPolicy(delay=0.15, concurrency=4)},
+                                    default_policy=HostPolicy(delay=0.0, concurrency=4),
+                                    executor=ThreadPoolExecutor(2))
+        return await timed_run(scheduler, [ScrapeJob(f"p{i}", f"http://127.0.0.1:{port}/p{i}", parse_rows)
+                                           for i in range(3)])
+
+    results, elapsed = serve(handler, scenario)
+    assert len(results) == 3 and 0.3 <= elapsed < 1.0
+
+
+def test_unchanged_pages_skip_the_parser(tmp_path):
+    pages = {'a': '1,2', 'b': '3'}
+
+    async def handler(request):
+        page = request.match_info['page']
+        if page not in pages:
+            return web.Response(status=404)
+        return web.Response(text=pages[page])
+
+    def scheduler():
+        return ScrapeScheduler(pool=HttpClientPool(), default_policy=HostPolicy(delay=0.0, concurrency=2),
+                               parse_cache=ParseCache(str(tmp_path)), executor=ThreadPoolExecutor(2))
+
+    async def scenario(port):
+        jobs = [ScrapeJob(page, f"http://127.0.0.1:{port}/{page}", parse_rows) for page in ('a', 'b', 'missing')]
+        first, _ = await timed_run(scheduler(), jobs)
+        assert first['missing'] is None and len(PARSED) == 2
+
+        # A fresh scheduler finds unchanged pages in the on-disk cache; only the changed page is parsed
+        pages['b'] = '3,4'
+        second_scheduler = scheduler()
+        second, _ = await timed_run(second_scheduler, jobs)
+        return second, second_scheduler.parse_cache.hits
+
+    PARSED.clear()
+    second, hits = serve(handler, scenario)
+    assert PARSED[2:] == [b'3,4']
+    assert second['a']['row'].tolist() == ['1', '2'] and second['b']['row'].tolist() == ['3', '4']
+    assert hits == 1
+
+
+def test_run_sync_inside_an_event_loop():
+    async def handler(request):
+        return web.Response(text=request.match_info['page'])
+
+    # The server gets its own loop: run_sync blocks the calling loop until the pass is done
+    server_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+    thread.start()
+    runner, port = asyncio.run_coroutine_threadsafe(start_server(handler), server_loop).result()
+
+    async def caller():
+        # A synchronous ingestor called from async code
+        scheduler = ScrapeScheduler(pool=HttpClientPool(), default_policy=HostPolicy(delay=0.0, concurrency=2),
+                                    executor=ThreadPoolExecutor(2))
+        return scheduler.run_sync([ScrapeJob(page, f"http://127.0.0.1:{port}/{page}", parse_rows)
+                                   for page in ('a', 'b')])
+
+    try:
+        results = asyncio.run(caller())
+    finally:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), server_loop).result()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+        thread.join()
+    assert results['a']['row'].tolist() == ['a'] and results['b']['row'].tolist() == ['b']
@@ -0,0 +1,32 @@
+import pytest
+from src.advanced_optimizer.next_level_features import LineupSimilarityAnalyzer
+
+
+def make_lineup(lineup_id, names):
+    return {"id": lineup_id, "players": [{"name": n} for n in names]}
+
+
+def test_portfolio_similarity_matches_jaccard():
+    lineups = [
+        make_lineup("a", ["p1", "p2", "p3", "p4"]),
+        make_lineup("b", ["p1", "p2", "p3", "p5"]),
+        make_lineup("c", ["p6", "p7", "p8", "p9"]),
+    ]
+    analysis = LineupSimilarityAnalyzer().analyze_portfolio_similarity(lineups, top_k=2)
+
+    assert analysis["similarity_matrix"][0][1] == pytest.approx(3 / 5)
+    assert analysis["max_similarity"] == pytest.approx(0.6)
+    assert analysis["min_similarity"] == 0
+    assert analysis["most_similar_pair"]["lineup1"] == "a"
+    assert analysis["most_similar_pair"]["lineup2"] == "b"
+    assert sorted(analysis["most_similar_pair"]["overlap_players"]) == ["p1", "p2", "p3"]
+    assert len(analysis["least_similar_pairs"]) == 2
+    assert analysis["least_similar_pair"]["similarity"] == 0
+
+
+def test_portfolio_similarity_can_omit_matrix():
+    lineups = [make_lineup(str(i), [f"p{i}", f"p{i + 1}", "core"]) for i in range(20)]
+    analysis = LineupSimilarityAnalyzer().analyze_portfolio_similarity(lineups, include_matrix=False)
+
+    assert "similarity_matrix" not in analysis
+    assert 0 < analysis["avg_similarity"] < 1
@@ -0,0 +1,63 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+from src.data.schemas import ExportConfig, Lineup, LineupPlayer, SiteType, SportType
+from src.io.csv_import_export import CSVExporter
+from src.optimize.slot_assignment import SlotAssigner
+
+RULES_DIR = Path(__file__).resolve().parents[1] / "src" / "config" / "rules"
+
+
+def nba_assigner():
+    return SlotAssigner.from_rules(json.loads((RULES_DIR / "dk_nba.json").read_text()))
+
+
+def test_multi_position_players_need_exact_matching():
+    assigner = nba_assigner()
+    # Greedy fill would put the PG/SG into PG and leave no one for SG
+    positions = ["PG/SG", "PG", "SF", "PF", "C", "SG/SF", "PF/C", "PG"]
+
+    slots = assigner.assign(positions)
+
+    assert sorted(slots) == sorted(assigner.slots)
+    for pos, slot in zip(positions, slots):
+        assert assigner.eligibility_mask(pos) >> assigner.slots.index(slot) & 1
+
+
+def test_infeasible_lineup_returns_none():
+    assert nba_assigner().assign(["C", "C", "C", "PG", "SG", "SF", "PF", "PG"]) is None
+
+
+def test_late_games_go_to_flex_slots():
+    assigner = SlotAssigner.from_rules(json.loads((RULES_DIR / "dk_nfl.json").read_text()))
+    positions = ["QB", "RB", "RB", "RB", "WR", "WR", "WR", "TE", "DST"]
+    early, late = datetime(2024, 9, 8, 13), datetime(2024, 9, 8, 20)
+    start_times = [early, early, early, late, early, early, early, early, early]
+
+    slots = assigner.assign(positions, start_times)
+
+    assert slots[3] == "FLEX"
+
+
+def test_fixed_slots_are_not_reassigned():
+    assigner = SlotAssigner.from_rules(json.loads((RULES_DIR / "dk_nfl.json").read_text()))
+    # A locked RB already fills FLEX: a WR cannot take the open RB slot
+    fixed = ["QB", "RB", "FLEX", "TE", "DST"]
+
+    assert assigner.assign_around(["RB", "WR", "WR", "WR"], fixed) is not None
+    assert assigner.assign_around(["WR", "WR", "WR", "WR"], fixed) is None
+    assert sorted(assigner.assign_around(["WR", "WR", "WR", "WR"], ["QB", "RB", "RB", "TE", "DST"])) == \
+        ["FLEX", "WR", "WR", "WR"]
+
+
+def test_export_keeps_repeated_columns():
+    players = [LineupPlayer(player_id=f"p{i}_x", roster_position=pos, salary=5000, projection=10.0)
+               for i, pos in enumerate(["QB", "RB", "FLEX", "RB", "WR", "WR", "WR", "TE", "DST"])]
+    lineup = Lineup(id="l1", players=players, total_salary=45000, total_projection=90.0)
+    config = ExportConfig(site=SiteType.DRAFTKINGS, sport=SportType.NFL)
+
+    df = CSVExporter()._create_dk_export([lineup], config)
+
+    assert list(df.columns[:9]) == ["QB", "RB", "RB", "WR", "WR", "WR", "TE", "FLEX", "DST"]
+    assert (df.iloc[0, :9] != "").all()
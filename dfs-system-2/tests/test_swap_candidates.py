@@ -0,0 +1,75 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from src.optimize.live_data_optimizer import LiveDataOptimizer, Lineup, Player
+from src.optimize.swap_candidates import SwapCandidateIndex, fit_score
+
+
+def make_player(name, position, salary, projection, ownership=10.0, banned=False):
+    return Player(id=name, name=name, position=position, team="AAA", salary=salary,
+                  projection=projection, ownership=ownership, leverage_score=1.0, boom_pct=20,
+                  floor=projection * 0.7, ceiling=projection * 1.4, correlation_score=0.5,
+                  volatility=0.2, sources_count=1, banned=banned)
+
+
+def random_pool(n=200, seed=7):
+    rng = random.Random(seed)
+    return [make_player(f"P{i}", rng.choice(["QB", "RB", "WR", "TE"]), rng.randrange(3000, 9001, 100),
+                        rng.uniform(4, 28), rng.uniform(1, 40), banned=rng.random() < 0.05)
+            for i in range(n)]
+
+
+def brute_force(pool, position, max_salary, exclude):
+    eligible = [p for p in pool if p.position == position and not p.banned
+                and p.salary <= max_salary and p.name not in exclude]
+    return sorted(eligible, key=lambda p: -fit_score(p.projection, p.salary, p.ownership))
+
+
+def test_candidates_match_full_scan():
+    pool = random_pool()
+    index = SwapCandidateIndex(pool)
+    exclude = {"P1", "P2", "P3", "P10"}
+
+    for position in ["QB", "RB", "WR", "TE"]:
+        for max_salary in [2500, 4000, 6500, 9000]:
+            expected = brute_force(pool, position, max_salary, exclude)
+            got = [p for p, _ in index.candidates(position, max_salary, exclude)]
+            assert [p.name for p in got] == [p.name for p in expected]
+            best = max((p.projection for p in expected + [p for p in pool if p.name in exclude
+                        and p.position == position and not p.banned and p.salary <= max_salary]),
+                       default=float("-inf"))
+            assert index.best_projection(position, max_salary) == best
+
+
+def test_find_swap_candidates_does_not_mutate_players():
+    optimizer = LiveDataOptimizer()
+    optimizer.players = random_pool()
+    current = next(p for p in optimizer.players if p.position == "RB")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: optimizer._find_swap_candidates(current, [current], 7000),
+                                    range(8)))
+
+    assert all(r == results[0] for r in results)
+    assert current not in results[0]
+    assert all(p.salary <= 7000 for p in results[0])
+    assert not any(hasattr(p, "fit_score") for p in optimizer.players)
+
+
+def test_late_swaps_respect_salary_cap_and_locks():
+    optimizer = LiveDataOptimizer()
+    pool = random_pool(300)
+    optimizer.players = pool
+    by_pos = {pos: [p for p in pool if p.position == pos and not p.banned] for pos in ["QB", "RB", "WR", "TE"]}
+    lineup_players = by_pos["QB"][:1] + by_pos["RB"][:2] + by_pos["WR"][:3] + by_pos["TE"][:1]
+    lineup = Lineup(players=lineup_players, total_salary=sum(p.salary for p in lineup_players),
+                    total_projection=0.0, expected_roi=0.0, win_rate=0.0, sharpe_ratio=0.0,
+                    kelly_percent=0.0, diversity_score=0.0, correlation_risk=0.0, strategy="ev")
+    locked = [by_pos["RB"][5].name]
+
+    swaps = optimizer.calculate_late_swaps([lineup], locked)
+
+    total = sum(p.salary for p in lineup_players)
+    for swap in swaps:
+        assert swap["replacement_player"] not in locked
+        assert total + swap["salary_diff"] <= optimizer.salary_cap
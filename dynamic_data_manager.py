@@ -5,12 +5,63 @@ Creates updateable files/database for player pools, slates, projections
 Everything syncs automatically to updateable JSON/CSV files
 """
 
+import asyncio
+import hashlib
 import json
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 import requests
 import os
+import sys
+import threading
+import time
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class SyncTask:
+    """One data source synced to one file on its own cadence"""
+    name: str
+    file_key: str
+    fetch: Callable[[], Any]
+    interval_minutes: float = 15
+    depends_on: Tuple[str, ...] = ()  # Re-synced whenever one of these changes
+    unit: str = 'records'
+
+
+def _without_timestamps(data: Any) -> Any:
+    """Data minus 'last_updated' stamps, which change on every sync even when nothing else does"""
+    if isinstance(data, dict):
+        return {k: _without_timestamps(v) for k, v in data.items() if k != 'last_updated'}
+    if isinstance(data, list):
+        return [_without_timestamps(v) for v in data]
+    return data
+
+
+def content_hash(data: Any) -> str:
+    return hashlib.sha256(
+        json.dumps(_without_timestamps(data), sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def run_blocking(coro) -> Any:
+    """asyncio.run(coro), on a worker thread when the caller is already inside an event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def write_json_atomic(path: Path, data: Any, **dump_kwargs):
+    """Write to a temp file and rename over the target so readers never see a partial file"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, **dump_kwargs)
+    os.replace(tmp_path, path)
 
 class DynamicDataManager:
     """Manages all data through updateable files - no hardcoding"""
@@ -31,78 +82,86 @@ class DynamicDataManager:
             'sync_log': self.data_dir / 'sync_log.json'
         }
         
+        # Sync DAG: the pool follows contests, projections follow the pool
+        self.tasks = {task.name: task for task in [
+            SyncTask('draftkings_contests', 'contests', self._sync_draftkings_contests, unit='contests'),
+            SyncTask('player_pool', 'player_pool', self._sync_player_pool,
+                     depends_on=('draftkings_contests',), unit='players'),
+            SyncTask('projections', 'projections', self._sync_projections,
+                     depends_on=('player_pool',), unit='player projections'),
+            SyncTask('ownership', 'ownership', self._sync_ownership, unit='players'),
+            SyncTask('injury_news', 'news', self._sync_injury_news, interval_minutes=5, unit='updates'),
+        ]}
+        
+        # Per-task content hash and last run, carried over from the previous sync log
+        self.task_state: Dict[str, Dict[str, Any]] = self._load_task_state()
+        self._data: Dict[str, Any] = {}
+        self._loaded: Dict[str, Tuple[int, Any]] = {}  # file key -> (mtime_ns, parsed file)
+        
+    def _load_task_state(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.files['sync_log'], 'r') as f:
+                return json.load(f).get('tasks', {})
+        except (OSError, ValueError):
+            return {}
+    
     def sync_all_data_sources(self):
         """Sync ALL data sources to updateable files"""
         print("🔄 SYNCING ALL DATA SOURCES TO UPDATEABLE FILES...")
-        
+        return run_blocking(self.sync_due_sources(force=True))
+    
+    async def sync_due_sources(self, force: bool = False) -> Dict[str, Any]:
+        """Run every task that is due (or all with force) concurrently, each after its dependencies"""
         sync_results = {
             'timestamp': datetime.now().isoformat(),
             'synced_sources': [],
             'failed_sources': [],
             'total_players': 0,
-            'total_contests': 0
+            'total_contests': 0,
+            'tasks': self.task_state
         }
+        now = time.time()
+        outcomes: Dict[str, asyncio.Future] = {}
         
-        # Sync DraftKings contests and player data
-        try:
-            contests_data = self._sync_draftkings_contests()
-            with open(self.files['contests'], 'w') as f:
-                json.dump(contests_data, f, indent=2)
-            sync_results['synced_sources'].append('draftkings_contests')
-            sync_results['total_contests'] = len(contests_data)
-            print(f"✅ DraftKings contests synced: {len(contests_data)} contests")
-        except Exception as e:
-            sync_results['failed_sources'].append(f'draftkings_contests: {str(e)}')
-            print(f"❌ DraftKings contests sync failed: {e}")
-        
-        # Sync player pool
-        try:
-            player_data = self._sync_player_pool()
-            with open(self.files['player_pool'], 'w') as f:
-                json.dump(player_data, f, indent=2)
-            sync_results['synced_sources'].append('player_pool')
-            sync_results['total_players'] = len(player_data)
-            print(f"✅ Player pool synced: {len(player_data)} players")
-        except Exception as e:
-            sync_results['failed_sources'].append(f'player_pool: {str(e)}')
-            print(f"❌ Player pool sync failed: {e}")
-        
-        # Sync projections
-        try:
-            projections_data = self._sync_projections()
-            with open(self.files['projections'], 'w') as f:
-                json.dump(projections_data, f, indent=2)
-            sync_results['synced_sources'].append('projections')
-            print(f"✅ Projections synced: {len(projections_data)} player projections")
-        except Exception as e:
-            sync_results['failed_sources'].append(f'projections: {str(e)}')
-            print(f"❌ Projections sync failed: {e}")
+        async def run(task: SyncTask) -> str:
+            upstream = [await outcomes[name] for name in task.depends_on]
+            state = self.task_state.setdefault(task.name, {})
+            due = force or 'changed' in upstream or \
+                now - state.get('last_run', 0) >= task.interval_minutes * 60
+            if not due:
+                return 'skipped'
+            
+            started = time.perf_counter()
+            try:
+                data = await asyncio.to_thread(task.fetch)
+                changed = await asyncio.to_thread(self._write_if_changed, task, data)
+            except Exception as e:
+                state.update(status='failed', error=str(e), seconds=round(time.perf_counter() - started, 3),
+                             last_run=now)
+                sync_results['failed_sources'].append(f'{task.name}: {str(e)}')
+                print(f"❌ {task.name} sync failed: {e}")
+                return 'failed'
+            
+            self._data[task.name] = data
+            state.update(status='changed' if changed else 'unchanged', error=None,
+                         seconds=round(time.perf_counter() - started, 3), last_run=now)
+            sync_results['synced_sources'].append(task.name)
+            print(f"✅ {task.name} synced: {len(data)} {task.unit}"
+                  f"{'' if changed else ' (unchanged, not rewritten)'} in {state['seconds']:.2f}s")
+            return state['status']
         
-        # Sync ownership data
-        try:
-            ownership_data = self._sync_ownership()
-            with open(self.files['ownership'], 'w') as f:
-                json.dump(ownership_data, f, indent=2)
-            sync_results['synced_sources'].append('ownership')
-            print(f"✅ Ownership data synced: {len(ownership_data)} players")
-        except Exception as e:
-            sync_results['failed_sources'].append(f'ownership: {str(e)}')
-            print(f"❌ Ownership sync failed: {e}")
+        # Tasks start on the next loop turn, after every outcome future exists
+        for task in self.tasks.values():
+            outcomes[task.name] = asyncio.ensure_future(run(task))
+        statuses = await asyncio.gather(*outcomes.values())
+        if all(status == 'skipped' for status in statuses):
+            return sync_results
         
-        # Sync injury/news data
-        try:
-            news_data = self._sync_injury_news()
-            with open(self.files['news'], 'w') as f:
-                json.dump(news_data, f, indent=2)
-            sync_results['synced_sources'].append('injury_news')
-            print(f"✅ Injury news synced: {len(news_data)} updates")
-        except Exception as e:
-            sync_results['failed_sources'].append(f'injury_news: {str(e)}')
-            print(f"❌ Injury news sync failed: {e}")
+        sync_results['total_players'] = len(self._data.get('player_pool', []))
+        sync_results['total_contests'] = len(self._data.get('draftkings_contests', []))
         
         # Save sync log
-        with open(self.files['sync_log'], 'w') as f:
-            json.dump(sync_results, f, indent=2)
+        write_json_atomic(self.files['sync_log'], sync_results, indent=2)
         
         print(f"\n📊 SYNC COMPLETE:")
         print(f"   ✅ Synced: {len(sync_results['synced_sources'])} sources")
@@ -112,6 +171,18 @@ class DynamicDataManager:
         
         return sync_results
     
+    def _write_if_changed(self, task: SyncTask, data: Any) -> bool:
+        """Atomically rewrite the task's file only when its content (timestamps aside) changed"""
+        digest = content_hash(data)
+        state = self.task_state.setdefault(task.name, {})
+        path = self.files[task.file_key]
+        if state.get('hash') == digest and path.exists():
+            return False
+        write_json_atomic(path, data, separators=(',', ':'))
+        state['hash'] = digest
+        self._loaded.pop(task.file_key, None)
+        return True
+    
     def _sync_draftkings_contests(self):
         """Sync DraftKings contests to updateable file"""
         # Use working GitHub API approach
@@ -269,11 +340,21 @@ class DynamicDataManager:
             'updates': []  # Will be populated by live news feeds
         }
     
+    def _load_file(self, file_key: str) -> Any:
+        """Parsed file, re-read only when it has been rewritten (treat as read-only)"""
+        mtime = self.files[file_key].stat().st_mtime_ns
+        cached = self._loaded.get(file_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(self.files[file_key], 'r') as f:
+            data = json.load(f)
+        self._loaded[file_key] = (mtime, data)
+        return data
+    
     def load_current_player_pool(self):
         """Load current player pool from updateable file"""
         try:
-            with open(self.files['player_pool'], 'r') as f:
-                return json.load(f)
+            return self._load_file('player_pool')
         except FileNotFoundError:
             print("⚠️ No current player pool - running sync...")
             self.sync_all_data_sources()
@@ -282,8 +363,7 @@ class DynamicDataManager:
     def load_current_projections(self):
         """Load current projections from updateable file"""
         try:
-            with open(self.files['projections'], 'r') as f:
-                return json.load(f)
+            return self._load_file('projections')
         except FileNotFoundError:
             print("⚠️ No current projections - running sync...")
             self.sync_all_data_sources()
@@ -292,32 +372,31 @@ class DynamicDataManager:
     def load_available_contests(self):
         """Load available contests from updateable file"""
         try:
-            with open(self.files['contests'], 'r') as f:
-                return json.load(f)
+            return self._load_file('contests')
         except FileNotFoundError:
             print("⚠️ No current contests - running sync...")
             self.sync_all_data_sources()
             return self.load_available_contests()
     
-    def auto_sync_scheduler(self, interval_minutes=15):
-        """Schedule automatic syncing every X minutes"""
-        import threading
-        import time
-        
-        def sync_worker():
-            while True:
-                try:
-                    print(f"🔄 Auto-sync running...")
-                    self.sync_all_data_sources()
-                    print(f"✅ Auto-sync complete - next sync in {interval_minutes} minutes")
-                except Exception as e:
-                    print(f"❌ Auto-sync error: {e}")
-                
-                time.sleep(interval_minutes * 60)
+    async def run_sync_loop(self, tick_seconds: float = 30):
+        """Sync whatever is due every tick, forever"""
+        while True:
+            try:
+                await self.sync_due_sources()
+            except Exception as e:
+                print(f"❌ Auto-sync error: {e}")
+            await asyncio.sleep(tick_seconds)
+    
+    def auto_sync_scheduler(self, interval_minutes: Optional[float] = None, tick_seconds: float = 30):
+        """Run the sync DAG in the background; interval_minutes overrides every task's cadence"""
+        if interval_minutes is not None:
+            for task in self.tasks.values():
+                task.interval_minutes = interval_minutes
         
-        sync_thread = threading.Thread(target=sync_worker, daemon=True)
+        sync_thread = threading.Thread(target=asyncio.run, args=(self.run_sync_loop(tick_seconds),), daemon=True)
         sync_thread.start()
-        print(f"🔄 Auto-sync scheduled every {interval_minutes} minutes")
+        cadences = ', '.join(f"{task.name} {task.interval_minutes:g}m" for task in self.tasks.values())
+        print(f"🔄 Auto-sync scheduled: {cadences}")
         return sync_thread
 
 def main():
@@ -331,8 +410,8 @@ def main():
     # Initial sync
     sync_results = manager.sync_all_data_sources()
     
-    # Start auto-sync
-    manager.auto_sync_scheduler(interval_minutes=15)
+    # Start auto-sync (each source on its own cadence)
+    manager.auto_sync_scheduler()
     
     print(f"\n💾 UPDATEABLE FILES CREATED:")
     for file_type, file_path in manager.files.items():
@@ -340,7 +419,7 @@ def main():
         print(f"   {exists} {file_type}: {file_path}")
     
     print(f"\n🔄 DYNAMIC SYSTEM FEATURES:")
-    print("   • Player pools update automatically every 15 minutes")
+    print("   • Each source syncs on its own cadence; unchanged data is never rewritten")
     print("   • Slates/contests sync from live DraftKings API")
     print("   • Projections update from RotoWire integration")
     print("   • All data stored in updateable JSON files")
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import time
+
+import pytest
+from dynamic_data_manager import DynamicDataManager
+
+
+class Source:
+    """Stand-in fetch that records when it ran"""
+
+    def __init__(self, name, log, data, delay=0.0):
+        self.name, self.log, self.data, self.delay = name, log, data, delay
+
+    def __call__(self):
+        start = time.monotonic()
+        time.sleep(self.delay)
+        self.log.append((self.name, start, time.monotonic()))
+        return self.data
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = DynamicDataManager()
+    manager.log = []
+    manager.sources = {
+        'draftkings_contests': Source('draftkings_contests', manager.log, [{'id': '1'}], delay=0.1),
+        'player_pool': Source('player_pool', manager.log, [{'id': 'p1', 'salary': 5000}], delay=0.05),
+        'projections': Source('projections', manager.log, {'players': {'p1': 12.5}}),
+        'ownership': Source('ownership', manager.log, {'players': {}}),
+        'injury_news': Source('injury_news', manager.log, {'updates': []}),
+    }
+    for name, task in manager.tasks.items():
+        task.fetch = manager.sources[name]
+    return manager
+
+
+def ran(manager):
+    names = [name for name, _, _ in manager.log]
+    manager.log.clear()
+    return names
+
+
+def test_tasks_wait_for_their_dependencies(manager):
+    results = manager.sync_all_data_sources()
+
+    times = {name: (start, end) for name, start, end in manager.log}
+    assert times['draftkings_contests'][1] <= times['player_pool'][0]
+    assert times['player_pool'][1] <= times['projections'][0]
+    # Independent sources do not wait for the chain
+    assert times['ownership'][0] < times['draftkings_contests'][1]
+    assert sorted(results['synced_sources']) == sorted(manager.tasks)
+    assert json.loads(manager.files['player_pool'].read_text()) == [{'id': 'p1', 'salary': 5000}]
+
+
+def test_upstream_change_reruns_dependents(manager):
+    manager.sync_all_data_sources()
+    ran(manager)
+
+    # Nothing is due: the pass writes nothing, not even the sync log
+    log_mtime = manager.files['sync_log'].stat().st_mtime_ns
+    asyncio.run(manager.sync_due_sources())
+    assert ran(manager) == [] and manager.files['sync_log'].stat().st_mtime_ns == log_mtime
+
+    # Contests are due but unchanged: their dependents stay put
+    manager.task_state['draftkings_contests']['last_run'] = 0
+    asyncio.run(manager.sync_due_sources())
+    assert ran(manager) == ['draftkings_contests']
+
+    # Contests changed: the pool re-syncs, and projections follow only if the pool changed
+    manager.sources['draftkings_contests'].data = [{'id': '1'}, {'id': '2'}]
+    manager.task_state['draftkings_contests']['last_run'] = 0
+    asyncio.run(manager.sync_due_sources())
+    assert ran(manager) == ['draftkings_contests', 'player_pool']
+
+    manager.sources['draftkings_contests'].data = [{'id': '3'}]
+    manager.sources['player_pool'].data = [{'id': 'p2', 'salary': 6100}]
+    manager.task_state['draftkings_contests']['last_run'] = 0
+    asyncio.run(manager.sync_due_sources())
+    assert ran(manager) == ['draftkings_contests', 'player_pool', 'projections']
+
+
+def test_unchanged_content_is_not_rewritten(manager):
+    manager.sync_all_data_sources()
+    path = manager.files['projections']
+    mtime = path.stat().st_mtime_ns
+    pool = manager.load_current_player_pool()
+
+    # Only the timestamp differs: same content, file left alone
+    manager.sources['projections'].data = {'players': {'p1': 12.5}, 'last_updated': '2026-10-18T12:00:00'}
+    manager.sync_all_data_sources()
+    assert path.stat().st_mtime_ns == mtime
+    assert manager.task_state['projections']['status'] == 'unchanged'
+    assert manager.load_current_player_pool() is pool
+
+    manager.sources['projections'].data = {'players': {'p1': 14.0}}
+    manager.sync_all_data_sources()
+    assert json.loads(path.read_text()) == {'players': {'p1': 14.0}}
+    assert manager.task_state['projections']['status'] == 'changed'
+
+    # State survives a restart through the sync log
+    assert DynamicDataManager().task_state['projections']['hash'] == manager.task_state['projections']['hash']
+
+
+def test_sync_from_inside_an_event_loop(manager):
+    async def handler():
+        return manager.sync_all_data_sources()
+
+    results = asyncio.run(handler())
+    assert sorted(results['synced_sources']) == sorted(manager.tasks)